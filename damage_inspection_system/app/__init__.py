@@ -1,30 +1,61 @@
 from flask import Flask
-from app.extensions import db, migrate, jwt, bcrypt
-from app.config import Config
+from app.extensions import db, jwt, bcrypt
+from app.config import Config, resolve_instance_paths
+from app.auth.api_keys import init_api_keys
+from app.auth.lockout import init_login_lockout
+from app.auth.revocation import init_token_revocation
+from app.core.cli import init_cli
+from app.core.health import init_health
 from app.core.logger import setup_logger
+from app.core.profiling import init_profiler
+from app.core.rate_limit import init_rate_limiter
+from app.core.routing import init_replicas
+from app.core.sharding import init_shards
+from app.core.tracing import init_tracing
+from app.core.slow_queries import init_slow_query_log
+from app.core.storage import init_storage
 
 def create_app(config=None):
     app = Flask(__name__)
+    app.config.from_object(Config)
     if config:
-        # Use provided config (for testing)
+        # Override defaults with provided config (for testing)
         app.config.update(config)
-    else:
-        app.config.from_object(Config)
+    resolve_instance_paths(app)
     
     # Setup logging
-    setup_logger()
+    setup_logger(app.config)
     
     # Initialize extensions
+    init_replicas(app)
+    init_shards(app)
     db.init_app(app)
-    migrate.init_app(app, db)
+    init_slow_query_log(app)
+    init_profiler(app)
+    init_tracing(app)
+    init_health(app)
+    init_rate_limiter(app)
+    init_login_lockout(app)
+    init_token_revocation(app)
+    init_api_keys(app)
+    init_storage(app)
     jwt.init_app(app)
     bcrypt.init_app(app)
     
    # Register blueprints
     from app.auth.routes import auth_bp
     from app.inspections.routes import inspections_bp
+    from app.admin.routes import admin_bp
+    from app.health.routes import health_bp
+    from app.uploads.routes import uploads_bp
     app.register_blueprint(auth_bp)
     app.register_blueprint(inspections_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(uploads_bp)
+    
+    # Register CLI commands (imported on first use, with Flask-Migrate's `db`)
+    init_cli(app)
     
     # Import models to ensure they're registered with SQLAlchemy
     from app.users.models import User
@@ -0,0 +1,78 @@
+from flask import Blueprint, Response, current_app, request, jsonify
+from app.auth.utils import admin_required
+from app.core.logger import log_request
+import logging
+
+logger = logging.getLogger(__name__)
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+@admin_bp.route('/slow-queries', methods=['GET'])
+@admin_required
+@log_request
+def get_slow_queries():
+    """Most recent slow queries, newest first"""
+    slow_query_log = current_app.extensions.get('slow_query_log')
+    if slow_query_log is None:
+        return jsonify({'error': 'Slow query log is disabled'}), 404
+    
+    limit = request.args.get('limit', type=int)
+    entries = slow_query_log.entries(limit)
+    return jsonify({
+        'threshold_ms': slow_query_log.threshold * 1000,
+        'explain': slow_query_log.explain,
+        'slow_queries': entries,
+        'count': len(entries)
+    }), 200
+
+@admin_bp.route('/slow-queries', methods=['DELETE'])
+@admin_required
+@log_request
+def clear_slow_queries():
+    """Empty the slow query ring buffer"""
+    slow_query_log = current_app.extensions.get('slow_query_log')
+    if slow_query_log is None:
+        return jsonify({'error': 'Slow query log is disabled'}), 404
+    
+    slow_query_log.clear()
+    return jsonify({'message': 'Slow query log cleared'}), 200
+
+@admin_bp.route('/profiles', methods=['GET'])
+@admin_required
+@log_request
+def get_profiles():
+    """Profiled requests and samples per endpoint"""
+    profiler = current_app.extensions.get('profiler')
+    if profiler is None:
+        return jsonify({'error': 'Profiler is disabled'}), 404
+    
+    return jsonify({'profiles': profiler.summary()}), 200
+
+@admin_bp.route('/profiles/<path:endpoint>', methods=['GET'])
+@admin_required
+@log_request
+def download_profile(endpoint):
+    """Collapsed stacks of an endpoint, ready for flamegraph.pl or speedscope"""
+    profiler = current_app.extensions.get('profiler')
+    if profiler is None:
+        return jsonify({'error': 'Profiler is disabled'}), 404
+    
+    collapsed = profiler.collapsed(endpoint)
+    if collapsed is None:
+        return jsonify({'error': 'No profile for this endpoint'}), 404
+    
+    filename = endpoint.strip('/').replace('/', '_') or 'root'
+    return Response(collapsed, mimetype='text/plain',
+                    headers={'Content-Disposition': f'attachment; filename={filename}.collapsed'})
+
+@admin_bp.route('/profiles', methods=['DELETE'])
+@admin_required
+@log_request
+def clear_profiles():
+    """Drop all collected profiles"""
+    profiler = current_app.extensions.get('profiler')
+    if profiler is None:
+        return jsonify({'error': 'Profiler is disabled'}), 404
+    
+    profiler.clear()
+    return jsonify({'message': 'Profiles cleared'}), 200
\ No newline at end of file
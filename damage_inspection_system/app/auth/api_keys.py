@@ -0,0 +1,139 @@
+from app.auth.models import ApiKey
+from app.extensions import db
+from flask import current_app, g, jsonify, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from functools import wraps
+from sqlalchemy import select
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+API_KEY_HEADER = 'X-API-Key'
+# Keys look like "dis_<prefix>_<secret>"; the prefix is stored in clear to find the row
+KEY_MARKER = 'dis'
+
+
+class ApiKeyVerifier:
+    """Hashes API keys and remembers recently verified ones.
+    
+    Keys are hashed with HMAC-SHA256 under ``secret`` (microseconds, unlike
+    bcrypt: the keys are 256-bit random, so a slow hash adds nothing). A
+    verified key is cached by its hash for ``cache_seconds``, so a busy
+    machine client costs one indexed lookup per worker and TTL; a deleted key
+    is dropped from this worker's cache at once and from the others' within
+    the TTL.
+    """
+    
+    def __init__(self, secret, cache_seconds=60.0, cache_size=10000, clock=time.monotonic):
+        self._secret = secret.encode('utf-8')
+        self.cache_seconds = cache_seconds
+        self.cache_size = cache_size
+        self.clock = clock
+        # key hash -> (user_id, scopes, expires_at)
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    def hash(self, key):
+        return hmac.new(self._secret, key.encode('utf-8'), hashlib.sha256).hexdigest()
+    
+    def generate(self):
+        """New ``(key, prefix, key_hash)``; only the hash and prefix are stored"""
+        prefix = secrets.token_hex(6)
+        key = f'{KEY_MARKER}_{prefix}_{secrets.token_urlsafe(32)}'
+        return key, prefix, self.hash(key)
+    
+    def verify(self, key):
+        """``(user_id, scopes)`` of a valid key, None otherwise"""
+        key_hash = self.hash(key)
+        now = self.clock()
+        cached = self._cache.get(key_hash)
+        if cached is not None and cached[2] > now:
+            return cached[0], cached[1]
+        
+        marker, _, rest = key.partition('_')
+        prefix = rest.partition('_')[0]
+        if marker != KEY_MARKER or not prefix:
+            return None
+        row = db.session.execute(
+            select(ApiKey.user_id, ApiKey.scopes, ApiKey.key_hash).where(ApiKey.prefix == prefix)
+        ).first()
+        if row is None or not hmac.compare_digest(row.key_hash, key_hash):
+            return None
+        
+        user_id, scopes = row.user_id, frozenset(row.scopes.split())
+        with self._lock:
+            if len(self._cache) >= self.cache_size:
+                self._evict(now)
+            self._cache[key_hash] = (user_id, scopes, now + self.cache_seconds)
+        return user_id, scopes
+    
+    def forget(self, key_hash):
+        with self._lock:
+            self._cache.pop(key_hash, None)
+    
+    def _evict(self, now):
+        self._cache = {key_hash: entry for key_hash, entry in self._cache.items() if entry[2] > now}
+        for key_hash in list(self._cache)[:max(len(self._cache) - self.cache_size + 1, 0)]:
+            del self._cache[key_hash]
+
+
+def _authenticate(scope):
+    """Set ``g.current_user_id`` from the API key or JWT; returns an error response or None"""
+    key = request.headers.get(API_KEY_HEADER)
+    if key is None:
+        verify_jwt_in_request()
+        g.current_user_id = get_jwt_identity()
+        return None
+    
+    verifier = current_app.extensions.get('api_keys')
+    verified = verifier.verify(key) if verifier is not None else None
+    if verified is None:
+        logger.warning("Request with an invalid API key")
+        return jsonify({'error': 'Invalid API key'}), 401
+    
+    user_id, scopes = verified
+    if scope is not None and scope not in scopes:
+        logger.warning(f"API key of user {user_id} lacks scope {scope}")
+        return jsonify({'error': f'API key lacks scope {scope}'}), 403
+    g.current_user_id = user_id
+    return None
+
+
+def auth_required(scope=None):
+    """Decorator accepting an ``X-API-Key`` with ``scope`` or a JWT access token.
+    
+    The user is available from ``get_current_user_id()`` either way.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            refused = _authenticate(scope)
+            if refused is not None:
+                return refused
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def init_api_keys(app):
+    if not app.config['API_KEYS_ENABLED']:
+        app.extensions['api_keys'] = None
+        return
+    
+    # A dedicated secret, so rotating SECRET_KEY or JWT_SECRET_KEY does not
+    # invalidate every stored key hash
+    if not app.config['API_KEY_SECRET']:
+        logger.error("API keys disabled: API_KEY_SECRET is not set")
+        app.extensions['api_keys'] = None
+        return
+    
+    app.extensions['api_keys'] = ApiKeyVerifier(
+        app.config['API_KEY_SECRET'],
+        cache_seconds=app.config['API_KEY_CACHE_SECONDS'],
+        cache_size=app.config['API_KEY_CACHE_SIZE']
+    )
\ No newline at end of file
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+import threading
+import time
+
+
+class LoginLockout:
+    """Failed login counter per username with exponential lockout.
+    
+    After ``threshold`` consecutive failures a username is locked for
+    ``base_seconds``, doubling with every further failure up to
+    ``max_seconds``. Failures are forgotten ``window_seconds`` after the
+    last one (or when the lock ends, if later) and on a successful login.
+    At most ``max_entries`` usernames are tracked: expired entries go
+    first, then the least recently failed.
+    """
+    
+    def __init__(self, threshold=5, base_seconds=30, max_seconds=900, window_seconds=900,
+                 max_entries=100000, clock=time.monotonic):
+        self.threshold = threshold
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        # username -> (failures, locked_until, expires_at)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def locked_for(self, username):
+        """Seconds until ``username`` may try again, 0 when it is not locked"""
+        entry = self._entries.get(username)
+        if entry is None:
+            return 0
+        return max(entry[1] - self.clock(), 0)
+    
+    def record_failure(self, username):
+        """Count a failed login; returns the lock duration it started, or 0"""
+        with self._lock:
+            now = self.clock()
+            entry = self._entries.pop(username, None)
+            failures = entry[0] + 1 if entry is not None and entry[2] > now else 1
+            
+            lock_seconds = 0
+            if failures >= self.threshold:
+                lock_seconds = min(self.base_seconds * 2 ** (failures - self.threshold), self.max_seconds)
+            locked_until = now + lock_seconds
+            
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+            self._entries[username] = (failures, locked_until, max(now + self.window_seconds, locked_until))
+            return lock_seconds
+    
+    def reset(self, username):
+        with self._lock:
+            self._entries.pop(username, None)
+    
+    def _evict(self, now):
+        for username in [username for username, entry in self._entries.items() if entry[2] <= now]:
+            del self._entries[username]
+        # Evict down to 90% so a full table is not trimmed again on every failure
+        while len(self._entries) > self.max_entries * 9 // 10:
+            self._entries.popitem(last=False)
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+def init_login_lockout(app):
+    if not app.config['LOGIN_LOCKOUT_ENABLED']:
+        app.extensions['login_lockout'] = None
+        return
+    
+    app.extensions['login_lockout'] = LoginLockout(
+        threshold=app.config['LOGIN_LOCKOUT_THRESHOLD'],
+        base_seconds=app.config['LOGIN_LOCKOUT_BASE_SECONDS'],
+        max_seconds=app.config['LOGIN_LOCKOUT_MAX_SECONDS'],
+        window_seconds=app.config['LOGIN_LOCKOUT_WINDOW_SECONDS'],
+        max_entries=app.config['LOGIN_LOCKOUT_MAX_ENTRIES']
+    )
\ No newline at end of file
@@ -0,0 +1,45 @@
+from app.extensions import db
+from datetime import datetime
+
+class RevokedToken(db.Model):
+    """JWT revoked before its expiry (logout); rows are pruned once it expires"""
+    __tablename__ = 'revoked_tokens'
+    
+    jti = db.Column(db.String(36), primary_key=True)
+    token_type = db.Column(db.String(10), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    # Null for tokens without expiry, which are never pruned
+    expires_at = db.Column(db.DateTime, index=True)
+    revoked_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f'<RevokedToken {self.jti} - {self.token_type}>'
+
+class ApiKey(db.Model):
+    """Long-lived key of a machine client, acting as its user within ``scopes``.
+    
+    Only an HMAC-SHA256 of the key is stored; ``prefix`` is the public part
+    of the key used to find the row.
+    """
+    __tablename__ = 'api_keys'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    name = db.Column(db.String(100), nullable=False)
+    prefix = db.Column(db.String(16), unique=True, nullable=False)
+    key_hash = db.Column(db.String(64), nullable=False)
+    scopes = db.Column(db.String(255), nullable=False)  # Space-separated
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def to_dict(self):
+        """Convert key to dictionary (excluding the hash)"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'prefix': self.prefix,
+            'scopes': self.scopes.split(),
+            'created_at': self.created_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<ApiKey {self.prefix} - {self.name}>'
\ No newline at end of file
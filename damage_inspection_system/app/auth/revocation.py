@@ -0,0 +1,170 @@
+from app.auth.models import RevokedToken
+from app.extensions import db, jwt
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import delete, select
+import hashlib
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size set answering "maybe present" or "definitely absent".
+    
+    Sized for ``capacity`` items at ``error_rate`` false positives
+    (100k items at 1% take 117 KiB); items cannot be removed.
+    """
+    
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = capacity
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item):
+        # Double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        step = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + index * step) % self.size for index in range(self.hashes)]
+    
+    def add(self, item):
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+    
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def _utc(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class TokenRevocationList:
+    """Revoked JWT IDs: the revoked_tokens table behind an in-memory bloom filter.
+    
+    Almost every token is answered "not revoked" by the filter alone; only
+    revoked tokens and the filter's false positives are looked up by
+    primary key. Every ``sync_seconds`` the rows revoked since the last sync
+    (by any worker) are added with one indexed query, and every
+    ``prune_seconds`` expired rows are deleted and the filter is rebuilt
+    from the rest, doubling its capacity when it has filled up.
+    """
+    
+    # Rows revoked this long before the newest one seen are fetched again, so
+    # commits that land late (or with a skewed clock) are not missed
+    SYNC_OVERLAP = timedelta(seconds=60)
+    
+    def __init__(self, capacity=100000, error_rate=0.01, sync_seconds=5.0, prune_seconds=3600.0,
+                 clock=time.monotonic):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.prune_seconds = prune_seconds
+        self.clock = clock
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._synced_at = None
+        self._pruned_at = None
+        self._seen_through = None
+        self._lock = threading.Lock()
+    
+    def is_revoked(self, jti):
+        self._refresh()
+        if jti not in self._bloom:
+            return False
+        try:
+            return db.session.get(RevokedToken, jti) is not None
+        except Exception as e:
+            # Only filter hits get here; refuse them rather than accept a revoked token
+            logger.warning(f"Revoked token lookup failed: {str(e)}")
+            return True
+    
+    def revoke(self, payload):
+        """Store a decoded token as revoked until it expires"""
+        db.session.merge(RevokedToken(
+            jti=payload['jti'],
+            token_type=payload['type'],
+            user_id=payload['sub'],
+            expires_at=_utc(payload['exp']) if 'exp' in payload else None
+        ))
+        db.session.commit()
+        with self._lock:
+            self._bloom.add(payload['jti'])
+        logger.info(f"Revoked {payload['type']} token {payload['jti']} of user {payload['sub']}")
+    
+    def _refresh(self):
+        now = self.clock()
+        if self._synced_at is not None and now - self._synced_at < self.sync_seconds:
+            return
+        # One request refreshes; the others keep using the current filter
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._pruned_at is None or now - self._pruned_at >= self.prune_seconds:
+                self._rebuild()
+                self._pruned_at = now
+            else:
+                self._sync()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Revoked token sync failed: {str(e)}")
+        finally:
+            self._synced_at = now
+            self._lock.release()
+    
+    def _rebuild(self):
+        db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow()))
+        db.session.commit()
+        rows = db.session.execute(select(RevokedToken.jti, RevokedToken.revoked_at)).all()
+        if len(rows) > self.capacity // 2:
+            self.capacity = max(self.capacity * 2, len(rows) * 2)
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        self._seen_through = None
+        self._add(bloom, rows)
+        self._bloom = bloom
+        logger.info(f"Revoked token filter rebuilt with {len(rows)} tokens")
+    
+    def _sync(self):
+        query = select(RevokedToken.jti, RevokedToken.revoked_at)
+        if self._seen_through is not None:
+            query = query.where(RevokedToken.revoked_at >= self._seen_through - self.SYNC_OVERLAP)
+        self._add(self._bloom, db.session.execute(query).all())
+        if self._bloom.count > self._bloom.capacity:
+            self._pruned_at = None
+    
+    def _add(self, bloom, rows):
+        for jti, revoked_at in rows:
+            bloom.add(jti)
+            if self._seen_through is None or revoked_at > self._seen_through:
+                self._seen_through = revoked_at
+
+
+def _token_revoked(jwt_header, jwt_payload):
+    revocation = current_app.extensions.get('token_revocation')
+    return revocation is not None and revocation.is_revoked(jwt_payload['jti'])
+
+
+def init_token_revocation(app):
+    jwt.token_in_blocklist_loader(_token_revoked)
+    if not app.config['TOKEN_REVOCATION_ENABLED']:
+        app.extensions['token_revocation'] = None
+        return
+    
+    app.extensions['token_revocation'] = TokenRevocationList(
+        capacity=app.config['TOKEN_REVOCATION_CAPACITY'],
+        error_rate=app.config['TOKEN_REVOCATION_ERROR_RATE'],
+        sync_seconds=app.config['TOKEN_REVOCATION_SYNC_SECONDS'],
+        prune_seconds=app.config['TOKEN_REVOCATION_PRUNE_SECONDS']
+    )
\ No newline at end of file
@@ -1,8 +1,10 @@
 from flask import Blueprint, request, jsonify
-from app.auth.services import AuthService
+from app.auth.services import ApiKeyService, AuthService
 from app.auth.utils import get_current_user
+from app.core.health import readiness
 from app.core.logger import log_request
-from flask_jwt_extended import jwt_required
+from app.core.rate_limit import rate_limit
+from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,16 +17,12 @@ def test():
 
 @auth_bp.route('/db-test', methods=['GET'])
 def db_test():
-    try:
-        from app.extensions import db
-        from sqlalchemy import text
-        with db.engine.connect() as connection:
-            result = connection.execute(text('SELECT 1'))
-            return {"message": "Database connection successful!", "result": "Connected to MySQL"}
-    except Exception as e:
-        return {"error": f"Database connection failed: {str(e)}"}
+    """Deprecated: use /api/health/ready"""
+    response, status_code = readiness()
+    return jsonify(response), status_code
 
 @auth_bp.route('/signup', methods=['POST'])
+@rate_limit('auth')
 @log_request
 def signup():
     """Register a new user"""
@@ -42,6 +40,7 @@ def signup():
         return jsonify({'error': 'Internal server error'}), 500
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit('auth')
 @log_request
 def login():
     """Authenticate user and return JWT token"""
@@ -52,12 +51,42 @@ def login():
             return jsonify({'error': 'No data provided'}), 400
         
         response, status_code = AuthService.login_user(data)
+        if status_code == 429:
+            return jsonify(response), status_code, {'Retry-After': str(response['retry_after'])}
         return jsonify(response), status_code
         
     except Exception as e:
         logger.error(f"Login endpoint error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@auth_bp.route('/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+@log_request
+def refresh():
+    """Exchange a refresh token for new access and refresh tokens"""
+    try:
+        response, status_code = AuthService.refresh_access_token(get_jwt())
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Refresh endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+@log_request
+def logout():
+    """Revoke the presented token (and an optional refresh_token from the body)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        response, status_code = AuthService.logout(get_jwt(), data.get('refresh_token'))
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Logout endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @auth_bp.route('/profile', methods=['GET'])
 @jwt_required()
 @log_request
@@ -76,4 +105,48 @@ def get_profile():
         
     except Exception as e:
         logger.error(f"Profile endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@auth_bp.route('/api-keys', methods=['POST'])
+@jwt_required()
+@log_request
+def create_api_key():
+    """Create an API key for machine clients of the current user"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+        
+        response, status_code = ApiKeyService.create_key(data, get_jwt_identity())
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Create API key endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@auth_bp.route('/api-keys', methods=['GET'])
+@jwt_required()
+@log_request
+def list_api_keys():
+    """List the current user's API keys"""
+    try:
+        response, status_code = ApiKeyService.list_keys(get_jwt_identity())
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"List API keys endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@auth_bp.route('/api-keys/<int:key_id>', methods=['DELETE'])
+@jwt_required()
+@log_request
+def delete_api_key(key_id):
+    """Delete one of the current user's API keys"""
+    try:
+        response, status_code = ApiKeyService.delete_key(key_id, get_jwt_identity())
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Delete API key endpoint error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
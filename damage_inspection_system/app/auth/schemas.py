@@ -0,0 +1,18 @@
+from marshmallow import Schema, fields, validate
+
+# Scopes an API key can be granted
+API_KEY_SCOPES = ('inspections:read', 'inspections:write')
+
+class ApiKeyCreateSchema(Schema):
+    name = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, max=100)
+    )
+    scopes = fields.List(
+        fields.Str(validate=validate.OneOf(API_KEY_SCOPES)),
+        required=True,
+        validate=validate.Length(min=1)
+    )
+
+# Initialize schemas
+api_key_create_schema = ApiKeyCreateSchema()
\ No newline at end of file
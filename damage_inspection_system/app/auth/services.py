@@ -1,9 +1,14 @@
+from app.auth.models import ApiKey
+from app.auth.schemas import api_key_create_schema
 from app.extensions import db
+from app.core.tracing import span
 from app.users.models import User
 from app.users.schemas import user_registration_schema, user_login_schema
-from flask_jwt_extended import create_access_token
+from flask import current_app
+from flask_jwt_extended import create_access_token, create_refresh_token, decode_token
 from marshmallow import ValidationError
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -14,22 +19,30 @@ class AuthService:
         """Register a new user"""
         try:
             # Validate input data
-            validated_data = user_registration_schema.load(data)
+            with span('validation'):
+                validated_data = user_registration_schema.load(data)
             
             # Check if username already exists
-            existing_user = User.query.filter_by(username=validated_data['username']).first()
+            with span('db'):
+                existing_user = User.query.filter_by(username=validated_data['username']).first()
             if existing_user:
                 return {'error': 'Username already exists'}, 400
             
             # Create new user
             user = User(username=validated_data['username'])
-            user.set_password(validated_data['password'])
+            with span('password_hash'):
+                user.set_password(validated_data['password'])
             
-            # Save to database
-            db.session.add(user)
-            db.session.commit()
+            # Save to database and pin the user to a shard in the same transaction
+            with span('db'):
+                db.session.add(user)
+                shard_router = current_app.extensions.get('shard_router')
+                if shard_router is not None:
+                    db.session.flush()
+                    shard_router.assign(user.id)
+                db.session.commit()
             
-            logger.info(f"New user registered: {user.username}")
+            logger.info("New user registered: %s", user.username)
             
             return {
                 'message': 'User registered successfully',
@@ -37,10 +50,10 @@ class AuthService:
             }, 201
             
         except ValidationError as e:
-            logger.error(f"Registration validation error: {e.messages}")
+            logger.error("Registration validation error: %s", e.messages)
             return {'error': e.messages}, 400
         except Exception as e:
-            logger.exception(f"Registration error: {str(e)}")
+            logger.exception("Registration error: %s", e)
             db.session.rollback()
             return {'error': 'Registration failed'}, 500
     
@@ -49,29 +62,192 @@ class AuthService:
         """Authenticate user and return JWT token"""
         try:
             # Validate input data
-            validated_data = user_login_schema.load(data)
+            with span('validation'):
+                validated_data = user_login_schema.load(data)
+            
+            username = validated_data['username']
+            
+            # Refuse locked usernames before the user lookup and bcrypt
+            lockout = current_app.extensions.get('login_lockout')
+            if lockout is not None:
+                locked_for = lockout.locked_for(username)
+                if locked_for:
+                    logger.warning("Login attempt for locked username: %s", username)
+                    return {
+                        'error': 'Too many failed login attempts',
+                        'retry_after': math.ceil(locked_for)
+                    }, 429
             
             # Find user by username
-            user = User.query.filter_by(username=validated_data['username']).first()
+            with span('db'):
+                user = User.query.filter_by(username=username).first()
             
-            if not user or not user.check_password(validated_data['password']):
-                logger.warning(f"Failed login attempt for username: {validated_data['username']}")
+            with span('password_check'):
+                valid = user is not None and user.check_password(validated_data['password'])
+            if not valid:
+                logger.warning("Failed login attempt for username: %s", username)
+                if lockout is not None:
+                    lock_seconds = lockout.record_failure(username)
+                    if lock_seconds:
+                        logger.warning("Username %s locked for %ss after repeated failed logins", username, lock_seconds)
                 return {'error': 'Invalid username or password'}, 401
             
-            # Create JWT token
+            if lockout is not None:
+                lockout.reset(username)
+            
+            # Create JWT tokens
             access_token = create_access_token(identity=user.id)
+            refresh_token = create_refresh_token(identity=user.id)
             
-            logger.info(f"User logged in: {user.username}")
+            logger.info("User logged in: %s", user.username)
             
             return {
                 'message': 'Login successful',
                 'access_token': access_token,
+                'refresh_token': refresh_token,
                 'user': user.to_dict()
             }, 200
             
         except ValidationError as e:
-            logger.error(f"Login validation error: {e.messages}")
+            logger.error("Login validation error: %s", e.messages)
             return {'error': 'Login failed'}, 400
         except Exception as e:
-            logger.exception(f"Login error: {str(e)}")
-            return {'error': 'Login failed'}, 500
\ No newline at end of file
+            logger.exception("Login error: %s", e)
+            return {'error': 'Login failed'}, 500
+    
+    @staticmethod
+    def refresh_access_token(token):
+        """Rotate a refresh token: issue new access and refresh tokens and revoke the presented one"""
+        try:
+            user_id = token['sub']
+            if db.session.get(User, user_id) is None:
+                return {'error': 'User not found'}, 401
+            
+            # A refresh token is good for one use, so a stolen copy stops
+            # working once either holder refreshes
+            revocation = current_app.extensions.get('token_revocation')
+            if revocation is not None:
+                revocation.revoke(token)
+            
+            logger.info("Tokens refreshed for user %s", user_id)
+            return {
+                'access_token': create_access_token(identity=user_id),
+                'refresh_token': create_refresh_token(identity=user_id)
+            }, 200
+            
+        except Exception as e:
+            logger.exception("Token refresh error: %s", e)
+            db.session.rollback()
+            return {'error': 'Token refresh failed'}, 500
+    
+    @staticmethod
+    def logout(token, refresh_token=None):
+        """Revoke the presented token and, if given, the user's refresh token"""
+        try:
+            revocation = current_app.extensions.get('token_revocation')
+            if revocation is None:
+                return {'error': 'Token revocation is disabled'}, 501
+            
+            tokens = [token]
+            if refresh_token:
+                try:
+                    refresh = decode_token(refresh_token)
+                except Exception as e:
+                    logger.error("Logout refresh token error: %s", e)
+                    return {'error': 'Invalid refresh token'}, 400
+                if refresh['type'] != 'refresh' or refresh['sub'] != token['sub']:
+                    return {'error': 'Invalid refresh token'}, 400
+                tokens.append(refresh)
+            
+            for payload in tokens:
+                revocation.revoke(payload)
+            
+            logger.info("User %s logged out", token['sub'])
+            return {'message': 'Logged out successfully'}, 200
+            
+        except Exception as e:
+            logger.exception("Logout error: %s", e)
+            db.session.rollback()
+            return {'error': 'Logout failed'}, 500
+
+
+class ApiKeyService:
+    
+    @staticmethod
+    def create_key(data, user_id):
+        """Create an API key; the key itself is only returned here"""
+        try:
+            verifier = current_app.extensions.get('api_keys')
+            if verifier is None:
+                return {'error': 'API keys are disabled'}, 501
+            
+            validated_data = api_key_create_schema.load(data)
+            
+            key_count = ApiKey.query.filter_by(user_id=user_id).count()
+            if key_count >= current_app.config['API_KEY_MAX_PER_USER']:
+                return {'error': 'API key limit reached'}, 400
+            
+            key, prefix, key_hash = verifier.generate()
+            api_key = ApiKey(
+                user_id=user_id,
+                name=validated_data['name'],
+                prefix=prefix,
+                key_hash=key_hash,
+                scopes=' '.join(sorted(set(validated_data['scopes'])))
+            )
+            db.session.add(api_key)
+            db.session.commit()
+            
+            logger.info("API key %s created by user %s", prefix, user_id)
+            
+            return {
+                'message': 'API key created successfully',
+                'key': key,
+                'api_key': api_key.to_dict()
+            }, 201
+            
+        except ValidationError as e:
+            logger.error("API key validation error: %s", e.messages)
+            return {'error': e.messages}, 400
+        except Exception as e:
+            logger.exception("API key creation error: %s", e)
+            db.session.rollback()
+            return {'error': 'API key creation failed'}, 500
+    
+    @staticmethod
+    def list_keys(user_id):
+        """API keys of a user, without their secrets"""
+        try:
+            api_keys = ApiKey.query.filter_by(user_id=user_id).order_by(ApiKey.id).all()
+            return {
+                'api_keys': [api_key.to_dict() for api_key in api_keys],
+                'count': len(api_keys)
+            }, 200
+            
+        except Exception as e:
+            logger.exception("List API keys error: %s", e)
+            return {'error': 'Failed to retrieve API keys'}, 500
+    
+    @staticmethod
+    def delete_key(key_id, user_id):
+        """Delete an API key (only if owned by the user)"""
+        try:
+            api_key = ApiKey.query.filter_by(id=key_id, user_id=user_id).first()
+            if not api_key:
+                return {'error': 'API key not found or access denied'}, 404
+            
+            key_hash = api_key.key_hash
+            db.session.delete(api_key)
+            db.session.commit()
+            
+            verifier = current_app.extensions.get('api_keys')
+            if verifier is not None:
+                verifier.forget(key_hash)
+            
+            logger.info("API key %s deleted by user %s", api_key.prefix, user_id)
+            return {'message': 'API key deleted successfully'}, 200
+            
+        except Exception as e:
+            logger.exception("Delete API key error: %s", e)
+            db.session.rollback()
+            return {'error': 'Failed to delete API key'}, 500
\ No newline at end of file
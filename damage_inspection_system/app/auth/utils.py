@@ -1,7 +1,30 @@
-from flask_jwt_extended import get_jwt_identity
+from flask import current_app, g, jsonify
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from functools import wraps
+from app.core.routing import read_replica
 from app.users.models import User
 
+def get_current_user_id():
+    """ID of the authenticated user, from the API key (``@auth_required``) or JWT token"""
+    user_id = g.get('current_user_id')
+    return user_id if user_id is not None else get_jwt_identity()
+
+@read_replica
 def get_current_user():
     """Get current authenticated user from JWT token"""
-    current_user_id = get_jwt_identity()
-    return User.query.get(current_user_id)
\ No newline at end of file
+    current_user_id = get_current_user_id()
+    return User.query.get(current_user_id)
+
+def is_admin(user):
+    """Whether ``user`` is listed in ADMIN_USERNAMES"""
+    return user is not None and user.username in current_app.config['ADMIN_USERNAMES']
+
+def admin_required(func):
+    """Decorator allowing only users listed in ADMIN_USERNAMES"""
+    @wraps(func)
+    @jwt_required()
+    def wrapper(*args, **kwargs):
+        if not is_admin(get_current_user()):
+            return jsonify({'error': 'Admin access required'}), 403
+        return func(*args, **kwargs)
+    return wrapper
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,4 +9,123 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
-    JWT_ACCESS_TOKEN_EXPIRES = False  # For development, tokens don't expire
\ No newline at end of file
+    # Short-lived access tokens, renewed with a refresh token at /api/refresh
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=int(os.getenv('JWT_ACCESS_TOKEN_MINUTES', 15)))
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=int(os.getenv('JWT_REFRESH_TOKEN_DAYS', 30)))
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    
+    # Logging: "text" or "json" lines, and the fraction of INFO/DEBUG records kept
+    # per logger, e.g. "app.core.logger=0.05,app.inspections.services=0.1"
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FILE = os.getenv('LOG_FILE', 'logs/app.log')
+    LOG_SAMPLE_RATES = os.getenv('LOG_SAMPLE_RATES', '')
+    
+    # Archiving of completed inspections
+    ARCHIVE_AFTER_DAYS = int(os.getenv('ARCHIVE_AFTER_DAYS', 365))
+    ARCHIVE_BATCH_SIZE = int(os.getenv('ARCHIVE_BATCH_SIZE', 500))
+    ARCHIVE_BATCH_SLEEP_SECONDS = float(os.getenv('ARCHIVE_BATCH_SLEEP_SECONDS', 0.5))
+    
+    # Monthly range partitions of the inspections table (MySQL)
+    PARTITION_MONTHS_AHEAD = int(os.getenv('PARTITION_MONTHS_AHEAD', 3))
+    PARTITION_RETENTION_MONTHS = int(os.getenv('PARTITION_RETENTION_MONTHS', 0))
+    
+    # Read replicas for read-only service methods (comma-separated URLs)
+    SQLALCHEMY_REPLICA_URIS = [url for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url]
+    REPLICA_STICKY_SECONDS = float(os.getenv('REPLICA_STICKY_SECONDS', 5))
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 10))
+    REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_INTERVAL', 5))
+    
+    # User-id sharding of inspections (comma-separated URLs, one per shard)
+    SQLALCHEMY_SHARD_URIS = [url for url in os.getenv('DATABASE_SHARD_URLS', '').split(',') if url]
+    SHARD_RING_VNODES = int(os.getenv('SHARD_RING_VNODES', 64))
+    SHARD_DIRECTORY_CACHE_SECONDS = float(os.getenv('SHARD_DIRECTORY_CACHE_SECONDS', 60))
+    
+    # Slow query log (ring buffer, logs/slow_queries.log and /api/admin/slow-queries);
+    # bound parameters are only recorded with SLOW_QUERY_LOG_PARAMETERS
+    SLOW_QUERY_LOG_ENABLED = os.getenv('SLOW_QUERY_LOG_ENABLED', 'false').lower() == 'true'
+    SLOW_QUERY_SECONDS = float(os.getenv('SLOW_QUERY_SECONDS', 0.5))
+    SLOW_QUERY_BUFFER_SIZE = int(os.getenv('SLOW_QUERY_BUFFER_SIZE', 100))
+    SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'false').lower() == 'true'
+    SLOW_QUERY_LOG_PARAMETERS = os.getenv('SLOW_QUERY_LOG_PARAMETERS', 'false').lower() == 'true'
+    SLOW_QUERY_LOG_FILE = os.getenv('SLOW_QUERY_LOG_FILE', 'logs/slow_queries.log')
+    
+    # Sampling request profiler (collapsed stacks at /api/admin/profiles)
+    PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'false').lower() == 'true'
+    PROFILER_SAMPLE_RATE = float(os.getenv('PROFILER_SAMPLE_RATE', 0.0))
+    PROFILER_HEADER = os.getenv('PROFILER_HEADER', 'X-Profile')
+    PROFILER_HEADER_SECRET = os.getenv('PROFILER_HEADER_SECRET')
+    PROFILER_INTERVAL_SECONDS = float(os.getenv('PROFILER_INTERVAL_SECONDS', 0.001))
+    PROFILER_MAX_STACKS = int(os.getenv('PROFILER_MAX_STACKS', 5000))
+    
+    # Per-request span traces (JSON lines file, or POSTed to a local collector)
+    TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'false').lower() == 'true'
+    TRACING_FILE = os.getenv('TRACING_FILE', 'logs/traces.jsonl')
+    TRACING_COLLECTOR_URL = os.getenv('TRACING_COLLECTOR_URL')
+    
+    # Seconds a readiness check result (/api/health/ready) is reused, and seconds
+    # SELECT 1 may take (including waiting for a pooled connection) before a bind
+    # counts as unavailable
+    HEALTH_CHECK_TTL_SECONDS = float(os.getenv('HEALTH_CHECK_TTL_SECONDS', 2))
+    HEALTH_CHECK_TIMEOUT_SECONDS = float(os.getenv('HEALTH_CHECK_TIMEOUT_SECONDS', 1))
+    
+    # Token-bucket rate limits ("<requests>/<second|minute|hour|day>"): signup and
+    # login per client IP, inspection endpoints per user. The backend is "memory"
+    # (per process) or "module:Class" of a shared RateLimitBackend
+    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    RATE_LIMIT_AUTH = os.getenv('RATE_LIMIT_AUTH', '10/minute')
+    RATE_LIMIT_INSPECTIONS = os.getenv('RATE_LIMIT_INSPECTIONS', '300/minute')
+    RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', 'memory')
+    RATE_LIMIT_MAX_KEYS = int(os.getenv('RATE_LIMIT_MAX_KEYS', 100000))
+    
+    # Login lockout per username: after THRESHOLD consecutive failures the username
+    # is locked for BASE_SECONDS, doubling per further failure up to MAX_SECONDS;
+    # failures are forgotten WINDOW_SECONDS after the last one
+    LOGIN_LOCKOUT_ENABLED = os.getenv('LOGIN_LOCKOUT_ENABLED', 'true').lower() == 'true'
+    LOGIN_LOCKOUT_THRESHOLD = int(os.getenv('LOGIN_LOCKOUT_THRESHOLD', 5))
+    LOGIN_LOCKOUT_BASE_SECONDS = float(os.getenv('LOGIN_LOCKOUT_BASE_SECONDS', 30))
+    LOGIN_LOCKOUT_MAX_SECONDS = float(os.getenv('LOGIN_LOCKOUT_MAX_SECONDS', 900))
+    LOGIN_LOCKOUT_WINDOW_SECONDS = float(os.getenv('LOGIN_LOCKOUT_WINDOW_SECONDS', 900))
+    LOGIN_LOCKOUT_MAX_ENTRIES = int(os.getenv('LOGIN_LOCKOUT_MAX_ENTRIES', 100000))
+    
+    # Tokens revoked at /api/logout: a bloom filter of CAPACITY tokens answers most
+    # checks in memory; rows revoked by other workers are picked up every SYNC_SECONDS
+    # and expired rows are pruned every PRUNE_SECONDS
+    TOKEN_REVOCATION_ENABLED = os.getenv('TOKEN_REVOCATION_ENABLED', 'true').lower() == 'true'
+    TOKEN_REVOCATION_CAPACITY = int(os.getenv('TOKEN_REVOCATION_CAPACITY', 100000))
+    TOKEN_REVOCATION_ERROR_RATE = float(os.getenv('TOKEN_REVOCATION_ERROR_RATE', 0.01))
+    TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv('TOKEN_REVOCATION_SYNC_SECONDS', 5))
+    TOKEN_REVOCATION_PRUNE_SECONDS = float(os.getenv('TOKEN_REVOCATION_PRUNE_SECONDS', 3600))
+    
+    # API keys of machine clients (X-API-Key header), hashed with HMAC-SHA256 under
+    # API_KEY_SECRET (required, keys are disabled without it); verified keys are
+    # cached per worker
+    API_KEYS_ENABLED = os.getenv('API_KEYS_ENABLED', 'true').lower() == 'true'
+    API_KEY_SECRET = os.getenv('API_KEY_SECRET')
+    API_KEY_CACHE_SECONDS = float(os.getenv('API_KEY_CACHE_SECONDS', 60))
+    API_KEY_CACHE_SIZE = int(os.getenv('API_KEY_CACHE_SIZE', 10000))
+    API_KEY_MAX_PER_USER = int(os.getenv('API_KEY_MAX_PER_USER', 10))
+    
+    # Image uploads (/api/uploads), stored content-addressed by SHA-256 under UPLOAD_DIR
+    # ("local") or by a "module:Class" Storage; UPLOAD_BASE_URL overrides the
+    # /api/uploads/<name> URLs returned for new images (e.g. a CDN)
+    UPLOAD_STORAGE = os.getenv('UPLOAD_STORAGE', 'local')
+    UPLOAD_DIR = os.getenv('UPLOAD_DIR', 'uploads')
+    UPLOAD_BASE_URL = os.getenv('UPLOAD_BASE_URL')
+    UPLOAD_MAX_BYTES = int(os.getenv('UPLOAD_MAX_BYTES', 10 * 1024 * 1024))
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', 64 * 1024))
+    
+    # Users allowed to call the /api/admin debug endpoints (comma-separated usernames)
+    ADMIN_USERNAMES = [name for name in os.getenv('ADMIN_USERNAMES', '').split(',') if name]
+
+
+# File and directory settings; relative paths are taken from the app's instance
+# folder, not the working directory, so nothing is written into the source tree
+INSTANCE_PATHS = ('LOG_FILE', 'SLOW_QUERY_LOG_FILE', 'TRACING_FILE', 'UPLOAD_DIR')
+
+def resolve_instance_paths(app):
+    """Make the relative ``INSTANCE_PATHS`` settings of ``app`` absolute under its instance folder"""
+    for key in INSTANCE_PATHS:
+        path = app.config.get(key)
+        if path and not os.path.isabs(path):
+            app.config[key] = os.path.join(app.instance_path, path)
\ No newline at end of file
@@ -0,0 +1,61 @@
+from flask.cli import AppGroup
+
+
+class LazyAppGroup(AppGroup):
+    """``app.cli`` with commands that are imported on first lookup.
+    
+    Command modules (and Flask-Migrate, which pulls in alembic and mako) are
+    only needed by the ``flask`` CLI, so web workers and test apps skip them.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+    
+    def add_lazy_command(self, name, loader):
+        """Register ``loader``, a callable returning the command called ``name``"""
+        self.lazy_commands[name] = loader
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx, name):
+        loader = self.lazy_commands.pop(name, None)
+        if loader is not None and name not in self.commands:
+            self.add_command(loader(), name)
+        return super().get_command(ctx, name)
+
+
+def init_cli(app):
+    """Register the CLI command groups of ``app`` without importing them.
+    
+    Call it after the blueprints are registered, so their commands carry over.
+    """
+    from app.extensions import db
+    
+    def migrate_commands():
+        from flask_migrate import Migrate
+        Migrate(app, db)
+        return app.cli.commands['db']
+    
+    def inspections_commands():
+        from app.inspections.commands import inspections_cli
+        return inspections_cli
+    
+    def shards_commands():
+        from app.core.commands import shards_cli
+        return shards_cli
+    
+    def data_commands():
+        from app.core.commands import data_cli
+        return data_cli
+    
+    # Keep the commands registered so far, e.g. by blueprints with ``bp.cli``
+    cli = LazyAppGroup(app.cli.name)
+    for name, command in app.cli.commands.items():
+        cli.add_command(command, name)
+    app.cli = cli
+    app.cli.add_lazy_command('db', migrate_commands)
+    app.cli.add_lazy_command('inspections', inspections_commands)
+    app.cli.add_lazy_command('shards', shards_commands)
+    app.cli.add_lazy_command('data', data_commands)
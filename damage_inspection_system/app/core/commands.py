@@ -0,0 +1,71 @@
+from app.core.datagen import LOADERS, generate
+from app.core.sharding import ShardMoveError
+from flask import current_app
+from flask.cli import AppGroup
+import click
+
+shards_cli = AppGroup('shards', help='User-id sharding commands.')
+data_cli = AppGroup('data', help='Synthetic data commands.')
+
+def _router():
+    router = current_app.extensions.get('shard_router')
+    if router is None:
+        raise click.ClickException('Sharding is not configured (set DATABASE_SHARD_URLS)')
+    return router
+
+@shards_cli.command('init')
+def init():
+    """Create the sharded tables on every shard"""
+    router = _router()
+    router.create_all()
+    click.echo(f"Initialized shards: {', '.join(router.bind_keys)}")
+
+@shards_cli.command('locate')
+@click.argument('user_id', type=int)
+def locate(user_id):
+    """Show the shard holding a user's inspections"""
+    router = _router()
+    click.echo(f'User {user_id}: {router.shard_for_user(user_id)} (ring placement {router.placement(user_id)})')
+
+@shards_cli.command('move')
+@click.argument('user_id', type=int)
+@click.argument('shard_key')
+def move(user_id, shard_key):
+    """Move a user's inspections to another shard"""
+    try:
+        moved = _router().move_user(user_id, shard_key)
+    except ShardMoveError as e:
+        raise click.ClickException(str(e))
+    click.echo(f'Moved {moved} inspections of user {user_id} to {shard_key}')
+
+@shards_cli.command('rebalance')
+@click.option('--dry-run', is_flag=True, help='Only list the users that would move.')
+def rebalance(dry_run):
+    """Move users whose hash ring placement no longer matches their shard"""
+    try:
+        moves = _router().rebalance(dry_run=dry_run)
+    except ShardMoveError as e:
+        raise click.ClickException(str(e))
+    for user_id, source, target in moves:
+        click.echo(f'User {user_id}: {source} -> {target}')
+    click.echo(f"{'Would move' if dry_run else 'Moved'} {len(moves)} users")
+
+@data_cli.command('generate')
+@click.option('--users', type=int, default=1000, help='Users to create.')
+@click.option('--inspections', type=int, default=100000, help='Inspections to create.')
+@click.option('--method', type=click.Choice(sorted(LOADERS)), default='core', help='Bulk insert path.')
+@click.option('--batch-size', type=int, default=10000, help='Rows per INSERT / LOAD DATA batch.')
+@click.option('--days', type=int, default=730, help='Spread creation dates over this many days.')
+@click.option('--seed', type=int, default=42, help='Random seed for reproducible data.')
+@click.option('--prefix', default='gen', help='Username prefix of generated users.')
+@click.option('--password', default='password123', help='Password shared by generated users.')
+@click.option('--with-events', is_flag=True, help='Also generate status history.')
+def generate_data(users, inspections, method, batch_size, days, seed, prefix, password, with_events):
+    """Bulk-load realistic users and inspections"""
+    try:
+        counts = generate(users, inspections, method=method, batch_size=batch_size, seed=seed,
+                          days=days, prefix=prefix, password=password, with_events=with_events,
+                          progress=click.echo)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(', '.join(f'{count} {table}' for table, count in counts.items()))
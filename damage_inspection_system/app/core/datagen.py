@@ -0,0 +1,283 @@
+from app.extensions import db
+from app.core.sharding import using_shard
+from app.inspections.models import Inspections, InspectionStatus, InspectionStatusEvent
+from app.users.models import User, UserShard
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import create_engine, insert, select
+import csv
+import itertools
+import logging
+import math
+import os
+import random
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+# Registration prefixes of Indian states, weighted roughly by fleet size
+STATE_CODES = (
+    ('MH', 14), ('UP', 12), ('DL', 10), ('KA', 9), ('TN', 9), ('GJ', 8), ('RJ', 6),
+    ('WB', 6), ('TS', 5), ('HR', 5), ('KL', 5), ('PB', 4), ('MP', 4), ('AP', 3)
+)
+DAMAGED_PARTS = (
+    'Front bumper', 'Rear bumper', 'Left headlight', 'Right tail light', 'Bonnet',
+    'Windshield', 'Driver side door', 'Passenger side mirror', 'Roof panel', 'Rear left fender'
+)
+DAMAGE_KINDS = (
+    'has deep scratches', 'is dented', 'is cracked', 'is shattered',
+    'has paint peeling', 'is misaligned after impact', 'has minor scuffs'
+)
+# Share of pending/reviewed/completed by age: recent work is still open,
+# anything older than a month is nearly always completed
+STATUS_WEIGHTS_BY_AGE = (
+    (2, (70, 25, 5)),
+    (14, (30, 40, 30)),
+    (30, (10, 25, 65)),
+    (None, (2, 5, 93))
+)
+STATUSES = (InspectionStatus.PENDING, InspectionStatus.REVIEWED, InspectionStatus.COMPLETED)
+
+
+class DataGenerator:
+    """Reproducible generator of realistic user and inspection rows.
+    
+    Inspections per user follow a Zipf-like distribution, creation times lean
+    towards recent business hours on weekdays and status depends on age.
+    """
+    
+    def __init__(self, seed=42, days=730, now=None):
+        self.rng = random.Random(seed)
+        self.days = days
+        self.now = now or datetime.utcnow()
+        self._states = [code for code, _ in STATE_CODES]
+        self._state_weights = list(itertools.accumulate(weight for _, weight in STATE_CODES))
+    
+    def vehicle_number(self):
+        rng = self.rng
+        state = rng.choices(self._states, cum_weights=self._state_weights)[0]
+        series = ''.join(rng.choice('ABCDEFGHJKLMNPRSTUVWXYZ') for _ in range(rng.choice((1, 2, 2, 2))))
+        return f'{state}{rng.randint(1, 99):02d}{series}{rng.randint(1, 9999):04d}'
+    
+    def created_at(self):
+        rng = self.rng
+        # Exponential age skews towards recent days; the weekend shift and hour
+        # below move a row by under three days, so leave room inside the window
+        age_days = min(rng.expovariate(3.0 / self.days), max(self.days - 3, 0))
+        moment = self.now - timedelta(days=age_days)
+        if moment.weekday() >= 5 and rng.random() < 0.7:
+            moment -= timedelta(days=moment.weekday() - 4)
+        hour = min(max(int(rng.gauss(13, 3)), 0), 23)
+        moment = moment.replace(hour=hour, minute=rng.randrange(60), second=rng.randrange(60), microsecond=0)
+        return min(moment, self.now.replace(microsecond=0))
+    
+    def status(self, created_at):
+        age_days = (self.now - created_at).days
+        for limit, weights in STATUS_WEIGHTS_BY_AGE:
+            if limit is None or age_days < limit:
+                return self.rng.choices(STATUSES, weights=weights)[0]
+    
+    def damage_report(self):
+        parts = self.rng.sample(DAMAGED_PARTS, self.rng.choice((1, 1, 2, 3)))
+        return '. '.join(f'{part} {self.rng.choice(DAMAGE_KINDS)}' for part in parts) + '.'
+    
+    def user_rows(self, count, prefix, password_hash):
+        created = self.now - timedelta(days=self.days)
+        for index in range(count):
+            yield {
+                'username': f'{prefix}_{index}',
+                'password_hash': password_hash,
+                'created_at': created + timedelta(seconds=index)
+            }
+    
+    def owners(self, user_ids, count):
+        """``count`` user ids drawn with Zipf-like weights"""
+        weights = [1.0 / math.pow(rank, 0.8) for rank in range(1, len(user_ids) + 1)]
+        shuffled = list(user_ids)
+        self.rng.shuffle(shuffled)
+        return self.rng.choices(shuffled, weights=weights, k=count)
+    
+    def inspection_rows(self, user_ids, count):
+        for index, user_id in enumerate(self.owners(user_ids, count)):
+            created_at = self.created_at()
+            yield {
+                'vehicle_number': self.vehicle_number(),
+                'damage_report': self.damage_report(),
+                'image_url': f'https://images.example.com/inspections/{user_id}/{index}.jpg',
+                'inspected_by': user_id,
+                'status': self.status(created_at),
+                'created_at': created_at
+            }
+    
+    def status_event_rows(self, inspection):
+        """Plausible history ending in the inspection's current status"""
+        path = STATUSES[:STATUSES.index(inspection['status']) + 1]
+        at = inspection['created_at']
+        previous = None
+        for status in path:
+            yield {
+                'inspection_id': inspection['id'],
+                'from_status': previous,
+                'to_status': status,
+                'changed_by': inspection['inspected_by'],
+                'at': at
+            }
+            previous = status
+            at = min(at + timedelta(hours=self.rng.expovariate(1 / 20.0)), self.now)
+
+
+def _batches(rows, size):
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+@contextmanager
+def _fast_load_settings(connection):
+    """Relax durability and checks on ``connection`` for the duration of a bulk load"""
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        connection.exec_driver_sql('PRAGMA synchronous = OFF')
+    elif dialect == 'mysql':
+        connection.exec_driver_sql('SET unique_checks = 0')
+        connection.exec_driver_sql('SET foreign_key_checks = 0')
+    connection.commit()
+    try:
+        yield
+    finally:
+        # Pooled connections must not keep the relaxed settings
+        if dialect == 'sqlite':
+            connection.exec_driver_sql('PRAGMA synchronous = FULL')
+        elif dialect == 'mysql':
+            connection.exec_driver_sql('SET unique_checks = 1')
+            connection.exec_driver_sql('SET foreign_key_checks = 1')
+        connection.commit()
+
+
+class CoreLoader:
+    """Multi-row executemany INSERTs through SQLAlchemy core, one transaction per batch"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def load(self, table, batches):
+        with self.engine.connect() as connection, _fast_load_settings(connection):
+            for batch in batches:
+                connection.execute(insert(table), batch)
+                connection.commit()
+                yield len(batch)
+
+
+class LoadDataLoader:
+    """MySQL ``LOAD DATA LOCAL INFILE`` from temporary CSV files, one per batch"""
+    
+    def __init__(self, engine):
+        if engine.dialect.name != 'mysql':
+            raise ValueError('LOAD DATA is only available on MySQL')
+        self.engine = create_engine(engine.url, connect_args={'local_infile': True})
+    
+    @staticmethod
+    def _csv_value(value):
+        if value is None:
+            return r'\N'
+        if isinstance(value, InspectionStatus):
+            # SQLAlchemy stores enum names in MySQL ENUM columns
+            return value.name
+        if isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        return value
+    
+    def load(self, table, batches):
+        with self.engine.connect() as connection, _fast_load_settings(connection):
+            for batch in batches:
+                columns = list(batch[0])
+                with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', delete=False) as f:
+                    writer = csv.writer(f, lineterminator='\n', escapechar='\\')
+                    for row in batch:
+                        writer.writerow([self._csv_value(row[column]) for column in columns])
+                try:
+                    connection.exec_driver_sql(
+                        f"LOAD DATA LOCAL INFILE '{f.name}' INTO TABLE {table.name} "
+                        "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                        f"LINES TERMINATED BY '\\n' ({', '.join(columns)})"
+                    )
+                    connection.commit()
+                finally:
+                    os.unlink(f.name)
+                yield len(batch)
+        self.engine.dispose()
+
+
+LOADERS = {
+    'core': CoreLoader,
+    'load-data': LoadDataLoader
+}
+
+
+def generate(users, inspections, method='core', batch_size=10000, seed=42, days=730,
+             prefix='gen', password='password123', with_events=False, progress=None):
+    """Bulk-load ``users`` users and ``inspections`` inspections.
+    
+    All generated users share one bcrypt hash of ``password``, computed once.
+    Returns a dict of row counts per table.
+    """
+    progress = progress or (lambda message: logger.info(message))
+    generator = DataGenerator(seed=seed, days=days)
+    shard_router = current_app.extensions.get('shard_router')
+    counts = {'users': 0, 'inspections': 0, 'inspection_status_events': 0}
+    
+    hasher = User()
+    hasher.set_password(password)
+    
+    def run(table, engine, rows, label):
+        started = time.perf_counter()
+        loader = LOADERS[method](engine)
+        for loaded in loader.load(table, _batches(rows, batch_size)):
+            counts[label] += loaded
+            elapsed = time.perf_counter() - started
+            progress(f'{label}: {counts[label]} rows ({counts[label] / elapsed:,.0f} rows/s)')
+    
+    run(User.__table__, db.engine, generator.user_rows(users, prefix, hasher.password_hash), 'users')
+    user_ids = db.session.execute(
+        select(User.id).where(User.username.like(f'{prefix}\\_%', escape='\\')).order_by(User.id)
+    ).scalars().all()
+    
+    shards = {None: user_ids}
+    if shard_router is not None:
+        shards = {}
+        directory = []
+        for user_id in user_ids:
+            shard_key = shard_router.placement(user_id)
+            shards.setdefault(shard_key, []).append(user_id)
+            directory.append({'user_id': user_id, 'shard_key': shard_key, 'assigned_at': generator.now})
+        for batch in _batches(directory, batch_size):
+            db.session.execute(insert(UserShard.__table__), batch)
+        db.session.commit()
+    
+    for shard_key, shard_users in shards.items():
+        share = round(inspections * len(shard_users) / len(user_ids)) if user_ids else 0
+        with using_shard(shard_key):
+            engine = db.session.get_bind()
+            rows = generator.inspection_rows(shard_users, share)
+            if not with_events:
+                run(Inspections.__table__, engine, rows, 'inspections')
+                continue
+            
+            # Events need the inspection ids, so insert through the session per batch
+            for batch in _batches(rows, batch_size):
+                run(Inspections.__table__, engine, batch, 'inspections')
+                inserted = db.session.execute(
+                    select(Inspections.id, Inspections.inspected_by, Inspections.status, Inspections.created_at)
+                    .order_by(Inspections.id.desc())
+                    .limit(len(batch))
+                ).mappings().all()
+                db.session.commit()
+                events = (event for row in inserted for event in generator.status_event_rows(dict(row)))
+                run(InspectionStatusEvent.__table__, engine, events, 'inspection_status_events')
+    
+    return counts
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from flask import current_app
+from sqlalchemy.pool import QueuePool
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Probes run on a small shared pool. A probe that timed out keeps its worker
+# until the database answers, so at most MAX_PROBES may be queued or running;
+# beyond that a check fails at once instead of piling up threads.
+MAX_PROBES = 4
+_probes = ThreadPoolExecutor(max_workers=MAX_PROBES, thread_name_prefix='health-probe')
+_probe_slots = threading.BoundedSemaphore(MAX_PROBES)
+
+
+def pool_status(pool):
+    """Connection counts and saturation (checked out / pool size) of a pool.
+    
+    Saturation goes above 1 while overflow connections are checked out.
+    """
+    if not isinstance(pool, QueuePool):
+        return {'class': type(pool).__name__}
+    
+    size = pool.size()
+    checked_out = pool.checkedout()
+    return {
+        'class': type(pool).__name__,
+        'size': size,
+        'checked_out': checked_out,
+        'idle': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+        'saturation': round(checked_out / size, 3) if size else None
+    }
+
+
+def _select_one(engine):
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql('SELECT 1')
+    finally:
+        _probe_slots.release()
+
+
+def check_engine(engine, timeout=1.0):
+    """Run ``SELECT 1`` on a pooled connection of ``engine``.
+    
+    Saturation is reported for information only: a busy pool is not a
+    failure. The check fails when the query does not finish within
+    ``timeout`` seconds, so a probe never waits out the full pool timeout,
+    or with ``Busy`` when ``MAX_PROBES`` earlier probes are still stuck.
+    """
+    status = {'pool': pool_status(engine.pool)}
+    started = time.perf_counter()
+    if not _probe_slots.acquire(blocking=False):
+        logger.warning("Database health check skipped: %s probes still running", MAX_PROBES)
+        status.update(ok=False, error='Busy', latency_ms=0.0)
+        return status
+    
+    # The probe keeps running in the background if it times out; it returns
+    # its connection once the pool hands one over or gives up.
+    probe = _probes.submit(_select_one, engine)
+    try:
+        probe.result(timeout)
+    except FutureTimeout:
+        logger.warning("Database health check timed out after %ss", timeout)
+        status.update(ok=False, error='Timeout')
+    except Exception as e:
+        logger.warning("Database health check failed: %s", e)
+        status.update(ok=False, error=type(e).__name__)
+    else:
+        status['ok'] = True
+    status['latency_ms'] = round((time.perf_counter() - started) * 1000, 3)
+    return status
+
+
+class HealthCheck:
+    """Database readiness of every bind, cached for ``ttl`` seconds.
+    
+    A bind is not ready when ``SELECT 1`` takes longer than ``timeout``.
+    
+    One caller refreshes an expired result at a time; probes arriving
+    meanwhile get the previous result instead of queueing behind it.
+    Replicas are reported but optional, since reads fall back to the primary.
+    """
+    
+    def __init__(self, ttl=2.0, timeout=1.0, clock=time.monotonic):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        self._result = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+    
+    def status(self, engines, optional=()):
+        """``(result, cached)`` for ``engines``, a mapping of bind key to engine"""
+        result = self._result
+        if result is not None and self.clock() - self._checked_at < self.ttl:
+            return result, True
+        
+        if not self._lock.acquire(blocking=result is None):
+            return result, True
+        try:
+            result = self._check(engines, optional)
+            self._result, self._checked_at = result, self.clock()
+            return result, False
+        finally:
+            self._lock.release()
+    
+    def _check(self, engines, optional):
+        databases = {}
+        for key, engine in engines.items():
+            status = check_engine(engine, self.timeout)
+            status['required'] = key not in optional
+            databases[key or 'default'] = status
+        ready = all(status['ok'] for status in databases.values() if status['required'])
+        return {
+            'status': 'ready' if ready else 'unavailable',
+            'checked_at': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'databases': databases
+        }
+    
+    def clear(self):
+        self._result = None
+
+
+def readiness():
+    """Readiness response body and status code of the current app"""
+    from app.extensions import db
+    
+    router = current_app.extensions.get('replica_router')
+    optional = router.bind_keys if router is not None else ()
+    result, cached = current_app.extensions['health_check'].status(db.engines, optional)
+    return dict(result, cached=cached), 200 if result['status'] == 'ready' else 503
+
+
+def init_health(app):
+    app.extensions['health_check'] = HealthCheck(
+        ttl=app.config['HEALTH_CHECK_TTL_SECONDS'],
+        timeout=app.config['HEALTH_CHECK_TIMEOUT_SECONDS']
+    )
\ No newline at end of file
@@ -1,37 +1,139 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+import json
 import os
+import random
+import zlib
 from functools import wraps
+from app.core.tracing import RequestIdFilter, current_request_id
 
-def setup_logger():
-    """Setup application logger"""
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'request_id', '_sampled'}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the request ID and any ``extra`` fields"""
+    
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None)
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of records below WARNING per logger; warnings and errors always pass.
+    
+    Rates are matched on the longest logger name prefix (``app.inspections``
+    covers ``app.inspections.services``). Within a request the decision is
+    derived from the request ID, so a sampled request keeps all of its lines
+    and a dropped one loses all of them.
+    """
+    
+    def __init__(self, rates):
+        super().__init__()
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+    
+    def rate_for(self, name):
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + '.'):
+                return rate
+        return 1.0
+    
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        # Decide once per record so every handler agrees
+        sampled = getattr(record, '_sampled', None)
+        if sampled is None:
+            rate = self.rate_for(record.name)
+            if rate >= 1.0:
+                sampled = True
+            else:
+                request_id = current_request_id()
+                draw = zlib.crc32(request_id.encode()) / 0xFFFFFFFF if request_id else random.random()
+                sampled = draw < rate
+            record._sampled = sampled
+        return sampled
+
+def parse_sample_rates(value):
+    """``{'logger': rate}`` from a dict or a ``"logger=rate,other=rate"`` string"""
+    if isinstance(value, dict):
+        return {name: float(rate) for name, rate in value.items()}
+    rates = {}
+    for item in (value or '').split(','):
+        if item.strip():
+            name, rate = item.split('=', 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
+def setup_logger(config=None):
+    """Setup application logger
+    
+    Replaces the handlers installed by a previous call, so it is safe to call
+    for every app created in the process. Handlers are kept (and the log
+    file is not reopened) when the logging settings did not change.
+    """
+    config = config or {}
+    log_file = config.get('LOG_FILE', 'logs/app.log')
+    log_format = config.get('LOG_FORMAT', 'text')
+    sample_rates = parse_sample_rates(config.get('LOG_SAMPLE_RATES'))
+    settings = (os.path.abspath(log_file), log_format, sorted(sample_rates.items()))
+    
+    root = logging.getLogger()
+    root.setLevel(config.get('LOG_LEVEL', 'INFO'))
+    installed = [handler for handler in root.handlers if getattr(handler, 'app_handler', None)]
+    if installed and all(handler.app_handler == settings for handler in installed):
+        return logging.getLogger(__name__)
     
     # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-    
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('logs/app.log'),
-            logging.StreamHandler()  # Console output
-        ]
-    )
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+    
+    if log_format == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+    sampling = SamplingFilter(sample_rates)
+    
+    # Every line carries the ID of the request that logged it
+    handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler()  # Console output
+    ]
+    for handler in installed:
+        root.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        handler.app_handler = settings
+        handler.addFilter(RequestIdFilter())
+        handler.addFilter(sampling)
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
     
     return logging.getLogger(__name__)
 
 # Fixed request logger decorator
 def log_request(func):
     """Decorator to log API requests"""
+    logger = logging.getLogger(__name__)
+    
     @wraps(func)  # This preserves the original function name
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(__name__)
-        logger.info(f"Request: {func.__name__} - {datetime.now()}")
+        logger.info('Request: %s', func.__name__)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"Success: {func.__name__}")
+            logger.info('Success: %s', func.__name__)
             return result
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {str(e)}")
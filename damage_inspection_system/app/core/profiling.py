@@ -0,0 +1,140 @@
+from collections import Counter
+from flask import current_app, g, request
+from flask_jwt_extended import verify_jwt_in_request
+import hmac
+import logging
+import random
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def collapse(frame):
+    """Root-first ``module:function`` stack of ``frame`` joined by semicolons"""
+    names = []
+    while frame is not None:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """Samples the stack of one thread every ``interval`` seconds from a helper thread.
+    
+    Sampling granularity is bounded by the interpreter's switch interval
+    (``sys.getswitchinterval()``, 5 ms by default), since the helper thread
+    needs the GIL to read the frames.
+    """
+    
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop sampling and return the collapsed stack counts"""
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+
+
+class ProfileStore:
+    """Collapsed stack counts aggregated per endpoint"""
+    
+    def __init__(self, max_stacks=5000):
+        self.max_stacks = max_stacks
+        self._profiles = {}
+        self._lock = threading.Lock()
+    
+    def add(self, endpoint, stacks):
+        with self._lock:
+            profile = self._profiles.setdefault(endpoint, {'requests': 0, 'samples': 0, 'stacks': Counter()})
+            profile['requests'] += 1
+            for stack, count in stacks.items():
+                profile['samples'] += count
+                # Keep counting known stacks once full, drop new distinct ones
+                if stack in profile['stacks'] or len(profile['stacks']) < self.max_stacks:
+                    profile['stacks'][stack] += count
+    
+    def summary(self):
+        """Profiled requests and samples per endpoint"""
+        with self._lock:
+            return {
+                endpoint: {'requests': profile['requests'], 'samples': profile['samples']}
+                for endpoint, profile in sorted(self._profiles.items())
+            }
+    
+    def collapsed(self, endpoint):
+        """Brendan Gregg's collapsed format (``stack count`` lines), or None if unknown"""
+        with self._lock:
+            profile = self._profiles.get(endpoint)
+            if profile is None:
+                return None
+            return ''.join(f'{stack} {count}\n' for stack, count in profile['stacks'].most_common())
+    
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+
+def _header_allowed(value):
+    """Whether a profiling header may profile the current request.
+    
+    The header must carry ``PROFILER_HEADER_SECRET`` or come with an admin's
+    access token, so clients cannot make the server profile their requests.
+    """
+    secret = current_app.config['PROFILER_HEADER_SECRET']
+    if secret and hmac.compare_digest(value.encode(), secret.encode()):
+        return True
+    
+    from app.auth.utils import get_current_user, is_admin
+    try:
+        if verify_jwt_in_request(optional=True) is None:
+            return False
+    except Exception:
+        return False
+    return is_admin(get_current_user())
+
+
+def init_profiler(app):
+    """Register the sampling profiler hooks when ``PROFILER_ENABLED`` is set.
+    
+    When disabled no hooks are installed, so unprofiled apps pay nothing.
+    """
+    if not app.config['PROFILER_ENABLED']:
+        app.extensions['profiler'] = None
+        return
+    
+    store = ProfileStore(max_stacks=app.config['PROFILER_MAX_STACKS'])
+    
+    @app.before_request
+    def _start_profiling():
+        config = current_app.config
+        sample_rate = config['PROFILER_SAMPLE_RATE']
+        header = request.headers.get(config['PROFILER_HEADER'])
+        if (header and _header_allowed(header)) or (sample_rate and random.random() < sample_rate):
+            g._profiler = StackSampler(threading.get_ident(), config['PROFILER_INTERVAL_SECONDS']).start()
+    
+    @app.teardown_request
+    def _stop_profiling(exc):
+        sampler = g.pop('_profiler', None)
+        if sampler is not None:
+            endpoint = request.endpoint or request.path
+            store.add(endpoint, sampler.stop())
+    
+    app.extensions['profiler'] = store
+    logger.info(f"Request profiler enabled (sample rate {app.config['PROFILER_SAMPLE_RATE']}, "
+                f"header {app.config['PROFILER_HEADER']})")
\ No newline at end of file
@@ -0,0 +1,184 @@
+from collections import namedtuple
+from flask import current_app, g, jsonify, request
+from flask_jwt_extended import get_jwt_identity
+from functools import wraps
+import abc
+import importlib
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+# Limits configured by the RATE_LIMIT_<NAME> settings
+LIMITS = ('auth', 'inspections')
+
+
+class Rate(namedtuple('Rate', ['limit', 'period'])):
+    """``limit`` requests per ``period`` seconds; the bucket holds ``limit`` tokens"""
+    
+    __slots__ = ()
+    
+    @property
+    def interval(self):
+        """Seconds to refill one token"""
+        return self.period / self.limit
+
+
+def parse_rate(value):
+    """``Rate`` from ``"<requests>/<second|minute|hour|day>"``, e.g. ``"10/minute"``"""
+    limit, _, period = value.partition('/')
+    period = period.strip().lower().rstrip('s')
+    if period not in PERIODS:
+        raise ValueError(f'Unknown rate limit period in {value!r}')
+    return Rate(int(limit), PERIODS[period])
+
+
+class RateLimitBackend(abc.ABC):
+    """Storage of bucket state, shared by every limit.
+    
+    Implement ``consume`` to keep buckets somewhere shared by all workers
+    (Redis, memcached); select the class with ``RATE_LIMIT_BACKEND =
+    "module:Class"``, it is instantiated with the app.
+    """
+    
+    @abc.abstractmethod
+    def consume(self, key, rate):
+        """Take a token from ``key``'s bucket: ``(allowed, remaining, retry_after)``"""
+
+
+class MemoryBackend(RateLimitBackend):
+    """Token buckets of this process, one float per key.
+    
+    A bucket is stored as the time it will be full again (GCRA): taking a
+    token moves it one refill interval later, and the request is refused
+    when that is more than a full bucket (``rate.period``) away. Buckets at
+    or past that time are full and equal to a missing key, so when more than
+    ``max_keys`` are stored the full ones are dropped, then the oldest.
+    """
+    
+    def __init__(self, max_keys=100000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._full_at = {}
+        self._lock = threading.Lock()
+    
+    def consume(self, key, rate):
+        interval = rate.interval
+        with self._lock:
+            now = self.clock()
+            full_at = max(self._full_at.get(key, now), now) + interval
+            wait = full_at - now - rate.period
+            if wait > 0:
+                return False, 0, wait
+            if key not in self._full_at and len(self._full_at) >= self.max_keys:
+                self._evict(now)
+            self._full_at[key] = full_at
+            return True, int((rate.period - (full_at - now)) / interval + 1e-9), 0.0
+    
+    def _evict(self, now):
+        self._full_at = {key: full_at for key, full_at in self._full_at.items() if full_at > now}
+        excess = len(self._full_at) - self.max_keys * 9 // 10
+        for key in list(self._full_at)[:max(excess, 0)]:
+            del self._full_at[key]
+    
+    def __len__(self):
+        return len(self._full_at)
+    
+    def clear(self):
+        with self._lock:
+            self._full_at.clear()
+
+
+class RateLimiter:
+    """Checks requests against the ``RATE_LIMIT_*`` rates of the app config"""
+    
+    def __init__(self, backend, rates):
+        self.backend = backend
+        self.rates = rates
+    
+    def hit(self, name, key):
+        """``(allowed, remaining, retry_after)`` for one request on limit ``name``"""
+        try:
+            return self.backend.consume(f'{name}:{key}', self.rates[name])
+        except Exception as e:
+            # A shared store being down must not take the API down with it
+            logger.warning(f"Rate limit backend failed, allowing request: {str(e)}")
+            return True, None, 0.0
+
+
+def client_ip():
+    """Key of the auth limits (run behind ProxyFix when there is a proxy in front)"""
+    return request.remote_addr or 'unknown'
+
+
+def user_identity():
+    """Key of the per-user limits; use below ``@auth_required`` or ``@jwt_required()``"""
+    user_id = g.get('current_user_id')
+    return str(user_id if user_id is not None else get_jwt_identity())
+
+
+def _check(name, key_func):
+    limiter = current_app.extensions.get('rate_limiter')
+    if limiter is None:
+        return None
+    
+    key = key_func()
+    allowed, remaining, retry_after = limiter.hit(name, key)
+    g.rate_limit = (limiter.rates[name].limit, remaining)
+    if allowed:
+        return None
+    
+    logger.warning(f"Rate limit {name} exceeded by {key}")
+    response = jsonify({'error': 'Too many requests'})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(math.ceil(retry_after), 1))
+    return response
+
+
+def rate_limit(name, key=client_ip):
+    """Decorator refusing requests over limit ``name`` with 429 and Retry-After.
+    
+    ``name`` is one of ``LIMITS`` and ``key`` returns the bucket key of the
+    current request.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            refused = _check(name, key)
+            if refused is not None:
+                return refused
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def load_backend(app):
+    backend = app.config['RATE_LIMIT_BACKEND']
+    if backend == 'memory':
+        return MemoryBackend(max_keys=app.config['RATE_LIMIT_MAX_KEYS'])
+    module_name, _, class_name = backend.partition(':')
+    return getattr(importlib.import_module(module_name), class_name)(app)
+
+
+def init_rate_limiter(app):
+    """Create the limiter and add X-RateLimit-* headers to limited responses"""
+    if not app.config['RATE_LIMIT_ENABLED']:
+        app.extensions['rate_limiter'] = None
+        return
+    
+    rates = {name: parse_rate(app.config[f'RATE_LIMIT_{name.upper()}']) for name in LIMITS}
+    
+    @app.after_request
+    def _rate_limit_headers(response):
+        state = g.pop('rate_limit', None)
+        if state is not None:
+            limit, remaining = state
+            response.headers['X-RateLimit-Limit'] = str(limit)
+            if remaining is not None:
+                response.headers['X-RateLimit-Remaining'] = str(remaining)
+        return response
+    
+    app.extensions['rate_limiter'] = RateLimiter(load_backend(app), rates)
\ No newline at end of file
@@ -0,0 +1,214 @@
+from flask import current_app, g, has_app_context
+from flask_sqlalchemy.session import Session
+from functools import wraps
+from sqlalchemy import event
+import sqlalchemy as sa
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingSession(Session):
+    """Session that routes sharded models to the active user shard and sends
+    reads marked with ``read_replica`` to a replica.
+    
+    Everything else - flushes, reads after a write in the same transaction and
+    reads by a client that wrote recently - goes to the primary.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        shard_key = g.get('_shard_key') if bind is None else None
+        if shard_key is not None and _is_sharded(mapper):
+            return self._db.engines[shard_key]
+        
+        if bind is None and not self._flushing and not self.info.get('wrote'):
+            router = current_app.extensions.get('replica_router')
+            if router is not None and g.get('_read_replica') and not _is_sticky(router):
+                engine = router.pick()
+                if engine is not None:
+                    return engine
+        
+        # Flask-SQLAlchemy ignores Session(bind=...); honour it for the default
+        # bind so a session can be joined to an external connection (test fixtures)
+        if bind is None and self.bind is not None:
+            return self.bind
+        
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _is_sharded(mapper):
+    """Whether a query for ``mapper`` belongs on the user shard.
+    
+    Statements without a mapper (core selects over subqueries) follow the
+    active shard as well; only models not marked ``__sharded__`` stay global.
+    """
+    if mapper is None:
+        return True
+    mapper = sa.inspect(mapper)
+    return getattr(mapper.class_, '__sharded__', False)
+
+
+def read_replica(func):
+    """Decorator marking a read-only function whose queries may use a replica"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = g.get('_read_replica', False)
+        g._read_replica = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            g._read_replica = previous
+    return wrapper
+
+
+def default_lag_probe(engine):
+    """Replication lag of a replica in seconds, or None if replication is broken"""
+    if engine.dialect.name != 'mysql':
+        return 0.0
+    
+    with engine.connect() as connection:
+        try:
+            row = connection.exec_driver_sql('SHOW REPLICA STATUS').mappings().first()
+        except Exception:
+            # MySQL < 8.0.22
+            row = connection.exec_driver_sql('SHOW SLAVE STATUS').mappings().first()
+    
+    if row is None:
+        # Not a replica (e.g. a read endpoint of a managed cluster)
+        return 0.0
+    lag = row.get('Seconds_Behind_Source', row.get('Seconds_Behind_Master'))
+    return float(lag) if lag is not None else None
+
+
+class ReplicaRouter:
+    """Chooses a healthy replica bind and tracks recent writers for stickiness"""
+    
+    def __init__(self, bind_keys, sticky_seconds=5.0, max_lag_seconds=10.0,
+                 lag_check_interval=5.0, lag_probe=default_lag_probe):
+        self.bind_keys = list(bind_keys)
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self.lag_probe = lag_probe
+        self._counter = itertools.count()
+        self._lag = {}
+        self._recent_writes = {}
+        self._lock = threading.Lock()
+    
+    def pick(self):
+        """Engine of the next healthy replica in round-robin order, or None"""
+        from app.extensions import db
+        
+        start = next(self._counter)
+        for offset in range(len(self.bind_keys)):
+            key = self.bind_keys[(start + offset) % len(self.bind_keys)]
+            engine = db.engines[key]
+            if self._is_healthy(key, engine):
+                return engine
+        return None
+    
+    def _is_healthy(self, key, engine):
+        now = time.monotonic()
+        with self._lock:
+            checked_at, lag = self._lag.get(key, (None, None))
+        if checked_at is None or now - checked_at >= self.lag_check_interval:
+            # Probe outside the lock; it is a query on the replica
+            try:
+                lag = self.lag_probe(engine)
+            except Exception as e:
+                logger.warning(f"Replica {key} lag check failed: {str(e)}")
+                lag = None
+            with self._lock:
+                self._lag[key] = (now, lag)
+            if lag is None or lag > self.max_lag_seconds:
+                logger.warning(f"Replica {key} skipped, lag: {lag}")
+        return lag is not None and lag <= self.max_lag_seconds
+    
+    def mark_write(self, identity):
+        """Pin reads of ``identity`` to the primary for the sticky window"""
+        now = time.monotonic()
+        with self._lock:
+            self._recent_writes[identity] = now
+            if len(self._recent_writes) > 10000:
+                self._recent_writes = {
+                    key: at for key, at in self._recent_writes.items()
+                    if now - at < self.sticky_seconds
+                }
+    
+    def is_sticky(self, identity):
+        """Whether ``identity`` wrote within the sticky window"""
+        at = self._recent_writes.get(identity)
+        return at is not None and time.monotonic() - at < self.sticky_seconds
+
+
+def _current_identity():
+    """User of the current request (API key or JWT identity), if any"""
+    from flask_jwt_extended import get_jwt_identity
+    
+    if g.get('current_user_id') is not None:
+        return g.current_user_id
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        return None
+
+
+def _is_sticky(router):
+    if g.get('_replica_sticky'):
+        return True
+    identity = _current_identity()
+    return identity is not None and router.is_sticky(identity)
+
+
+def init_replicas(app):
+    """Register replica binds from ``SQLALCHEMY_REPLICA_URIS`` and the router"""
+    uris = app.config.get('SQLALCHEMY_REPLICA_URIS') or []
+    if isinstance(uris, str):
+        uris = [uri.strip() for uri in uris.split(',') if uri.strip()]
+    
+    if not uris:
+        app.extensions['replica_router'] = None
+        return
+    
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    keys = []
+    for index, uri in enumerate(uris):
+        key = f'replica_{index}'
+        binds[key] = uri
+        keys.append(key)
+    app.config['SQLALCHEMY_BINDS'] = binds
+    
+    app.extensions['replica_router'] = ReplicaRouter(
+        keys,
+        sticky_seconds=app.config['REPLICA_STICKY_SECONDS'],
+        max_lag_seconds=app.config['REPLICA_MAX_LAG_SECONDS'],
+        lag_check_interval=app.config['REPLICA_LAG_CHECK_INTERVAL']
+    )
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _track_write(session, flush_context):
+    session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _stick_after_write(session):
+    if not session.info.pop('wrote', False) or not has_app_context():
+        return
+    
+    router = current_app.extensions.get('replica_router')
+    if router is None:
+        return
+    
+    g._replica_sticky = True
+    identity = _current_identity()
+    if identity is not None:
+        router.mark_write(identity)
+
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _forget_write(session):
+    session.info.pop('wrote', None)
@@ -0,0 +1,27 @@
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def after_fork(app):
+    """Reset state a pre-forking server's worker inherits from the parent.
+    
+    With ``preload_app`` the app and its engines are created once in the
+    master and shared copy-on-write. Pooled connections must not be shared
+    between processes, so the worker drops its copies without closing the
+    sockets the parent still owns; background threads do not survive fork
+    and are restarted.
+    """
+    from app.extensions import db
+    
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        engine.dispose(close=False)
+    
+    exporter = app.extensions.get('tracing')
+    if exporter is not None and hasattr(exporter, 'after_fork'):
+        exporter.after_fork()
+    
+    logger.info(f"Worker {os.getpid()} reset {len(engines)} engine pool(s) after fork")
\ No newline at end of file
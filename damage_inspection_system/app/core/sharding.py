@@ -0,0 +1,293 @@
+from contextlib import contextmanager
+from flask import current_app, g
+from functools import wraps
+from sqlalchemy import MetaData, delete, insert, select
+import bisect
+import hashlib
+import inspect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Rows copied per statement when moving a user between shards
+MOVE_BATCH_SIZE = 500
+
+
+class ShardMoveError(Exception):
+    """Raised when a user's rows cannot be moved to another shard"""
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.md5(str(value).encode('utf-8')).digest()[:8], 'big')
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys to nodes through virtual nodes"""
+    
+    def __init__(self, nodes, vnodes=64):
+        self.nodes = list(nodes)
+        self.vnodes = vnodes
+        points = sorted(
+            (_hash(f'{node}#{index}'), node)
+            for node in self.nodes
+            for index in range(vnodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+    
+    def get_node(self, key):
+        """Node owning ``key``: the first virtual node clockwise from its hash"""
+        if not self._nodes:
+            raise ValueError('Hash ring has no nodes')
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
+
+
+def _sharded_tables():
+    from app.inspections.models import Inspections, InspectionArchive, InspectionStatusEvent
+    return Inspections.__table__, InspectionArchive.__table__, InspectionStatusEvent.__table__
+
+
+def shard_tables():
+    """Copies of the sharded tables for shard binds.
+    
+    Foreign keys to tables outside the shard (users lives on the default bind
+    only) are left out so the DDL is valid on a shard server.
+    """
+    tables = _sharded_tables()
+    names = {table.name for table in tables}
+    metadata = MetaData()
+    copies = []
+    for table in tables:
+        copy = table.to_metadata(metadata)
+        for constraint in list(copy.foreign_key_constraints):
+            if constraint.elements[0].target_fullname.split('.')[0] not in names:
+                copy.constraints.discard(constraint)
+                for foreign_key in constraint.elements:
+                    foreign_key.parent.foreign_keys.discard(foreign_key)
+                    copy.foreign_keys.discard(foreign_key)
+        copies.append(copy)
+    return copies
+
+
+def _chunks(values, size=MOVE_BATCH_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class ShardRouter:
+    """Maps user ids to shard binds.
+    
+    New users are placed with the hash ring and pinned in the ``user_shards``
+    directory, so changing the ring only moves users when ``rebalance`` runs.
+    """
+    
+    def __init__(self, bind_keys, vnodes=64, cache_seconds=60.0):
+        self.bind_keys = list(bind_keys)
+        self.ring = HashRing(self.bind_keys, vnodes=vnodes)
+        self.cache_seconds = cache_seconds
+        self._assignments = {}
+        self._lock = threading.Lock()
+    
+    def placement(self, user_id):
+        """Shard the hash ring assigns to ``user_id``"""
+        return self.ring.get_node(int(user_id))
+    
+    def shard_for_user(self, user_id):
+        """Shard currently holding the rows of ``user_id``"""
+        from app.extensions import db
+        from app.users.models import UserShard
+        
+        user_id = int(user_id)
+        now = time.monotonic()
+        cached = self._assignments.get(user_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        assignment = db.session.get(UserShard, user_id)
+        shard_key = assignment.shard_key if assignment else self.placement(user_id)
+        with self._lock:
+            if len(self._assignments) > 100000:
+                self._assignments.clear()
+            self._assignments[user_id] = (shard_key, now + self.cache_seconds)
+        return shard_key
+    
+    def assign(self, user_id):
+        """Pin a new user to its ring placement (committed by the caller)"""
+        from app.extensions import db
+        from app.users.models import UserShard
+        
+        shard_key = self.placement(user_id)
+        db.session.add(UserShard(user_id=user_id, shard_key=shard_key))
+        return shard_key
+    
+    def forget(self, user_id):
+        """Drop the cached assignment of ``user_id``"""
+        self._assignments.pop(int(user_id), None)
+    
+    def create_all(self):
+        """Create the sharded tables on every shard"""
+        from app.extensions import db
+        
+        for key in self.bind_keys:
+            tables = shard_tables()
+            tables[0].metadata.create_all(db.engines[key], tables=tables)
+    
+    def plan_rebalance(self):
+        """(user_id, from, to) for pinned users whose ring placement changed"""
+        from app.extensions import db
+        from app.users.models import UserShard
+        
+        moves = []
+        for assignment in db.session.execute(select(UserShard).order_by(UserShard.user_id)).scalars():
+            target = self.placement(assignment.user_id)
+            if target != assignment.shard_key:
+                moves.append((assignment.user_id, assignment.shard_key, target))
+        return moves
+    
+    def rebalance(self, dry_run=False):
+        """Move every user whose ring placement changed. Returns the planned moves."""
+        moves = self.plan_rebalance()
+        if not dry_run:
+            for user_id, _, target in moves:
+                self.move_user(user_id, target)
+        return moves
+    
+    def move_user(self, user_id, target_key):
+        """Copy a user's inspections to ``target_key``, repoint the directory and
+        delete them from the old shard.
+        
+        Inspection ids are only unique within a shard, so the copies get new
+        ids from the target and their status events are repointed to them.
+        Writes for the user made while the move runs can be lost, so run it
+        when the user is quiet. Returns the number of inspections moved.
+        """
+        from app.extensions import db
+        from app.users.models import UserShard
+        
+        if target_key not in self.bind_keys:
+            raise ShardMoveError(f'Unknown shard {target_key}')
+        
+        user_id = int(user_id)
+        self.forget(user_id)
+        source_key = self.shard_for_user(user_id)
+        if source_key == target_key:
+            return 0
+        
+        inspections, archive, events = _sharded_tables()
+        source = db.engines[source_key]
+        target = db.engines[target_key]
+        
+        with source.connect() as connection:
+            live_rows = connection.execute(
+                select(inspections).where(inspections.c.inspected_by == user_id)
+            ).mappings().all()
+            archived_rows = connection.execute(
+                select(archive).where(archive.c.inspected_by == user_id)
+            ).mappings().all()
+            ids = [row['id'] for row in live_rows] + [row['id'] for row in archived_rows]
+            event_rows = []
+            for chunk in _chunks(ids):
+                event_rows.extend(connection.execute(
+                    select(events).where(events.c.inspection_id.in_(chunk))
+                ).mappings().all())
+        
+        with target.begin() as connection:
+            new_ids = {}
+            for row in live_rows:
+                values = {key: value for key, value in row.items() if key != 'id'}
+                new_ids[row['id']] = connection.execute(insert(inspections), values).inserted_primary_key[0]
+            # Archived rows keep their inspection id, so draw theirs from the
+            # live table too; its sequence never hands a deleted id out again
+            for row in archived_rows:
+                values = {key: value for key, value in row.items() if key not in ('id', 'archived_at')}
+                new_ids[row['id']] = connection.execute(insert(inspections), values).inserted_primary_key[0]
+            archived_ids = [new_ids[row['id']] for row in archived_rows]
+            for chunk in _chunks(archived_ids):
+                connection.execute(delete(inspections).where(inspections.c.id.in_(chunk)))
+            for chunk in _chunks(archived_rows):
+                connection.execute(insert(archive), [dict(row, id=new_ids[row['id']]) for row in chunk])
+            # Event ids are local to a shard; let the target assign new ones
+            for chunk in _chunks(event_rows):
+                connection.execute(insert(events), [
+                    dict({key: value for key, value in row.items() if key != 'id'},
+                         inspection_id=new_ids[row['inspection_id']])
+                    for row in chunk
+                ])
+        
+        assignment = db.session.get(UserShard, user_id)
+        if assignment is None:
+            db.session.add(UserShard(user_id=user_id, shard_key=target_key))
+        else:
+            assignment.shard_key = target_key
+        db.session.commit()
+        self.forget(user_id)
+        
+        with source.begin() as connection:
+            for chunk in _chunks(ids):
+                connection.execute(delete(events).where(events.c.inspection_id.in_(chunk)))
+            connection.execute(delete(archive).where(archive.c.inspected_by == user_id))
+            connection.execute(delete(inspections).where(inspections.c.inspected_by == user_id))
+        
+        logger.info(f"Moved user {user_id} with {len(ids)} inspections from {source_key} to {target_key}")
+        return len(ids)
+
+
+@contextmanager
+def using_shard(shard_key):
+    """Route sharded models to ``shard_key`` within the block"""
+    previous = g.get('_shard_key')
+    g._shard_key = shard_key
+    try:
+        yield
+    finally:
+        g._shard_key = previous
+
+
+def user_shard(func):
+    """Decorator routing sharded models to the shard of the ``user_id`` argument"""
+    signature = inspect.signature(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        router = current_app.extensions.get('shard_router')
+        if router is None:
+            return func(*args, **kwargs)
+        
+        user_id = signature.bind(*args, **kwargs).arguments['user_id']
+        with using_shard(router.shard_for_user(user_id)):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def shard_keys():
+    """Shard bind keys, or ``[None]`` (the default bind) when sharding is off"""
+    router = current_app.extensions.get('shard_router')
+    return router.bind_keys if router is not None else [None]
+
+
+def init_shards(app):
+    """Register shard binds from ``SQLALCHEMY_SHARD_URIS`` and the router"""
+    uris = app.config.get('SQLALCHEMY_SHARD_URIS') or []
+    if isinstance(uris, str):
+        uris = [uri.strip() for uri in uris.split(',') if uri.strip()]
+    
+    if not uris:
+        app.extensions['shard_router'] = None
+        return
+    
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    keys = []
+    for index, uri in enumerate(uris):
+        key = f'shard_{index}'
+        binds[key] = uri
+        keys.append(key)
+    app.config['SQLALCHEMY_BINDS'] = binds
+    
+    app.extensions['shard_router'] = ShardRouter(
+        keys,
+        vnodes=app.config['SHARD_RING_VNODES'],
+        cache_seconds=app.config['SHARD_DIRECTORY_CACHE_SECONDS']
+    )
@@ -0,0 +1,143 @@
+from collections import deque
+from datetime import datetime
+from flask import has_request_context, request
+from sqlalchemy import event
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIXES = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'mysql': 'EXPLAIN ',
+    'mariadb': 'EXPLAIN ',
+    'postgresql': 'EXPLAIN '
+}
+
+
+class SlowQueryLog:
+    """Keeps the most recent statements slower than ``threshold`` seconds.
+    
+    Entries hold the SQL, duration, bind, calling endpoint and optionally the
+    bound parameters and EXPLAIN plan. They are kept in a fixed-size ring
+    buffer for the admin endpoint and written as JSON lines to the slow query
+    log. Parameters may carry user data, so they are only recorded when
+    ``parameters`` is set.
+    """
+    
+    def __init__(self, threshold=0.5, capacity=100, explain=False, parameters=False, log=None):
+        self.threshold = threshold
+        self.explain = explain
+        self.parameters = parameters
+        self.log = log or logging.getLogger('slow_queries')
+        self._entries = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+    
+    def attach(self, engine, bind_key=None):
+        """Time every statement executed on ``engine``"""
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute',
+                     lambda *args: self._after_cursor_execute(bind_key, *args))
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('slow_query_start', []).append(time.perf_counter())
+    
+    def _after_cursor_execute(self, bind_key, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['slow_query_start'].pop()
+        if duration < self.threshold:
+            return
+        
+        entry = {
+            'at': datetime.utcnow().isoformat(),
+            'duration_ms': round(duration * 1000, 3),
+            'sql': statement,
+            'parameters': _loggable(parameters) if self.parameters else None,
+            'executemany': executemany,
+            'bind': bind_key or 'default',
+            'endpoint': request.endpoint if has_request_context() else None,
+            'request': f'{request.method} {request.path}' if has_request_context() else None
+        }
+        if self.explain and not executemany:
+            entry['explain'] = self._explain(conn, statement, parameters)
+        
+        with self._lock:
+            self._entries.append(entry)
+        self.log.warning(json.dumps(entry, default=str))
+    
+    def _explain(self, conn, statement, parameters):
+        """Plan of a SELECT, run on a raw cursor so it is not timed itself"""
+        prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None or not statement.lstrip().upper().startswith('SELECT'):
+            return None
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(prefix + statement, parameters)
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, _loggable(row))) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {str(e)}")
+            return None
+    
+    def entries(self, limit=None):
+        """Recorded entries, newest first"""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _loggable(value):
+    """JSON-friendly copy of DB-API parameters or result rows"""
+    if isinstance(value, dict):
+        return {key: _loggable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_loggable(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, bytes):
+        return f'<{len(value)} bytes>'
+    return str(value)
+
+
+def _file_logger(path):
+    """Logger writing slow queries to ``path`` only, configured once per file"""
+    log = logging.getLogger('slow_queries')
+    log.propagate = False
+    path = os.path.abspath(path)
+    if not any(getattr(handler, 'baseFilename', None) == path for handler in log.handlers):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+        log.addHandler(handler)
+    log.setLevel(logging.WARNING)
+    return log
+
+
+def init_slow_query_log(app):
+    """Attach the slow query log to every engine of ``app`` when enabled"""
+    from app.extensions import db
+    
+    if not app.config['SLOW_QUERY_LOG_ENABLED']:
+        app.extensions['slow_query_log'] = None
+        return
+    
+    slow_query_log = SlowQueryLog(
+        threshold=app.config['SLOW_QUERY_SECONDS'],
+        capacity=app.config['SLOW_QUERY_BUFFER_SIZE'],
+        explain=app.config['SLOW_QUERY_EXPLAIN'],
+        parameters=app.config['SLOW_QUERY_LOG_PARAMETERS'],
+        log=_file_logger(app.config['SLOW_QUERY_LOG_FILE'])
+    )
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            slow_query_log.attach(engine, bind_key)
+    app.extensions['slow_query_log'] = slow_query_log
\ No newline at end of file
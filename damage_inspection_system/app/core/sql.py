@@ -0,0 +1,37 @@
+from sqlalchemy import Float
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class seconds_between(FunctionElement):
+    """Number of seconds elapsed between two datetime expressions (end - start)"""
+    type = Float()
+    name = 'seconds_between'
+    inherit_cache = True
+
+
+@compiles(seconds_between)
+def _seconds_between_default(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return 'EXTRACT(EPOCH FROM (%s - %s))' % (
+        compiler.process(end, **kw),
+        compiler.process(start, **kw)
+    )
+
+
+@compiles(seconds_between, 'mysql')
+def _seconds_between_mysql(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return 'TIMESTAMPDIFF(MICROSECOND, %s, %s) / 1000000.0' % (
+        compiler.process(start, **kw),
+        compiler.process(end, **kw)
+    )
+
+
+@compiles(seconds_between, 'sqlite')
+def _seconds_between_sqlite(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return '((julianday(%s) - julianday(%s)) * 86400.0)' % (
+        compiler.process(end, **kw),
+        compiler.process(start, **kw)
+    )
@@ -0,0 +1,129 @@
+from collections import namedtuple
+import abc
+import hashlib
+import importlib
+import logging
+import os
+import re
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes of the accepted image types, and the extension stored for each
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+)
+SIGNATURE_LENGTH = max(len(signature) for signature, _ in IMAGE_SIGNATURES)
+_STORED_NAME = re.compile(r'^[0-9a-f]{64}\.(jpg|png)$')
+
+StoredFile = namedtuple('StoredFile', ['name', 'sha256', 'size', 'created'])
+
+
+class UploadError(Exception):
+    """Raised when an upload is rejected; ``status`` is the HTTP status to return"""
+    
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def image_extension(header):
+    """Extension of the image type ``header`` starts with, None if not an accepted image"""
+    for signature, extension in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return extension
+    return None
+
+
+class Storage(abc.ABC):
+    """Content-addressed image store: files are named ``<sha256>.<ext>``.
+    
+    ``save`` reads a stream in chunks and returns a ``StoredFile``; storing
+    bytes that are already there keeps the existing file (``created`` is
+    False). Implement ``save`` and ``path`` for another backend and select it
+    with ``UPLOAD_STORAGE = "module:Class"``; it is instantiated with the app.
+    """
+    
+    @abc.abstractmethod
+    def save(self, stream, max_bytes):
+        """Store ``stream`` (at most ``max_bytes``) and return a ``StoredFile``"""
+    
+    @abc.abstractmethod
+    def path(self, name):
+        """Local path of a stored file, or None if there is no such file"""
+
+
+class LocalFileStorage(Storage):
+    """Stores files under ``root/<first two hex digits>/<sha256>.<ext>``.
+    
+    Uploads are written to a temporary file in ``root/.tmp`` while they are
+    hashed, then renamed into place, so readers never see a partial file and
+    concurrent uploads of the same image leave one copy.
+    """
+    
+    def __init__(self, root, chunk_size=64 * 1024):
+        self.root = os.path.abspath(root)
+        self.chunk_size = chunk_size
+    
+    def _read_header(self, stream):
+        header = b''
+        while len(header) < SIGNATURE_LENGTH:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                break
+            header += chunk
+        return header
+    
+    def save(self, stream, max_bytes):
+        header = self._read_header(stream)
+        extension = image_extension(header)
+        if extension is None:
+            raise UploadError('Only JPEG and PNG images are accepted', 415)
+        
+        tmp_dir = os.path.join(self.root, '.tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            try:
+                chunk = header
+                while chunk:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise UploadError(f'Image exceeds {max_bytes} bytes', 413)
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    chunk = stream.read(self.chunk_size)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        
+        name = f'{digest.hexdigest()}.{extension}'
+        target = os.path.join(self.root, name[:2], name)
+        if os.path.exists(target):
+            os.unlink(tmp.name)
+            return StoredFile(name, digest.hexdigest(), size, False)
+        
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, target)
+        logger.info(f"Stored upload {name} ({size} bytes)")
+        return StoredFile(name, digest.hexdigest(), size, True)
+    
+    def path(self, name):
+        if not _STORED_NAME.match(name):
+            return None
+        path = os.path.join(self.root, name[:2], name)
+        return path if os.path.isfile(path) else None
+
+
+def init_storage(app):
+    backend = app.config['UPLOAD_STORAGE']
+    if backend == 'local':
+        storage = LocalFileStorage(app.config['UPLOAD_DIR'], chunk_size=app.config['UPLOAD_CHUNK_SIZE'])
+    else:
+        module_name, _, class_name = backend.partition(':')
+        storage = getattr(importlib.import_module(module_name), class_name)(app)
+    app.extensions['upload_storage'] = storage
\ No newline at end of file
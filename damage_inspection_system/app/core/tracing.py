@@ -0,0 +1,265 @@
+from flask import g, has_app_context, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import urllib.request
+import uuid
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._:-]{1,128}$')
+
+
+def current_request_id():
+    """ID of the request being handled, or None outside a request"""
+    return g.get('request_id') if has_request_context() else None
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds ``request_id`` to every record ("-" outside a request)"""
+    
+    def filter(self, record):
+        record.request_id = current_request_id() or '-'
+        return True
+
+
+class Span:
+    """A timed section of a request; nested spans form the trace tree"""
+    
+    __slots__ = ('tracer', 'name', 'attrs', 'start', 'end', 'children')
+    
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.end = None
+        self.children = []
+    
+    def __enter__(self):
+        return self
+    
+    def set(self, **attrs):
+        """Attach attributes (row counts, sizes) to the span"""
+        self.attrs.update(attrs)
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer.finish(self)
+        return False
+    
+    def to_dict(self, origin):
+        data = {
+            'name': self.name,
+            'start_ms': round((self.start - origin) * 1000, 3),
+            'duration_ms': round(((self.end or time.perf_counter()) - self.start) * 1000, 3)
+        }
+        if self.attrs:
+            data['attrs'] = self.attrs
+        if self.children:
+            data['children'] = [child.to_dict(origin) for child in self.children]
+        return data
+
+
+class Tracer:
+    """Span stack of one request"""
+    
+    def __init__(self, name, **attrs):
+        self.root = Span(self, name, attrs)
+        self._stack = [self.root]
+    
+    def start(self, name, attrs):
+        span = Span(self, name, attrs)
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        return span
+    
+    def finish(self, span):
+        span.end = time.perf_counter()
+        # Tolerate spans closed out of order by unwinding to the closed one
+        if span in self._stack:
+            while self._stack.pop() is not span:
+                pass
+    
+    def to_dict(self):
+        return self.root.to_dict(self.root.start)
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+    
+    def set(self, **attrs):
+        pass
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name, **attrs):
+    """Context manager timing a phase of the current request.
+    
+    A shared no-op object is returned when tracing is disabled or outside a
+    request, so instrumented code costs one lookup.
+    """
+    tracer = g.get('_tracer') if has_app_context() else None
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start(name, attrs)
+
+
+class FileExporter:
+    """Appends one JSON trace per line to ``path``"""
+    
+    def __init__(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def export(self, trace):
+        line = json.dumps(trace, default=str)
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+
+
+class CollectorExporter:
+    """POSTs batches of traces as a JSON array to a local collector.
+    
+    Traces are queued and sent from a background thread; when the queue is
+    full new traces are dropped rather than slowing requests down.
+    """
+    
+    def __init__(self, url, max_queue=1000, batch_size=50, timeout=2.0):
+        self.url = url
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._start()
+    
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name='trace-exporter', daemon=True)
+        self._thread.start()
+    
+    def after_fork(self):
+        """Restart the sender in a forked worker; threads do not survive fork"""
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._start()
+    
+    def export(self, trace):
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                body = json.dumps(batch, default=str).encode()
+                req = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+                urllib.request.urlopen(req, timeout=self.timeout).close()
+            except Exception as e:
+                logger.warning(f"Trace export to {self.url} failed: {str(e)}")
+
+
+class TracingJSONProvider(DefaultJSONProvider):
+    """JSON provider timing response serialization as a span"""
+    
+    def response(self, *args, **kwargs):
+        with span('serialization'):
+            return super().response(*args, **kwargs)
+
+
+def _trace_statements(engine):
+    """Record every SQL statement as an ``sql`` span of the current request"""
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _start_sql_span(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('trace_spans', []).append(span('sql', statement=statement[:200]))
+    
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _finish_sql_span(conn, cursor, statement, parameters, context, executemany):
+        sql_span = conn.info['trace_spans'].pop()
+        sql_span.__exit__(None, None, None)
+
+    @event.listens_for(engine, 'handle_error')
+    def _fail_sql_span(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get('trace_spans') if conn is not None else None
+        if spans:
+            error = exception_context.original_exception
+            spans.pop().__exit__(type(error), error, None)
+
+
+def init_tracing(app):
+    """Register request IDs and, with ``TRACING_ENABLED``, per-request traces"""
+    from app.extensions import db
+    
+    @app.before_request
+    def _assign_request_id():
+        incoming = request.headers.get(REQUEST_ID_HEADER, '')
+        g.request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+    
+    @app.after_request
+    def _return_request_id(response):
+        response.headers[REQUEST_ID_HEADER] = g.request_id
+        return response
+    
+    if not app.config['TRACING_ENABLED']:
+        app.extensions['tracing'] = None
+        return
+    
+    if app.config['TRACING_COLLECTOR_URL']:
+        exporter = CollectorExporter(app.config['TRACING_COLLECTOR_URL'])
+    else:
+        exporter = FileExporter(app.config['TRACING_FILE'])
+    
+    app.json = TracingJSONProvider(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            _trace_statements(engine)
+    
+    @app.before_request
+    def _start_trace():
+        g._tracer = Tracer('request', method=request.method, path=request.path)
+    
+    @app.after_request
+    def _record_status(response):
+        tracer = g.get('_tracer')
+        if tracer is not None:
+            tracer.root.attrs['status'] = response.status_code
+        return response
+    
+    @app.teardown_request
+    def _export_trace(exc):
+        tracer = g.pop('_tracer', None)
+        if tracer is None:
+            return
+        tracer.finish(tracer.root)
+        trace = tracer.to_dict()
+        trace['request_id'] = g.get('request_id')
+        trace['endpoint'] = request.endpoint
+        try:
+            exporter.export(trace)
+        except Exception as e:
+            logger.warning(f"Trace export failed: {str(e)}")
+    
+    app.extensions['tracing'] = exporter
\ No newline at end of file
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+from app.core.health import readiness
+
+# Probed every second by the load balancers: no request logging, no JWT
+health_bp = Blueprint('health', __name__, url_prefix='/api/health')
+
+@health_bp.route('/live', methods=['GET'])
+def live():
+    """Liveness: the process is up and serving requests"""
+    return jsonify({'status': 'alive'}), 200
+
+@health_bp.route('/ready', methods=['GET'])
+def ready():
+    """Readiness: every required database answers, checked at most once per TTL"""
+    response, status_code = readiness()
+    return jsonify(response), status_code
\ No newline at end of file
@@ -0,0 +1,94 @@
+from app.extensions import db
+from app.inspections.models import Inspections, InspectionArchive, InspectionStatus
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import delete, insert, literal, select
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Columns copied verbatim from the live table into the archive
+ARCHIVED_COLUMNS = (
+    'id', 'vehicle_number', 'damage_report', 'image_url',
+    'inspected_by', 'status', 'created_at'
+)
+
+
+class ArchiveError(Exception):
+    """Raised when inspections cannot be archived without losing rows"""
+
+
+def archive_completed_inspections(older_than_days=None, batch_size=None, sleep_seconds=None, max_batches=None):
+    """Move completed inspections older than the cutoff into the archive table.
+    
+    Rows are moved in batches of ``batch_size``; each batch is copied and deleted
+    in a single transaction and the job sleeps ``sleep_seconds`` between batches
+    to keep replication and lock pressure low. Returns the number of archived rows.
+    """
+    config = current_app.config
+    if older_than_days is None:
+        older_than_days = config['ARCHIVE_AFTER_DAYS']
+    if batch_size is None:
+        batch_size = config['ARCHIVE_BATCH_SIZE']
+    if sleep_seconds is None:
+        sleep_seconds = config['ARCHIVE_BATCH_SLEEP_SECONDS']
+    
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    live_columns = [getattr(Inspections, name) for name in ARCHIVED_COLUMNS]
+    archived = 0
+    batches = 0
+    
+    while max_batches is None or batches < max_batches:
+        ids = db.session.execute(
+            select(Inspections.id)
+            .where(
+                Inspections.status == InspectionStatus.COMPLETED,
+                Inspections.created_at < cutoff
+            )
+            .order_by(Inspections.id)
+            .limit(batch_size)
+        ).scalars().all()
+        
+        if not ids:
+            break
+        
+        # Archive rows keep the live id, so an id seen twice means the
+        # inspections id counter was reset (MySQL < 8.0 restart) and reused
+        reused = db.session.execute(
+            select(InspectionArchive.id).where(InspectionArchive.id.in_(ids))
+        ).scalars().all()
+        if reused:
+            raise ArchiveError(
+                f"Inspection ids {sorted(reused)} are already archived; the inspections id "
+                f"counter was reset and reused ids (MySQL 8.0+ keeps it across restarts)"
+            )
+        
+        try:
+            db.session.execute(
+                insert(InspectionArchive).from_select(
+                    list(ARCHIVED_COLUMNS) + ['archived_at'],
+                    select(*live_columns, literal(datetime.utcnow(), db.DateTime))
+                    .where(Inspections.id.in_(ids))
+                )
+            )
+            db.session.execute(
+                delete(Inspections)
+                .where(Inspections.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        archived += len(ids)
+        batches += 1
+        logger.info(f"Archived batch of {len(ids)} inspections (total {archived}, cutoff {cutoff.isoformat()})")
+        
+        if len(ids) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+    
+    return archived
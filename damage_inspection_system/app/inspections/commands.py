@@ -0,0 +1,58 @@
+from flask.cli import AppGroup
+from app.core.sharding import shard_keys, using_shard
+from app.inspections.archive import ArchiveError, archive_completed_inspections
+from app.inspections.partitions import (
+    PartitioningNotSupported,
+    drop_expired_partitions,
+    ensure_future_partitions
+)
+from flask import current_app
+import click
+
+inspections_cli = AppGroup('inspections', help='Inspection maintenance commands.')
+
+@inspections_cli.command('archive')
+@click.option('--older-than-days', type=int, default=None, help='Archive completed inspections created before this many days ago.')
+@click.option('--batch-size', type=int, default=None, help='Rows moved per transaction.')
+@click.option('--sleep', 'sleep_seconds', type=float, default=None, help='Seconds to pause between batches.')
+@click.option('--max-batches', type=int, default=None, help='Stop after this many batches.')
+def archive(older_than_days, batch_size, sleep_seconds, max_batches):
+    """Move old completed inspections into the archive table"""
+    archived = 0
+    for shard_key in shard_keys():
+        with using_shard(shard_key):
+            try:
+                archived += archive_completed_inspections(
+                    older_than_days=older_than_days,
+                    batch_size=batch_size,
+                    sleep_seconds=sleep_seconds,
+                    max_batches=max_batches
+                )
+            except ArchiveError as e:
+                raise click.ClickException(str(e))
+    click.echo(f'Archived {archived} inspections')
+
+@inspections_cli.command('partitions')
+@click.option('--months-ahead', type=int, default=None, help='Months of partitions to pre-create.')
+@click.option('--retention-months', type=int, default=None, help='Drop partitions older than this many months (0 keeps all).')
+@click.option('--archive/--no-archive', default=True, help='Copy rows into the archive table before dropping a partition.')
+def partitions(months_ahead, retention_months, archive):
+    """Pre-create future monthly partitions and retire old ones (MySQL only)"""
+    config = current_app.config
+    if months_ahead is None:
+        months_ahead = config['PARTITION_MONTHS_AHEAD']
+    if retention_months is None:
+        retention_months = config['PARTITION_RETENTION_MONTHS']
+    
+    created, dropped = [], []
+    try:
+        for shard_key in shard_keys():
+            with using_shard(shard_key):
+                created += ensure_future_partitions(months_ahead)
+                if retention_months:
+                    dropped += drop_expired_partitions(retention_months, archive=archive)
+    except PartitioningNotSupported as e:
+        raise click.ClickException(str(e))
+    
+    click.echo(f"Created partitions: {', '.join(created) or 'none'}")
+    click.echo(f"Dropped partitions: {', '.join(dropped) or 'none'}")
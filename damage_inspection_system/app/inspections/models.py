@@ -1,6 +1,7 @@
 from app.extensions import db
 from datetime import datetime
 from enum import Enum
+from sqlalchemy.orm import declared_attr
 
 class InspectionStatus(Enum):
     PENDING = 'pending'
@@ -8,20 +9,23 @@ class InspectionStatus(Enum):
     COMPLETED = 'completed'
     
     
-class Inspections(db.Model):
-    __tablename__ = 'inspections'
+class InspectionMixin:
+    """Columns shared by live and archived inspections"""
+    
+    # Stored on the shard of the inspecting user (see app.core.sharding)
+    __sharded__ = True
     
     id = db.Column(db.Integer, primary_key=True)
     vehicle_number = db.Column(db.String(20), nullable=False)
     damage_report = db.Column(db.Text, nullable=False)
     image_url = db.Column(db.Text , nullable=False)
-    inspected_by = db.Column(db.Integer , db.ForeignKey('users.id'), nullable=False)
     status = db.Column(db.Enum(InspectionStatus), default=InspectionStatus.PENDING, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    # Relationship with User model
-    inspector = db.relationship('User', backref='inspections', lazy=True)
-   
+    @declared_attr
+    def inspected_by(cls):
+        return db.Column(db.Integer , db.ForeignKey('users.id'), nullable=False)
+    
     def to_dict(self):
             """Convert inspection to dictionary"""
             return {
@@ -36,4 +40,74 @@ class Inspections(db.Model):
             }
         
     def __repr__(self):
-            return f'<Inspection {self.id} - {self.vehicle_number}>'
\ No newline at end of file
+            return f'<Inspection {self.id} - {self.vehicle_number}>'
+
+
+class Inspections(InspectionMixin, db.Model):
+    """Live inspections.
+    
+    On MySQL the table is RANGE partitioned by month on ``created_at`` (see the
+    partitioning migration and ``flask inspections partitions``), so the primary
+    key is (id, created_at) there and date predicates should compare the raw
+    ``created_at`` column to allow partition pruning.
+    """
+    __tablename__ = 'inspections'
+    __table_args__ = (
+        db.Index('ix_inspections_inspected_by_created_at', 'inspected_by', 'created_at'),
+        db.Index('ix_inspections_inspected_by_status_created_at', 'inspected_by', 'status', 'created_at'),
+        # Never hand out the id of a deleted (archived) row again; SQLite
+        # otherwise reuses the highest id after it is deleted
+        {'sqlite_autoincrement': True},
+    )
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Relationship with User model
+    inspector = db.relationship('User', backref='inspections', lazy=True)
+
+
+class InspectionArchive(InspectionMixin, db.Model):
+    """Completed inspections moved out of the hot table by the archiving job"""
+    __tablename__ = 'inspections_archive'
+    __table_args__ = (
+        db.Index('ix_inspections_archive_inspected_by', 'inspected_by'),
+    )
+    
+    # Keeps the id of the original inspection
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    inspector = db.relationship('User', lazy=True, viewonly=True)
+
+
+class InspectionStatusEvent(db.Model):
+    """Append-only history of inspection status changes.
+    
+    ``inspection_id`` has no foreign key so the history outlives archiving.
+    """
+    __tablename__ = 'inspection_status_events'
+    __sharded__ = True
+    __table_args__ = (
+        db.Index('ix_inspection_status_events_inspection_id_at', 'inspection_id', 'at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    inspection_id = db.Column(db.Integer, nullable=False)
+    from_status = db.Column(db.Enum(InspectionStatus), nullable=True)
+    to_status = db.Column(db.Enum(InspectionStatus), nullable=False)
+    changed_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def to_dict(self):
+        """Convert status event to dictionary"""
+        return {
+            'id': self.id,
+            'inspection_id': self.inspection_id,
+            'from_status': self.from_status.value if self.from_status else None,
+            'to_status': self.to_status.value,
+            'changed_by': self.changed_by,
+            'at': self.at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<InspectionStatusEvent {self.inspection_id} - {self.to_status.value}>'
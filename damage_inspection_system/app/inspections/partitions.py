@@ -0,0 +1,139 @@
+from app.extensions import db
+from app.inspections.archive import ARCHIVED_COLUMNS
+from datetime import date
+from sqlalchemy import text
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Monthly RANGE partitions on TO_DAYS(created_at), named p<YYYYMM>, plus a
+# catch-all MAXVALUE partition that new months are split out of.
+TABLE_NAME = 'inspections'
+FUTURE_PARTITION = 'p_future'
+_PARTITION_NAME = re.compile(r'^p(\d{4})(\d{2})$')
+
+
+class PartitioningNotSupported(Exception):
+    """Raised when partition maintenance runs against a non-MySQL database"""
+
+
+def month_start(day):
+    """First day of the month containing ``day``"""
+    return date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    """First day of the month ``months`` after the month containing ``day``"""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """Partition name holding rows created during ``month``"""
+    return f'p{month.year:04d}{month.month:02d}'
+
+
+def partition_month(name):
+    """Month covered by a monthly partition, or None for other partitions"""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def partition_definition(month):
+    """DDL fragment for the partition holding ``month``"""
+    upper = add_months(month, 1)
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN (TO_DAYS('{upper.isoformat()}'))"
+
+
+def plan_future_partitions(existing_names, today, months_ahead):
+    """Months that need a partition so that ``months_ahead`` months are pre-created"""
+    months = [partition_month(name) for name in existing_names]
+    months = [month for month in months if month is not None]
+    first = add_months(max(months), 1) if months else month_start(today)
+    last = add_months(month_start(today), months_ahead)
+    
+    planned = []
+    month = first
+    while month <= last:
+        planned.append(month)
+        month = add_months(month, 1)
+    return planned
+
+
+def plan_expired_partitions(existing_names, today, retention_months):
+    """Partitions whose whole month is older than the retention window"""
+    cutoff = add_months(month_start(today), -retention_months)
+    return [
+        name for name in existing_names
+        if partition_month(name) is not None and partition_month(name) < cutoff
+    ]
+
+
+def _require_mysql():
+    dialect = db.session.get_bind().dialect.name
+    if dialect != 'mysql':
+        raise PartitioningNotSupported(
+            f'Partition maintenance requires MySQL, not {dialect}'
+        )
+
+
+def get_partitions():
+    """Names of the inspections table partitions in order"""
+    _require_mysql()
+    rows = db.session.execute(text(
+        'SELECT PARTITION_NAME FROM information_schema.PARTITIONS '
+        'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table '
+        'AND PARTITION_NAME IS NOT NULL '
+        'ORDER BY PARTITION_ORDINAL_POSITION'
+    ), {'table': TABLE_NAME}).scalars().all()
+    return list(rows)
+
+
+def ensure_future_partitions(months_ahead, today=None):
+    """Split new monthly partitions out of the MAXVALUE partition.
+    
+    Returns the names of the partitions created.
+    """
+    today = today or date.today()
+    planned = plan_future_partitions(get_partitions(), today, months_ahead)
+    if not planned:
+        return []
+    
+    definitions = ', '.join(partition_definition(month) for month in planned)
+    db.session.execute(text(
+        f'ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {FUTURE_PARTITION} INTO '
+        f'({definitions}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)'
+    ))
+    db.session.commit()
+    
+    created = [partition_name(month) for month in planned]
+    logger.info(f"Created inspection partitions: {', '.join(created)}")
+    return created
+
+
+def drop_expired_partitions(retention_months, archive=True, today=None):
+    """Drop monthly partitions older than the retention window.
+    
+    With ``archive`` the rows of each partition are first copied into the
+    archive table, so they stay readable through ``get_inspection``.
+    Returns the names of the partitions dropped.
+    """
+    today = today or date.today()
+    expired = plan_expired_partitions(get_partitions(), today, retention_months)
+    columns = ', '.join(ARCHIVED_COLUMNS)
+    
+    for name in expired:
+        if archive:
+            db.session.execute(text(
+                f'INSERT INTO inspections_archive ({columns}, archived_at) '
+                f'SELECT {columns}, UTC_TIMESTAMP() FROM {TABLE_NAME} PARTITION ({name})'
+            ))
+            db.session.commit()
+        db.session.execute(text(f'ALTER TABLE {TABLE_NAME} DROP PARTITION {name}'))
+        db.session.commit()
+        logger.info(f"Dropped inspection partition {name} (archived: {archive})")
+    
+    return expired
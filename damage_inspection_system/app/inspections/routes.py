@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify
 from app.inspections.services import InspectionService
-from app.auth.utils import get_current_user
+from app.auth.api_keys import auth_required
+from app.auth.utils import get_current_user_id
 from app.core.logger import log_request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.core.rate_limit import rate_limit, user_identity
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,7 +11,8 @@ logger = logging.getLogger(__name__)
 inspections_bp = Blueprint('inspections', __name__, url_prefix='/api')
 
 @inspections_bp.route('/inspection', methods=['POST'])
-@jwt_required()
+@auth_required('inspections:write')
+@rate_limit('inspections', key=user_identity)
 @log_request
 def create_inspection():
     """Create a new inspection entry"""
@@ -20,8 +22,8 @@ def create_inspection():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Get current user ID from JWT token
-        user_id = get_jwt_identity()
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
         
         response, status_code = InspectionService.create_inspection(data, user_id)
         return jsonify(response), status_code
@@ -31,13 +33,14 @@ def create_inspection():
         return jsonify({'error': 'Internal server error'}), 500
 
 @inspections_bp.route('/inspection/<int:inspection_id>', methods=['GET'])
-@jwt_required()
+@auth_required('inspections:read')
+@rate_limit('inspections', key=user_identity)
 @log_request
 def get_inspection(inspection_id):
     """Get inspection details by ID (only if created by the logged-in user)"""
     try:
-        # Get current user ID from JWT token
-        user_id = get_jwt_identity()
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
         
         response, status_code = InspectionService.get_inspection(inspection_id, user_id)
         return jsonify(response), status_code
@@ -47,7 +50,8 @@ def get_inspection(inspection_id):
         return jsonify({'error': 'Internal server error'}), 500
 
 @inspections_bp.route('/inspection/<int:inspection_id>', methods=['PATCH'])
-@jwt_required()
+@auth_required('inspections:write')
+@rate_limit('inspections', key=user_identity)
 @log_request
 def update_inspection_status(inspection_id):
     """Update inspection status to reviewed or completed"""
@@ -57,8 +61,8 @@ def update_inspection_status(inspection_id):
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        # Get current user ID from JWT token
-        user_id = get_jwt_identity()
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
         
         response, status_code = InspectionService.update_inspection_status(inspection_id, data, user_id)
         return jsonify(response), status_code
@@ -68,23 +72,62 @@ def update_inspection_status(inspection_id):
         return jsonify({'error': 'Internal server error'}), 500
 
 @inspections_bp.route('/inspection', methods=['GET'])
-@jwt_required()
+@auth_required('inspections:read')
+@rate_limit('inspections', key=user_identity)
 @log_request
 def get_inspections():
-    """Get all inspections with optional status filtering"""
+    """Get all inspections with optional status, date range and pagination filters"""
     try:
         # Get query parameters for filtering
         filters = {}
-        status = request.args.get('status')
-        if status:
-            filters['status'] = status
+        statuses = request.args.getlist('status')
+        if statuses:
+            filters['status'] = statuses
+        for key in ('created_after', 'created_before', 'page', 'per_page'):
+            value = request.args.get(key)
+            if value:
+                filters[key] = value
         
-        # Get current user ID from JWT token
-        user_id = get_jwt_identity()
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
         
         response, status_code = InspectionService.get_user_inspections(user_id, filters)
         return jsonify(response), status_code
         
     except Exception as e:
         logger.error(f"Get inspections endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@inspections_bp.route('/inspection/<int:inspection_id>/timeline', methods=['GET'])
+@auth_required('inspections:read')
+@rate_limit('inspections', key=user_identity)
+@log_request
+def get_inspection_timeline(inspection_id):
+    """Get the status history of an inspection with time spent in each status"""
+    try:
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
+        
+        response, status_code = InspectionService.get_inspection_timeline(inspection_id, user_id)
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Get inspection timeline endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@inspections_bp.route('/inspection/status-durations', methods=['GET'])
+@auth_required('inspections:read')
+@rate_limit('inspections', key=user_identity)
+@log_request
+def get_status_durations():
+    """Get time spent in each status across the user's inspections"""
+    try:
+        # Get current user ID from the API key or JWT token
+        user_id = get_current_user_id()
+        
+        response, status_code = InspectionService.get_status_durations(user_id)
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Get status durations endpoint error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
@@ -1,6 +1,12 @@
-from marshmallow import Schema, fields, validate, ValidationError, validates_schema
+from marshmallow import Schema, fields, validate, ValidationError, validates_schema, post_load
+from marshmallow.exceptions import SCHEMA
+from collections.abc import Mapping
+from datetime import timezone
 import re
 
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+IMAGE_EXTENSION_ERROR = 'Image URL must end with .jpg, .jpeg, or .png'
+
 class InspectionCreateSchema(Schema):
     vehicle_number = fields.Str(
         required=True,
@@ -19,10 +25,8 @@ class InspectionCreateSchema(Schema):
     def validate_image_url(self, data, **kwargs):
         """Validate image URL extension"""
         image_url = data.get('image_url')
-        if image_url:
-            valid_extensions = ['.jpg', '.jpeg', '.png']
-            if not any(image_url.lower().endswith(ext) for ext in valid_extensions):
-                raise ValidationError('Image URL must end with .jpg, .jpeg, or .png', field_name='image_url')
+        if image_url and not image_url.lower().endswith(IMAGE_EXTENSIONS):
+            raise ValidationError(IMAGE_EXTENSION_ERROR, field_name='image_url')
 
 class InspectionUpdateSchema(Schema):
     status = fields.Str(
@@ -30,13 +34,169 @@ class InspectionUpdateSchema(Schema):
         validate=validate.OneOf(['reviewed', 'completed'])
     )
 
+class StatusList(fields.List):
+    """List of statuses given as repeated values and/or comma-separated strings"""
+    
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, (list, tuple)):
+            value = [
+                part.strip()
+                for item in value
+                for part in (item.split(',') if isinstance(item, str) else [item])
+            ]
+        return super()._deserialize(value, attr, data, **kwargs)
+
 class InspectionFilterSchema(Schema):
-    status = fields.Str(
+    status = StatusList(
+        fields.Str(validate=validate.OneOf(['pending', 'reviewed', 'completed'])),
         required=False,
-        validate=validate.OneOf(['pending', 'reviewed', 'completed'])
+        validate=validate.Length(min=1)
     )
+    created_after = fields.DateTime(required=False)
+    created_before = fields.DateTime(required=False)
+    page = fields.Int(required=False, validate=validate.Range(min=1))
+    per_page = fields.Int(required=False, validate=validate.Range(min=1, max=100))
+    
+    @validates_schema
+    def validate_date_range(self, data, **kwargs):
+        """Validate that the date range is not inverted"""
+        created_after = data.get('created_after')
+        created_before = data.get('created_before')
+        if created_after and created_before and _as_utc(created_after) > _as_utc(created_before):
+            raise ValidationError('created_after must not be later than created_before', field_name='created_after')
+    
+    @post_load
+    def normalize_dates(self, data, **kwargs):
+        """Convert dates to naive UTC to match the stored created_at values"""
+        for key in ('created_after', 'created_before'):
+            if key in data:
+                data[key] = _as_utc(data[key])
+        return data
+
+def _as_utc(value):
+    """Naive UTC datetime for an aware or naive (assumed UTC) datetime"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# Compiled fast paths for the hot write schemas. They return the same data
+# and raise ValidationError with the same messages as the marshmallow schemas
+# (see tests/test_schemas.py), without per-call field/validator dispatch.
+_missing = object()
+_MISSING = fields.Field.default_error_messages['required']
+_NULL = fields.Field.default_error_messages['null']
+_NOT_STRING = fields.String.default_error_messages['invalid']
+_INVALID_UTF8 = fields.String.default_error_messages['invalid_utf8']
+# Schema-level messages and the absolute URL pattern are private in marshmallow,
+# so they are spelled out here (pinned by the parity tests in test_schemas.py)
+_UNKNOWN = 'Unknown field.'
+_INVALID_INPUT = 'Invalid input type.'
+_INVALID_URL = fields.Url.default_error_messages['invalid']
+_URL_REGEX = re.compile(
+    r'^(?:[a-z0-9\.\-\+]*)://'  # scheme
+    r"(?:(?:[a-z0-9\-._~!$&'()*+,;=:]|%[0-9a-f]{2})*@)?"  # user:password@
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)'  # domain
+    r'|localhost'
+    r'|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'  # IPv4
+    r'|\[[A-F0-9]*:[A-F0-9:]+\])'  # IPv6
+    r'(?::\d+)?'  # port
+    r'(?:/?|[/?]\S+)\Z',
+    re.IGNORECASE
+)
+_URL_SCHEMES = validate.URL.default_schemes
+
+def _length_error(min, max):
+    return validate.Length.message_all.format(min=min, max=max)
+
+def _string(data, name, errors, invalid=_NOT_STRING):
+    """Deserialize a required fields.Str value; record an error and return _missing on failure"""
+    value = data.get(name, _missing)
+    if value.__class__ is str:
+        return value
+    if value is _missing:
+        message = _MISSING
+    elif value is None:
+        message = _NULL
+    elif isinstance(value, str):
+        return str(value)
+    elif isinstance(value, bytes):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            message = _INVALID_UTF8
+    else:
+        message = invalid
+    errors[name] = [message]
+    return _missing
+
+def _unknown_fields(data, names, errors):
+    for key in data:
+        if key not in names:
+            errors[key] = [_UNKNOWN]
+
+class CompiledInspectionCreateSchema:
+    """Fast equivalent of ``InspectionCreateSchema().load``"""
+    
+    names = frozenset(InspectionCreateSchema._declared_fields)
+    vehicle_number_error = _length_error(5, 20)
+    damage_report_error = _length_error(10, 1000)
+    
+    def load(self, data):
+        if not isinstance(data, Mapping):
+            raise ValidationError({SCHEMA: [_INVALID_INPUT]})
+        errors = {}
+        vehicle_number = _string(data, 'vehicle_number', errors)
+        damage_report = _string(data, 'damage_report', errors)
+        # fields.Url overrides the 'invalid' message, so non-strings are "Not a valid URL."
+        image_url = _string(data, 'image_url', errors, _INVALID_URL)
+        _unknown_fields(data, self.names, errors)
+        
+        if vehicle_number is not _missing and not 5 <= len(vehicle_number) <= 20:
+            errors['vehicle_number'] = [self.vehicle_number_error]
+        if damage_report is not _missing and not 10 <= len(damage_report) <= 1000:
+            errors['damage_report'] = [self.damage_report_error]
+        if image_url is not _missing and not _is_url(image_url):
+            errors['image_url'] = [_INVALID_URL]
+        if errors:
+            raise ValidationError(errors)
+        
+        # Schema-level check, skipped on field errors like @validates_schema
+        if not image_url.lower().endswith(IMAGE_EXTENSIONS):
+            raise ValidationError({'image_url': [IMAGE_EXTENSION_ERROR]})
+        return {'vehicle_number': vehicle_number, 'damage_report': damage_report, 'image_url': image_url}
+
+class CompiledInspectionUpdateSchema:
+    """Fast equivalent of ``InspectionUpdateSchema().load``"""
+    
+    names = frozenset(InspectionUpdateSchema._declared_fields)
+    choices = frozenset(['reviewed', 'completed'])
+    status_error = validate.OneOf.default_message.format(choices='reviewed, completed')
+    
+    def load(self, data):
+        if not isinstance(data, Mapping):
+            raise ValidationError({SCHEMA: [_INVALID_INPUT]})
+        errors = {}
+        status = _string(data, 'status', errors)
+        _unknown_fields(data, self.names, errors)
+        if status is not _missing and status not in self.choices:
+            errors['status'] = [self.status_error]
+        if errors:
+            raise ValidationError(errors)
+        return {'status': status}
+
+def _is_url(value):
+    """validate.URL(relative=False, require_tld=True) without the per-call lookups"""
+    if not value:
+        return False
+    if '://' in value and value.partition('://')[0].lower() not in _URL_SCHEMES:
+        return False
+    return _URL_REGEX.search(value) is not None
 
 # Initialize schemas
 inspection_create_schema = InspectionCreateSchema()
 inspection_update_schema = InspectionUpdateSchema()
-inspection_filter_schema = InspectionFilterSchema()
\ No newline at end of file
+inspection_filter_schema = InspectionFilterSchema()
+inspection_create_validator = CompiledInspectionCreateSchema()
+inspection_update_validator = CompiledInspectionUpdateSchema()
\ No newline at end of file
@@ -1,23 +1,50 @@
 from app.extensions import db
-from app.inspections.models import Inspections, InspectionStatus
+from app.core.routing import read_replica
+from app.core.sharding import user_shard
+from app.core.sql import seconds_between
+from app.core.tracing import span
+from app.inspections.models import Inspections, InspectionArchive, InspectionStatus, InspectionStatusEvent
 from app.inspections.schemas import (
-    inspection_create_schema, 
-    inspection_update_schema, 
+    inspection_create_validator, 
+    inspection_update_validator, 
     inspection_filter_schema
 )
 from marshmallow import ValidationError
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import selectinload
+from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PER_PAGE = 20
+
 class InspectionService:
     
     @staticmethod
+    def _find_inspection(inspection_id, user_id):
+        """Find a user's inspection, falling back to the archive table"""
+        inspection = Inspections.query.filter_by(
+            id=inspection_id, 
+            inspected_by=user_id
+        ).first()
+        
+        if inspection is None:
+            inspection = InspectionArchive.query.filter_by(
+                id=inspection_id,
+                inspected_by=user_id
+            ).first()
+        
+        return inspection
+    
+    @staticmethod
+    @user_shard
     def create_inspection(data, user_id):
         """Create a new inspection"""
         try:
             # Validate input data
-            validated_data = inspection_create_schema.load(data)
+            with span('validation'):
+                validated_data = inspection_create_validator.load(data)
             
             # Create new inspection
             inspection = Inspections(
@@ -27,70 +54,91 @@ class InspectionService:
                 inspected_by=user_id
             )
             
-            # Save to database
-            db.session.add(inspection)
-            db.session.commit()
+            # Save to database together with the initial status event
+            with span('db'):
+                db.session.add(inspection)
+                db.session.flush()
+                db.session.add(InspectionStatusEvent(
+                    inspection_id=inspection.id,
+                    from_status=None,
+                    to_status=inspection.status,
+                    changed_by=user_id,
+                    at=inspection.created_at
+                ))
+                db.session.commit()
             
-            logger.info(f"New inspection created: {inspection.id} by user {user_id}")
+            logger.info("New inspection created: %s by user %s", inspection.id, user_id)
             
+            with span('to_dict'):
+                inspection_data = inspection.to_dict()
             return {
                 'message': 'Inspection created successfully',
-                'inspection': inspection.to_dict()
+                'inspection': inspection_data
             }, 201
             
         except ValidationError as e:
-            logger.error(f"Inspection creation validation error: {e.messages}")
+            logger.error("Inspection creation validation error: %s", e.messages)
             return {'error': 'Inspection creation failed'}, 400
         except Exception as e:
-            logger.exception(f"Inspection creation error: {str(e)}")
+            logger.exception("Inspection creation error: %s", e)
             db.session.rollback()
             return {'error': 'Inspection creation failed'}, 500
     
     @staticmethod
+    @read_replica
+    @user_shard
     def get_inspection(inspection_id, user_id):
         """Get inspection by ID (only if created by the user)"""
         try:
-            inspection = Inspections.query.filter_by(
-                id=inspection_id, 
-                inspected_by=user_id
-            ).first()
+            with span('db'):
+                inspection = InspectionService._find_inspection(inspection_id, user_id)
             
             if not inspection:
                 return {'error': 'Inspection not found or access denied'}, 404
             
-            logger.info(f"Inspection {inspection_id} retrieved by user {user_id}")
+            logger.info("Inspection %s retrieved by user %s", inspection_id, user_id)
             
             return {
                 'inspection': inspection.to_dict()
             }, 200
             
         except Exception as e:
-            logger.exception(f"Get inspection error: {str(e)}")
+            logger.exception("Get inspection error: %s", e)
             return {'error': 'Failed to retrieve inspection'}, 500
     
     @staticmethod
+    @user_shard
     def update_inspection_status(inspection_id, data, user_id):
         """Update inspection status (only if created by the user)"""
         try:
             # Validate input data
-            validated_data = inspection_update_schema.load(data)
+            with span('validation'):
+                validated_data = inspection_update_validator.load(data)
             
             # Find inspection
-            inspection = Inspections.query.filter_by(
-                id=inspection_id, 
-                inspected_by=user_id
-            ).first()
+            with span('db'):
+                inspection = Inspections.query.filter_by(
+                    id=inspection_id, 
+                    inspected_by=user_id
+                ).first()
             
             if not inspection:
                 return {'error': 'Inspection not found or access denied'}, 404
             
-            # Update status
+            # Update status and record the change in the same transaction
             old_status = inspection.status.value
             inspection.status = InspectionStatus(validated_data['status'])
+            with span('db'):
+                db.session.add(InspectionStatusEvent(
+                    inspection_id=inspection.id,
+                    from_status=InspectionStatus(old_status),
+                    to_status=inspection.status,
+                    changed_by=user_id
+                ))
+                
+                db.session.commit()
             
-            db.session.commit()
-            
-            logger.info(f"Inspection {inspection_id} status updated from {old_status} to {validated_data['status']} by user {user_id}")
+            logger.info("Inspection %s status updated from %s to %s by user %s", inspection_id, old_status, validated_data['status'], user_id)
             
             return {
                 'message': 'Inspection status updated successfully',
@@ -98,40 +146,174 @@ class InspectionService:
             }, 200
             
         except ValidationError as e:
-            logger.error(f"Inspection update validation error: {e.messages}")
+            logger.error("Inspection update validation error: %s", e.messages)
             return {'error': 'Failed to update inspection'}, 400
         except Exception as e:
-            logger.exception(f"Inspection update error: {str(e)}")
+            logger.exception("Inspection update error: %s", e)
             db.session.rollback()
             return {'error': 'Failed to update inspection'}, 500
     
     @staticmethod
+    @read_replica
+    @user_shard
     def get_user_inspections(user_id, filters=None):
-        """Get all inspections for a user with optional status filtering"""
+        """Get inspections for a user with optional status, date range and page filters"""
         try:
-            # Build base query
-            query = Inspections.query.filter_by(inspected_by=user_id)
+            # Build base query; inspectors are loaded in one extra SELECT IN rather
+            # than lazily per row (a JOIN would break when users and inspections
+            # live on different shards)
+            query = Inspections.query.filter_by(inspected_by=user_id).options(selectinload(Inspections.inspector))
+            with span('validation'):
+                validated_filters = inspection_filter_schema.load(filters) if filters else {}
             
-            # Apply filters if provided
-            if filters:
-                validated_filters = inspection_filter_schema.load(filters)
-                
-                if 'status' in validated_filters:
-                    query = query.filter_by(status=InspectionStatus(validated_filters['status']))
+            # Apply filters as plain column predicates so they can use the
+            # (inspected_by, status, created_at) index and prune date partitions
+            if 'status' in validated_filters:
+                statuses = [InspectionStatus(status) for status in validated_filters['status']]
+                query = query.filter(Inspections.status.in_(statuses))
+            if 'created_after' in validated_filters:
+                query = query.filter(Inspections.created_at >= validated_filters['created_after'])
+            if 'created_before' in validated_filters:
+                query = query.filter(Inspections.created_at < validated_filters['created_before'])
+            
+            query = query.order_by(Inspections.created_at.desc(), Inspections.id.desc())
+            
+            # Fetch one extra row to know whether another page exists without a COUNT query
+            paginated = 'page' in validated_filters or 'per_page' in validated_filters
+            if paginated:
+                page = validated_filters.get('page', 1)
+                per_page = validated_filters.get('per_page', DEFAULT_PER_PAGE)
+                query = query.offset((page - 1) * per_page).limit(per_page + 1)
             
             # Execute query and get results
-            inspections = query.order_by(Inspections.created_at.desc()).all()
+            with span('db') as db_span:
+                inspections = query.all()
+                db_span.set(rows=len(inspections))
             
-            logger.info(f"Retrieved {len(inspections)} inspections for user {user_id}")
+            response = {}
+            if paginated:
+                response.update({
+                    'page': page,
+                    'per_page': per_page,
+                    'has_more': len(inspections) > per_page
+                })
+                inspections = inspections[:per_page]
             
-            return {
-                'inspections': [inspection.to_dict() for inspection in inspections],
-                'count': len(inspections)
-            }, 200
+            logger.info("Retrieved %s inspections for user %s", len(inspections), user_id)
+            
+            with span('to_dict'):
+                response.update({
+                    'inspections': [inspection.to_dict() for inspection in inspections],
+                    'count': len(inspections)
+                })
+            return response, 200
             
         except ValidationError as e:
-            logger.error(f"Inspection filter validation error: {e.messages}")
+            logger.error("Inspection filter validation error: %s", e.messages)
             return {'error': 'Failed to retrieve inspections'}, 400
         except Exception as e:
-            logger.exception(f"Get inspections error: {str(e)}")
-            return {'error': 'Failed to retrieve inspections'}, 500
\ No newline at end of file
+            logger.exception("Get inspections error: %s", e)
+            return {'error': 'Failed to retrieve inspections'}, 500
+    
+    @staticmethod
+    def _time_in_status_query(now, inspection_filter):
+        """Build a query summing the seconds spent in each status.
+        
+        Each event lasts until the next event of the same inspection (or until
+        ``now`` for the latest one); the windowing and date arithmetic run in SQL.
+        """
+        next_at = func.lead(InspectionStatusEvent.at).over(
+            partition_by=InspectionStatusEvent.inspection_id,
+            order_by=(InspectionStatusEvent.at, InspectionStatusEvent.id)
+        )
+        spans = (
+            select(
+                InspectionStatusEvent.inspection_id.label('inspection_id'),
+                InspectionStatusEvent.to_status.label('status'),
+                InspectionStatusEvent.at.label('started_at'),
+                func.coalesce(next_at, literal(now, db.DateTime)).label('ended_at')
+            )
+            .where(inspection_filter)
+            .subquery()
+        )
+        duration = seconds_between(spans.c.started_at, spans.c.ended_at)
+        return (
+            select(
+                spans.c.status,
+                func.sum(duration).label('total_seconds'),
+                func.count().label('entries'),
+                func.count(func.distinct(spans.c.inspection_id)).label('inspections')
+            )
+            .group_by(spans.c.status)
+        )
+    
+    @staticmethod
+    @read_replica
+    @user_shard
+    def get_inspection_timeline(inspection_id, user_id):
+        """Get status history and time spent in each status for an inspection"""
+        try:
+            inspection = InspectionService._find_inspection(inspection_id, user_id)
+            
+            if not inspection:
+                return {'error': 'Inspection not found or access denied'}, 404
+            
+            events = InspectionStatusEvent.query.filter_by(
+                inspection_id=inspection_id
+            ).order_by(InspectionStatusEvent.at, InspectionStatusEvent.id).all()
+            
+            rows = db.session.execute(InspectionService._time_in_status_query(
+                datetime.utcnow(),
+                InspectionStatusEvent.inspection_id == inspection_id
+            )).all()
+            
+            logger.info("Timeline for inspection %s retrieved by user %s", inspection_id, user_id)
+            
+            return {
+                'inspection_id': inspection_id,
+                'status': inspection.status.value,
+                'events': [event.to_dict() for event in events],
+                'time_in_status': {
+                    row.status.value: {
+                        'seconds': round(row.total_seconds or 0.0, 3),
+                        'entries': row.entries
+                    }
+                    for row in rows
+                }
+            }, 200
+            
+        except Exception as e:
+            logger.exception("Get inspection timeline error: %s", e)
+            return {'error': 'Failed to retrieve inspection timeline'}, 500
+    
+    @staticmethod
+    @read_replica
+    @user_shard
+    def get_status_durations(user_id):
+        """Get total and average time spent in each status across a user's inspections"""
+        try:
+            user_inspections = union_all(
+                select(Inspections.id).where(Inspections.inspected_by == user_id),
+                select(InspectionArchive.id).where(InspectionArchive.inspected_by == user_id)
+            )
+            rows = db.session.execute(InspectionService._time_in_status_query(
+                datetime.utcnow(),
+                InspectionStatusEvent.inspection_id.in_(user_inspections)
+            )).all()
+            
+            logger.info("Status durations retrieved for user %s", user_id)
+            
+            return {
+                'status_durations': {
+                    row.status.value: {
+                        'total_seconds': round(row.total_seconds or 0.0, 3),
+                        'average_seconds': round((row.total_seconds or 0.0) / row.inspections, 3),
+                        'inspections': row.inspections
+                    }
+                    for row in rows
+                }
+            }, 200
+            
+        except Exception as e:
+            logger.exception("Get status durations error: %s", e)
+            return {'error': 'Failed to retrieve status durations'}, 500
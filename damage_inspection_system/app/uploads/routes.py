@@ -0,0 +1,43 @@
+from flask import Blueprint, current_app, request, jsonify, send_file
+from app.auth.api_keys import auth_required
+from app.auth.utils import get_current_user_id
+from app.core.logger import log_request
+from app.core.rate_limit import rate_limit, user_identity
+from app.uploads.services import UploadService
+import logging
+
+logger = logging.getLogger(__name__)
+
+uploads_bp = Blueprint('uploads', __name__, url_prefix='/api/uploads')
+
+# Stored images never change, so clients and proxies may cache them forever
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+@uploads_bp.route('', methods=['POST'])
+@auth_required('inspections:write')
+@rate_limit('inspections', key=user_identity)
+@log_request
+def upload_image():
+    """Store the JPEG or PNG image sent as the raw request body"""
+    try:
+        response, status_code = UploadService.upload_image(
+            request.stream, request.content_length, get_current_user_id(),
+            input_terminated=request.environ.get('wsgi.input_terminated', False)
+        )
+        return jsonify(response), status_code
+        
+    except Exception as e:
+        logger.error(f"Upload endpoint error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@uploads_bp.route('/<name>', methods=['GET'])
+def get_upload(name):
+    """Serve a stored image; names are SHA-256 digests of the content"""
+    path = current_app.extensions['upload_storage'].path(name)
+    if path is None:
+        return jsonify({'error': 'Image not found'}), 404
+    
+    response = send_file(path, etag=name.partition('.')[0], max_age=IMMUTABLE_MAX_AGE, conditional=True)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
\ No newline at end of file
@@ -0,0 +1,50 @@
+from app.core.storage import UploadError
+from flask import current_app, url_for
+import logging
+
+logger = logging.getLogger(__name__)
+
+class UploadService:
+    
+    @staticmethod
+    def image_url(name):
+        """Public URL of a stored image, accepted as an inspection's image_url"""
+        base_url = current_app.config['UPLOAD_BASE_URL']
+        if base_url:
+            return f"{base_url.rstrip('/')}/{name}"
+        return url_for('uploads.get_upload', name=name, _external=True)
+    
+    @staticmethod
+    def upload_image(stream, content_length, user_id, input_terminated=False):
+        """Store an image streamed in the request body.
+        
+        Without a Content-Length the body can only be read when the server
+        marks the input as terminated (``wsgi.input_terminated``, e.g. chunked
+        requests under gunicorn); otherwise it would read as empty.
+        """
+        try:
+            if content_length is None and not input_terminated:
+                return {'error': 'Content-Length required'}, 411
+            
+            max_bytes = current_app.config['UPLOAD_MAX_BYTES']
+            if content_length is not None and content_length > max_bytes:
+                return {'error': f'Image exceeds {max_bytes} bytes'}, 413
+            
+            stored = current_app.extensions['upload_storage'].save(stream, max_bytes)
+            
+            logger.info(f"Image {stored.name} uploaded by user {user_id}")
+            
+            return {
+                'message': 'Image uploaded successfully',
+                'image_url': UploadService.image_url(stored.name),
+                'sha256': stored.sha256,
+                'size': stored.size,
+                'deduplicated': not stored.created
+            }, 201 if stored.created else 200
+            
+        except UploadError as e:
+            logger.error(f"Image upload rejected: {str(e)}")
+            return {'error': str(e)}, e.status
+        except Exception as e:
+            logger.exception(f"Image upload error: {str(e)}")
+            return {'error': 'Image upload failed'}, 500
\ No newline at end of file
@@ -1,5 +1,4 @@
-from app.extensions import db
-from flask_bcrypt import generate_password_hash, check_password_hash
+from app.extensions import db, bcrypt
 from datetime import datetime
 
 class User(db.Model):
@@ -12,11 +11,11 @@ class User(db.Model):
     
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = generate_password_hash(password).decode('utf-8')
+        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
     
     def check_password(self, password):
         """Check if provided password matches hash"""
-        return check_password_hash(self.password_hash, password)
+        return bcrypt.check_password_hash(self.password_hash, password)
     
     def to_dict(self):
         """Convert user to dictionary (excluding password)"""
@@ -27,4 +26,15 @@ class User(db.Model):
         }
     
     def __repr__(self):
-        return f'<User {self.username}>'
\ No newline at end of file
+        return f'<User {self.username}>'
+
+class UserShard(db.Model):
+    """Directory entry pinning a user's inspections to a shard bind"""
+    __tablename__ = 'user_shards'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    shard_key = db.Column(db.String(32), nullable=False)
+    assigned_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<UserShard {self.user_id} - {self.shard_key}>'
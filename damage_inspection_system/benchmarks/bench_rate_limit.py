@@ -0,0 +1,79 @@
+"""Micro-benchmark of the rate limiter's per-request overhead.
+
+Times ``MemoryBackend.consume`` for one hot key, for a refused request and
+across 10k and 100k distinct keys (IPs), and the limiter check made by
+``@rate_limit`` inside a request context. Cases are calibrated and reported
+like the schema micro-benchmarks, in microseconds per call:
+
+    python -m benchmarks.bench_rate_limit
+    python -m benchmarks.bench_rate_limit --compare benchmarks/results/rate_limit-abc1234.json
+"""
+import argparse
+import itertools
+import sys
+
+from app import create_app
+from app.core.rate_limit import MemoryBackend, _check, client_ip, parse_rate
+from benchmarks.bench_schemas import compare, measure, summarize
+from benchmarks.common import environment, load_results, write_results
+
+KEY_COUNTS = (10000, 100000)
+
+
+def build_cases():
+    """Ordered mapping of case name to a zero-argument callable"""
+    cases = {}
+    rate = parse_rate('1000000/second')
+    hot = MemoryBackend()
+    cases['consume.hot_key'] = lambda: hot.consume('auth:10.0.0.1', rate)
+    
+    refused = MemoryBackend()
+    slow = parse_rate('1/day')
+    refused.consume('auth:10.0.0.1', slow)
+    cases['consume.refused'] = lambda: refused.consume('auth:10.0.0.1', slow)
+    
+    for count in KEY_COUNTS:
+        backend = MemoryBackend(max_keys=count)
+        keys = itertools.cycle([f'auth:10.{index >> 16}.{(index >> 8) & 255}.{index & 255}' for index in range(count)])
+        cases[f'consume.keys_{count}'] = lambda backend=backend, keys=keys: backend.consume(next(keys), rate)
+    
+    cases['decorator.check'] = lambda: _check('auth', client_ip)
+    return cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=7, help='Timed runs per case (default 7)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per run (default 0.2)')
+    parser.add_argument('--output', help='Result JSON path (default benchmarks/results/rate_limit-<commit>.json)')
+    parser.add_argument('--compare', help='Baseline result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    args = parser.parse_args(argv)
+    
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'TESTING': True, 'RATE_LIMIT_AUTH': '1000000/second'})
+    results = {
+        'benchmark': 'rate_limit',
+        'environment': environment(),
+        'parameters': {'repeat': args.repeat, 'min_time': args.min_time},
+        'cases': {}
+    }
+    
+    print(f"{'case':<34}{'loops':>9}{'min us':>11}{'median us':>11}{'stdev':>9}")
+    with app.test_request_context('/api/login', method='POST', environ_base={'REMOTE_ADDR': '10.0.0.1'}):
+        for name, func in build_cases().items():
+            func()
+            stats = summarize(*measure(func, args.repeat, args.min_time))
+            results['cases'][name] = stats
+            timing = stats['us_per_call']
+            print(f"{name:<34}{stats['loops']:>9}{timing['min']:>11.2f}{timing['median']:>11.2f}{timing['stdev']:>9.2f}")
+    
+    path = write_results(results, args.output, 'rate_limit')
+    print(f'\nResults written to {path}')
+    
+    if args.compare and compare(results, load_results(args.compare), args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
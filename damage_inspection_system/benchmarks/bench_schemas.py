@@ -0,0 +1,178 @@
+"""Micro-benchmarks for request validation and response serialization.
+
+Times marshmallow ``load`` on the create/registration/filter schemas, the
+compiled create/update validators, ``Inspections.to_dict`` and ``jsonify`` of
+list responses across payload sizes. Each case is calibrated to run for at least ``--min-time`` seconds per
+repeat (like ``timeit``'s autorange, with the garbage collector disabled) and
+reports min/median/mean/stdev per call in microseconds. Results are saved as
+JSON so runs can be compared between commits:
+
+    python -m benchmarks.bench_schemas
+    python -m benchmarks.bench_schemas --filter load --repeat 11
+    python -m benchmarks.bench_schemas --compare benchmarks/results/schemas-abc1234.json
+"""
+import argparse
+import statistics
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from flask import jsonify
+from marshmallow import ValidationError
+
+from app import create_app
+from app.inspections.models import Inspections, InspectionStatus
+from app.inspections.schemas import (
+    inspection_create_schema, inspection_create_validator, inspection_filter_schema, inspection_update_schema,
+    inspection_update_validator
+)
+from app.users.models import User
+from app.users.schemas import user_registration_schema
+from benchmarks.common import environment, load_results, write_results
+
+REPORT_SIZES = {'small': 10, 'medium': 200, 'large': 1000}
+LIST_SIZES = (1, 20, 100)
+
+
+def inspection_payload(report_length):
+    return {
+        'vehicle_number': 'KA01AB1234',
+        'damage_report': ('Scratch on the rear bumper and dented left door. ' * 25)[:report_length],
+        'image_url': 'https://images.example.com/inspections/1/123456.jpg'
+    }
+
+
+def inspections(count):
+    """Transient inspections with an attached inspector, as returned by a list query"""
+    inspector = User(id=1, username='benchmark_user')
+    created_at = datetime(2025, 1, 1, 9, 30)
+    return [
+        Inspections(id=index + 1, vehicle_number=f'KA01AB{index:04d}', inspected_by=1, inspector=inspector,
+                    damage_report=inspection_payload(200)['damage_report'], status=InspectionStatus.PENDING,
+                    image_url=f'https://images.example.com/inspections/1/{index}.jpg',
+                    created_at=created_at + timedelta(minutes=index))
+        for index in range(count)
+    ]
+
+
+def expect_error(schema, payload):
+    def run():
+        try:
+            schema.load(payload)
+        except ValidationError:
+            return
+        raise AssertionError('payload unexpectedly validated')
+    return run
+
+
+def build_cases():
+    """Ordered mapping of case name to a zero-argument callable"""
+    cases = {}
+    invalid = {'vehicle_number': 'KA', 'damage_report': 'short', 'image_url': 'not-a-url', 'extra': 1}
+    for prefix, create, update in (('load', inspection_create_schema, inspection_update_schema),
+                                   ('compiled', inspection_create_validator, inspection_update_validator)):
+        for size, length in REPORT_SIZES.items():
+            payload = inspection_payload(length)
+            cases[f'{prefix}.inspection_create.{size}'] = lambda create=create, payload=payload: create.load(payload)
+        cases[f'{prefix}.inspection_create.invalid'] = expect_error(create, invalid)
+        cases[f'{prefix}.inspection_update'] = lambda update=update: update.load({'status': 'reviewed'})
+    cases['load.inspection_filter'] = lambda: inspection_filter_schema.load({
+        'status': ['pending,reviewed'], 'created_after': '2025-01-01T00:00:00Z', 'page': '2', 'per_page': '50'
+    })
+    registration = {'username': 'benchmark_user_01', 'password': 'benchmark-password'}
+    cases['load.user_registration'] = lambda: user_registration_schema.load(registration)
+    cases['load.user_registration.invalid'] = expect_error(user_registration_schema, {
+        'username': 'no spaces allowed', 'password': 'short'
+    })
+    
+    for count in LIST_SIZES:
+        rows = inspections(count)
+        cases[f'to_dict.{count}'] = lambda rows=rows: [row.to_dict() for row in rows]
+    for count in LIST_SIZES:
+        body = {'inspections': [row.to_dict() for row in inspections(count)], 'count': count}
+        cases[f'jsonify.{count}'] = lambda body=body: jsonify(body)
+    return cases
+
+
+def measure(func, repeat, min_time):
+    """Per-call timings in seconds for ``repeat`` calibrated runs"""
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time:
+            break
+        loops *= 2
+    return loops, [elapsed / loops for elapsed in timer.repeat(repeat, loops)]
+
+
+def summarize(loops, timings):
+    micro = sorted(t * 1e6 for t in timings)
+    return {
+        'loops': loops,
+        'repeat': len(micro),
+        'us_per_call': {
+            'min': round(micro[0], 3),
+            'median': round(statistics.median(micro), 3),
+            'mean': round(statistics.fmean(micro), 3),
+            'stdev': round(statistics.stdev(micro), 3) if len(micro) > 1 else 0.0
+        }
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print per-case median changes; return True if any regression exceeds threshold"""
+    regressed = False
+    print(f"\nCompared with {baseline['environment']['commit']}:")
+    for name, stats in current['cases'].items():
+        before = baseline['cases'].get(name)
+        if not before:
+            continue
+        median_before = before['us_per_call']['median']
+        change = (stats['us_per_call']['median'] - median_before) / median_before * 100 if median_before else 0.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f'  {name:<34} median {change:+7.1f}%{flag}')
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='Only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=7, help='Timed runs per case (default 7)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per run (default 0.2)')
+    parser.add_argument('--output', help='Result JSON path (default benchmarks/results/schemas-<commit>.json)')
+    parser.add_argument('--compare', help='Baseline result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    args = parser.parse_args(argv)
+    
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'TESTING': True})
+    results = {
+        'benchmark': 'schemas',
+        'environment': environment(),
+        'parameters': {'repeat': args.repeat, 'min_time': args.min_time, 'filter': args.filter},
+        'cases': {}
+    }
+    
+    print(f"{'case':<34}{'loops':>9}{'min us':>11}{'median us':>11}{'stdev':>9}")
+    with app.app_context():
+        for name, func in build_cases().items():
+            if args.filter and args.filter not in name:
+                continue
+            func()
+            stats = summarize(*measure(func, args.repeat, args.min_time))
+            results['cases'][name] = stats
+            timing = stats['us_per_call']
+            print(f"{name:<34}{stats['loops']:>9}{timing['min']:>11.2f}{timing['median']:>11.2f}{timing['stdev']:>9.2f}")
+    
+    path = write_results(results, args.output, 'schemas')
+    print(f'\nResults written to {path}')
+    
+    if args.compare and compare(results, load_results(args.compare), args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
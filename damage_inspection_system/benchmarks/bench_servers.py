@@ -0,0 +1,206 @@
+"""Compare gunicorn worker models on the load test's request mix.
+
+Seeds a database once, then for every worker model starts
+``gunicorn -c gunicorn.conf.py wsgi:app`` on a free local port, drives it with
+the load test's clients and records RPS, latency percentiles and the
+proportional memory (PSS, Linux only) of the master and its workers:
+
+    python -m benchmarks.bench_servers
+    python -m benchmarks.bench_servers --models sync,gthread --workers 4 --threads 8 --concurrency 32
+    python -m benchmarks.bench_servers --no-preload --compare benchmarks/results/servers-abc1234.json
+"""
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from app import create_app
+from app.extensions import db
+from benchmarks.common import environment, load_results, write_results
+from benchmarks.load_test import DEFAULT_MIX, State, parse_mix, run_clients, seed, summarize
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS = ('sync', 'gthread', 'gevent')
+SECRET = 'benchmark'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_serving(port, process, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'gunicorn exited with status {process.returncode}')
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/api/inspection')
+            connection.getresponse().read()
+            connection.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'gunicorn did not start serving on port {port} within {timeout}s')
+
+
+def pss_mb(pid):
+    """Proportional set size of ``pid`` and its children in MB, None where /proc is unavailable"""
+    pids = [pid]
+    try:
+        for task in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{task}/children') as f:
+                pids += [int(child) for child in f.read().split()]
+        total_kb = 0
+        for process_id in pids:
+            with open(f'/proc/{process_id}/smaps_rollup') as f:
+                for line in f:
+                    if line.startswith('Pss:'):
+                        total_kb += int(line.split()[1])
+                        break
+    except OSError:
+        return None
+    return round(total_kb / 1024, 1)
+
+
+def run_model(model, args, database_url, state, log_dir):
+    port = free_port()
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        SECRET_KEY=SECRET,
+        JWT_SECRET_KEY=SECRET,
+        LOG_FILE=os.path.join(log_dir, f'{model}.log'),
+        RATE_LIMIT_ENABLED='false',
+        GUNICORN_BIND=f'127.0.0.1:{port}',
+        GUNICORN_WORKER_CLASS=model,
+        WEB_CONCURRENCY=str(args.workers),
+        GUNICORN_THREADS=str(args.threads if model == 'gthread' else 1),
+        GUNICORN_WORKER_CONNECTIONS=str(args.worker_connections),
+        GUNICORN_PRELOAD='false' if args.no_preload else 'true'
+    )
+    with open(os.path.join(log_dir, f'{model}-server.log'), 'w') as server_log:
+        process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+                                   cwd=PROJECT_DIR, env=env, stdout=server_log, stderr=subprocess.STDOUT)
+        try:
+            wait_until_serving(port, process)
+            print(f'{model}: {args.concurrency} clients for {args.warmup}s warm-up + {args.duration}s on port {port}...')
+            samples, elapsed = run_clients(port, state, args.mix, args.concurrency, args.warmup, args.duration, args.seed)
+            memory = pss_mb(process.pid)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    return {'operations': summarize(samples, elapsed), 'pss_mb': memory}
+
+
+def compare(current, baseline, threshold):
+    """Print per-model changes; return True if any regression exceeds threshold"""
+    regressed = False
+    print(f"\nCompared with {baseline['environment']['commit']}:")
+    for model, result in current['models'].items():
+        before = baseline['models'].get(model, {}).get('operations', {}).get('all')
+        stats = result['operations'].get('all')
+        if not before or not stats or not before['requests']:
+            continue
+        rps_change = (stats['rps'] - before['rps']) / before['rps'] * 100 if before['rps'] else 0.0
+        p95_before = before['latency_ms']['p95']
+        p95_change = (stats['latency_ms']['p95'] - p95_before) / p95_before * 100 if p95_before else 0.0
+        flag = ''
+        if rps_change < -threshold or p95_change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f'  {model:<8} rps {rps_change:+7.1f}%   p95 {p95_change:+7.1f}%{flag}')
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', default=','.join(MODELS), help=f"Worker classes to compare (default {','.join(MODELS)})")
+    parser.add_argument('--workers', type=int, default=2, help='Worker processes per model (default 2)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per gthread worker (default 4)')
+    parser.add_argument('--worker-connections', type=int, default=100, help='Greenlets per gevent worker (default 100)')
+    parser.add_argument('--no-preload', action='store_true', help='Import the app in every worker instead of the master')
+    parser.add_argument('--duration', type=float, default=20.0, help='Measured seconds per model (default 20)')
+    parser.add_argument('--warmup', type=float, default=3.0, help='Unmeasured seconds before measuring')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent client threads')
+    parser.add_argument('--users', type=int, default=200, help='Seeded users')
+    parser.add_argument('--inspections-per-user', type=int, default=50, help='Seeded inspections per user')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f'Operation weights (default {DEFAULT_MIX})')
+    parser.add_argument('--database-url', help='Database to run against (default: fresh SQLite file)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', help='Result JSON path (default benchmarks/results/servers-<commit>.json)')
+    parser.add_argument('--compare', help='Baseline result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    args = parser.parse_args(argv)
+    models = [model.strip() for model in args.models.split(',') if model.strip()]
+    
+    tmpdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir.name, 'servers.db')}"
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url,
+        'SECRET_KEY': SECRET,
+        'JWT_SECRET_KEY': SECRET,
+        'LOG_FILE': os.path.join(tmpdir.name, 'seed.log')
+    })
+    with app.app_context():
+        db.create_all()
+    
+    print(f'Seeding {args.users} users x {args.inspections_per_user} inspections...')
+    state = State(*seed(app, args.users, args.inspections_per_user, args.seed))
+    
+    results = {
+        'benchmark': 'servers',
+        'environment': environment(),
+        'parameters': {
+            'models': models,
+            'workers': args.workers,
+            'threads': args.threads,
+            'worker_connections': args.worker_connections,
+            'preload': not args.no_preload,
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+            'users': args.users,
+            'inspections_per_user': args.inspections_per_user,
+            'mix': dict(args.mix),
+            'database': database_url.split(':', 1)[0],
+            'seed': args.seed
+        },
+        'models': {}
+    }
+    try:
+        for model in models:
+            results['models'][model] = run_model(model, args, database_url, state, tmpdir.name)
+    finally:
+        with app.app_context():
+            if not args.database_url:
+                db.drop_all()
+            db.engine.dispose()
+        tmpdir.cleanup()
+    
+    print(f"\n{'model':<10}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'PSS MB':>9}")
+    for model, result in results['models'].items():
+        stats = result['operations'].get('all')
+        if not stats:
+            continue
+        latency = stats['latency_ms']
+        memory = f"{result['pss_mb']:.1f}" if result['pss_mb'] is not None else '-'
+        print(f"{model:<10}{stats['requests']:>10}{stats['errors']:>8}{stats['rps']:>10.1f}"
+              f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}{memory:>9}")
+    
+    path = write_results(results, args.output, 'servers')
+    print(f'\nResults written to {path}')
+    
+    if args.compare and compare(results, load_results(args.compare), args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
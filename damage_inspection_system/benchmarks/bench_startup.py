@@ -0,0 +1,172 @@
+"""Application start-up benchmark.
+
+Measures what a new worker or test app pays before serving a request:
+
+* ``cold``: fresh interpreters importing ``app`` and calling ``create_app``,
+  timed from inside (import and ``create_app`` separately) and from outside
+  (whole process, including interpreter start-up);
+* ``warm``: ``create_app`` in an interpreter that already imported everything,
+  as for every test app and every app built after a fork.
+
+With ``--importtime`` one extra cold run uses ``python -X importtime`` and
+the cumulative import time of every top-level package is saved (the slowest
+are printed), so ``--compare`` can point out packages that were not imported
+before:
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 21 --importtime --top 25
+    python -m benchmarks.bench_startup --compare benchmarks/results/startup-abc1234.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import environment, load_results, write_results
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLD_START = '''
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app(json.loads(sys.argv[1]))
+created = time.perf_counter()
+print(json.dumps({'import_ms': (imported - start) * 1000, 'create_app_ms': (created - imported) * 1000}))
+'''
+
+
+def app_config(log_dir):
+    return {'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'LOG_FILE': os.path.join(log_dir, 'app.log')}
+
+
+def cold_start(config, importtime=False):
+    """Timings of one fresh interpreter, plus the ``-X importtime`` report if requested"""
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', COLD_START, json.dumps(config)]
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings['process_ms'] = (time.perf_counter() - started) * 1000
+    return timings, result.stderr
+
+
+def parse_importtime(report):
+    """``[(module, self_us, cumulative_us)]`` from ``-X importtime`` output"""
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        if self_us.strip().isdigit():
+            imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def top_level_imports(imports):
+    """Cumulative milliseconds per top-level package, slowest first"""
+    direct = {}
+    for module, self_us, cumulative_us in imports:
+        root = module.split('.')[0]
+        # Nested imports are reported before their parent, so the last
+        # report of a top-level package holds its whole cumulative cost
+        if module == root:
+            direct[root] = cumulative_us
+    ranked = sorted(direct.items(), key=lambda item: item[1], reverse=True)
+    return {module: round(cumulative_us / 1000, 2) for module, cumulative_us in ranked}
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        'min': round(values[0], 2),
+        'median': round(statistics.median(values), 2),
+        'mean': round(statistics.fmean(values), 2),
+        'stdev': round(statistics.stdev(values), 2) if len(values) > 1 else 0.0
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print per-metric median changes; return True if any regression exceeds threshold"""
+    regressed = False
+    print(f"\nCompared with {baseline['environment']['commit']}:")
+    for name, stats in current['cases'].items():
+        before = baseline['cases'].get(name)
+        if not before:
+            continue
+        change = (stats['median'] - before['median']) / before['median'] * 100 if before['median'] else 0.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f'  {name:<24} median {change:+7.1f}%{flag}')
+    
+    before_imports = baseline.get('importtime_ms', {})
+    for module, cumulative_ms in current.get('importtime_ms', {}).items():
+        if module not in before_imports and cumulative_ms >= 1:
+            print(f'  new import: {module} ({cumulative_ms:.1f} ms)')
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=11, help='Cold interpreter runs (default 11)')
+    parser.add_argument('--warm-runs', type=int, default=50, help='In-process create_app calls (default 50)')
+    parser.add_argument('--importtime', action='store_true', help='Record a -X importtime report')
+    parser.add_argument('--top', type=int, default=15, help='Slowest top-level imports to report (default 15)')
+    parser.add_argument('--output', help='Result JSON path (default benchmarks/results/startup-<commit>.json)')
+    parser.add_argument('--compare', help='Baseline result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    args = parser.parse_args(argv)
+    
+    results = {
+        'benchmark': 'startup',
+        'environment': environment(),
+        'parameters': {'runs': args.runs, 'warm_runs': args.warm_runs},
+        'cases': {}
+    }
+    
+    with tempfile.TemporaryDirectory(prefix='bench-startup-') as log_dir:
+        config = app_config(log_dir)
+        cold = [cold_start(config)[0] for _ in range(args.runs)]
+        for metric in ('import_ms', 'create_app_ms', 'process_ms'):
+            results['cases'][f'cold.{metric}'] = summarize([run[metric] for run in cold])
+        
+        from app import create_app
+        create_app(config)
+        warm = []
+        for _ in range(args.warm_runs):
+            started = time.perf_counter()
+            create_app(config)
+            warm.append((time.perf_counter() - started) * 1000)
+        results['cases']['warm.create_app_ms'] = summarize(warm)
+        
+        if args.importtime:
+            _, report = cold_start(config, importtime=True)
+            results['importtime_ms'] = top_level_imports(parse_importtime(report))
+    
+    print(f"{'case':<24}{'min':>10}{'median':>10}{'mean':>10}{'stdev':>9}")
+    for name, stats in results['cases'].items():
+        print(f"{name:<24}{stats['min']:>10.2f}{stats['median']:>10.2f}{stats['mean']:>10.2f}{stats['stdev']:>9.2f}")
+    if 'importtime_ms' in results:
+        print('\nSlowest top-level imports (cumulative ms):')
+        for module, cumulative_ms in list(results['importtime_ms'].items())[:args.top]:
+            print(f'  {module:<30}{cumulative_ms:>9.1f}')
+    
+    path = write_results(results, args.output, 'startup')
+    print(f'\nResults written to {path}')
+    
+    if args.compare and compare(results, load_results(args.compare), args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
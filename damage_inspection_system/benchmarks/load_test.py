@@ -0,0 +1,312 @@
+"""Concurrent load test against a local WSGI server running ``create_app``.
+
+Seeds users and inspections, serves the app with werkzeug's threaded server on
+a free port and drives a weighted mix of signup, login, create, list and PATCH
+requests from worker threads. Reports requests per second and latency
+percentiles per operation and saves them as JSON so runs can be compared
+between commits:
+
+    python -m benchmarks.load_test --duration 30 --concurrency 16
+    python -m benchmarks.load_test --compare benchmarks/results/load-abc1234.json
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import select
+from werkzeug.serving import make_server
+
+from app import create_app
+from app.core.datagen import generate
+from app.extensions import db
+from app.inspections.models import Inspections
+from app.users.models import User
+from benchmarks.common import environment, load_results, percentile, write_results
+
+PASSWORD = 'benchmark-password'
+DEFAULT_MIX = 'signup=1,login=2,create=3,list=10,patch=2'
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+def parse_mix(value):
+    """'op=weight,...' into a list of (op, weight)"""
+    mix = []
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f'Unknown operation {name!r}')
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def seed(app, users, inspections_per_user, seed_value):
+    """Bulk-load users sharing one password and their inspections"""
+    with app.app_context():
+        generate(users, users * inspections_per_user, seed=seed_value, days=90,
+                 prefix='bench', password=PASSWORD, progress=lambda message: None)
+        user_ids = db.session.execute(select(User.id).order_by(User.id)).scalars().all()
+        inspection_ids = defaultdict(list)
+        for inspection_id, user_id in db.session.execute(select(Inspections.id, Inspections.inspected_by)):
+            inspection_ids[user_id].append(inspection_id)
+        tokens = {user_id: create_access_token(identity=user_id) for user_id in user_ids}
+    return user_ids, tokens, inspection_ids
+
+
+class Client:
+    """Minimal JSON-over-HTTP client holding one connection per worker"""
+    
+    def __init__(self, port):
+        self.port = port
+        self.connection = None
+    
+    def request(self, method, path, body=None, token=None):
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        payload = json.dumps(body) if body is not None else None
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                if response.getheader('Connection', '').lower() == 'close' or response.version == 10:
+                    self.close()
+                return response.status, data
+            except (http.client.HTTPException, OSError):
+                self.close()
+                if attempt:
+                    raise
+    
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def op_signup(client, state, rng):
+    username = f'load_{state.next_id()}'
+    return client.request('POST', '/api/signup', {'username': username, 'password': PASSWORD})
+
+
+def op_login(client, state, rng):
+    index = rng.randrange(len(state.user_ids))
+    return client.request('POST', '/api/login', {'username': f'bench_{index}', 'password': PASSWORD})
+
+
+def op_create(client, state, rng):
+    user_id = rng.choice(state.user_ids)
+    return client.request('POST', '/api/inspection', {
+        'vehicle_number': f'LT{rng.randint(10, 99)}XY{rng.randint(1000, 9999)}',
+        'damage_report': 'Rear bumper dented during load test run',
+        'image_url': 'https://example.com/load/damage.jpg'
+    }, token=state.tokens[user_id])
+
+
+def op_list(client, state, rng):
+    user_id = rng.choice(state.user_ids)
+    query = rng.choice(['', '?status=pending', '?status=pending,reviewed', '?per_page=20'])
+    return client.request('GET', f'/api/inspection{query}', token=state.tokens[user_id])
+
+
+def op_patch(client, state, rng):
+    user_id = rng.choice(state.user_ids)
+    inspection_ids = state.inspection_ids.get(user_id)
+    if not inspection_ids:
+        return op_list(client, state, rng)
+    return client.request('PATCH', f'/api/inspection/{rng.choice(inspection_ids)}',
+                          {'status': rng.choice(['reviewed', 'completed'])}, token=state.tokens[user_id])
+
+
+OPERATIONS = {
+    'signup': op_signup,
+    'login': op_login,
+    'create': op_create,
+    'list': op_list,
+    'patch': op_patch
+}
+
+
+class State:
+    def __init__(self, user_ids, tokens, inspection_ids):
+        self.user_ids = user_ids
+        self.tokens = tokens
+        self.inspection_ids = inspection_ids
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+    
+    def next_id(self):
+        with self._lock:
+            return next(self._ids)
+
+
+def worker(port, state, mix, deadline, warmup_until, seed_value, samples):
+    rng = random.Random(seed_value)
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    client = Client(port)
+    try:
+        while True:
+            started = time.perf_counter()
+            if started >= deadline:
+                break
+            name = rng.choices(names, weights)[0]
+            try:
+                status, _ = OPERATIONS[name](client, state, rng)
+            except Exception:
+                status = 0
+            finished = time.perf_counter()
+            if started >= warmup_until:
+                samples.append((name, finished - started, status))
+    finally:
+        client.close()
+
+
+def run_clients(port, state, mix, concurrency, warmup, duration, seed_value):
+    """Drive the server on ``port``; returns the measured samples and seconds"""
+    samples = []
+    warmup_until = time.perf_counter() + warmup
+    deadline = warmup_until + duration
+    threads = [
+        threading.Thread(target=worker, args=(port, state, mix, deadline, warmup_until, seed_value + index, samples))
+        for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - warmup_until
+
+
+def summarize(samples, elapsed):
+    by_operation = defaultdict(list)
+    errors = defaultdict(int)
+    for name, latency, status in samples:
+        by_operation[name].append(latency)
+        if status == 0 or status >= 500:
+            errors[name] += 1
+    by_operation['all'] = [latency for _, latency, _ in samples]
+    errors['all'] = sum(errors.values())
+    
+    summary = {}
+    for name, latencies in sorted(by_operation.items()):
+        latencies.sort()
+        summary[name] = {
+            'requests': len(latencies),
+            'errors': errors[name],
+            'rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': {
+                **{f'p{int(fraction * 100)}': round(percentile(latencies, fraction) * 1000, 3)
+                   for fraction in PERCENTILES},
+                'mean': round(sum(latencies) / len(latencies) * 1000, 3),
+                'max': round(latencies[-1] * 1000, 3)
+            }
+        }
+    return summary
+
+
+def compare(current, baseline, threshold):
+    """Print per-operation changes; return True if any regression exceeds threshold"""
+    regressed = False
+    print(f"\nCompared with {baseline['environment']['commit']}:")
+    for name, stats in current['operations'].items():
+        before = baseline['operations'].get(name)
+        if not before or not before['requests']:
+            continue
+        rps_change = (stats['rps'] - before['rps']) / before['rps'] * 100 if before['rps'] else 0.0
+        p95_before = before['latency_ms']['p95']
+        p95_change = (stats['latency_ms']['p95'] - p95_before) / p95_before * 100 if p95_before else 0.0
+        flag = ''
+        if rps_change < -threshold or p95_change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f'  {name:<8} rps {rps_change:+7.1f}%   p95 {p95_change:+7.1f}%{flag}')
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=20.0, help='Measured seconds (default 20)')
+    parser.add_argument('--warmup', type=float, default=3.0, help='Unmeasured seconds before measuring')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent client threads')
+    parser.add_argument('--users', type=int, default=200, help='Seeded users')
+    parser.add_argument('--inspections-per-user', type=int, default=50, help='Seeded inspections per user')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f'Operation weights (default {DEFAULT_MIX})')
+    parser.add_argument('--database-url', help='Database to run against (default: fresh SQLite file)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', help='Result JSON path (default benchmarks/results/load-<commit>.json)')
+    parser.add_argument('--compare', help='Baseline result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    args = parser.parse_args(argv)
+    
+    tmpdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir.name, 'load.db')}"
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url,
+        'SECRET_KEY': 'benchmark',
+        'JWT_SECRET_KEY': 'benchmark',
+        'RATE_LIMIT_ENABLED': False  # Every client shares one IP
+    })
+    with app.app_context():
+        db.create_all()
+    
+    print(f'Seeding {args.users} users x {args.inspections_per_user} inspections...')
+    state = State(*seed(app, args.users, args.inspections_per_user, args.seed))
+    
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    port = server.server_port
+    
+    print(f'Running {args.concurrency} clients for {args.warmup}s warm-up + {args.duration}s on port {port}...')
+    samples, elapsed = run_clients(port, state, args.mix, args.concurrency, args.warmup, args.duration, args.seed)
+    
+    server.shutdown()
+    with app.app_context():
+        if not args.database_url:
+            db.drop_all()
+        db.engine.dispose()
+    tmpdir.cleanup()
+    
+    results = {
+        'benchmark': 'load_test',
+        'environment': environment(),
+        'parameters': {
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+            'users': args.users,
+            'inspections_per_user': args.inspections_per_user,
+            'mix': dict(args.mix),
+            'database': database_url.split(':', 1)[0],
+            'seed': args.seed
+        },
+        'operations': summarize(samples, elapsed)
+    }
+    
+    print(f"\n{'operation':<10}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in results['operations'].items():
+        latency = stats['latency_ms']
+        print(f"{name:<10}{stats['requests']:>10}{stats['errors']:>8}{stats['rps']:>10.1f}"
+              f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}")
+    
+    path = write_results(results, args.output, 'load')
+    print(f'\nResults written to {path}')
+    
+    if args.compare and compare(results, load_results(args.compare), args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Gunicorn settings: ``gunicorn -c gunicorn.conf.py wsgi:app``
+
+Every setting can be overridden from the environment:
+
+- ``GUNICORN_WORKER_CLASS``: ``sync`` (one request per process), ``gthread``
+  (``GUNICORN_THREADS`` threads per process) or ``gevent`` (greenlets, up to
+  ``GUNICORN_WORKER_CONNECTIONS`` concurrent requests per process)
+- ``WEB_CONCURRENCY``: worker processes (default 2 x CPUs + 1)
+- ``GUNICORN_PRELOAD``: import the app once in the master and fork workers
+  from it, sharing its memory copy-on-write (default true)
+"""
+import gc
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'sync')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 1))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+# Recycle workers after this many requests (0 disables); the jitter avoids
+# restarting them all at once
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 0))
+accesslog = os.getenv('GUNICORN_ACCESS_LOG') or None
+
+if worker_class == 'gevent':
+    # Patch before the preloaded app imports its database drivers, so that
+    # PyMySQL sockets yield to other greenlets
+    from gevent import monkey
+    monkey.patch_all()
+
+
+def when_ready(server):
+    # Move everything the preloaded app allocated out of the collector's
+    # reach, so collections in the workers do not touch (and copy) those pages
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+    from wsgi import app
+    from app.core.server import after_fork
+    after_fork(app)
@@ -0,0 +1,37 @@
+"""Add api keys
+
+Revision ID: 0b4e7a93c2d6
+Revises: f29b6c8e1a47
+Create Date: 2026-10-19 18:22:09.540913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b4e7a93c2d6'
+down_revision = 'f29b6c8e1a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('api_keys',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('prefix', sa.String(length=16), nullable=False),
+    sa.Column('key_hash', sa.String(length=64), nullable=False),
+    sa.Column('scopes', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('prefix')
+    )
+    op.create_index(op.f('ix_api_keys_user_id'), 'api_keys', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_api_keys_user_id'), table_name='api_keys')
+    op.drop_table('api_keys')
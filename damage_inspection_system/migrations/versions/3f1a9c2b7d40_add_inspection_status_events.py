@@ -0,0 +1,42 @@
+"""Add inspection status events
+
+Revision ID: 3f1a9c2b7d40
+Revises: 88f7df125835
+Create Date: 2026-10-19 09:12:41.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2b7d40'
+down_revision = '88f7df125835'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('inspection_status_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('inspection_id', sa.Integer(), nullable=False),
+    sa.Column('from_status', sa.Enum('PENDING', 'REVIEWED', 'COMPLETED', name='inspectionstatus'), nullable=True),
+    sa.Column('to_status', sa.Enum('PENDING', 'REVIEWED', 'COMPLETED', name='inspectionstatus'), nullable=False),
+    sa.Column('changed_by', sa.Integer(), nullable=False),
+    sa.Column('at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['changed_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['inspection_id'], ['inspections.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_inspection_status_events_inspection_id_at', 'inspection_status_events', ['inspection_id', 'at'], unique=False)
+
+    # Backfill the initial status of existing inspections so timelines start at creation
+    op.execute(
+        "INSERT INTO inspection_status_events (inspection_id, from_status, to_status, changed_by, at) "
+        "SELECT id, NULL, status, inspected_by, COALESCE(created_at, CURRENT_TIMESTAMP) FROM inspections"
+    )
+
+
+def downgrade():
+    op.drop_index('ix_inspection_status_events_inspection_id_at', table_name='inspection_status_events')
+    op.drop_table('inspection_status_events')
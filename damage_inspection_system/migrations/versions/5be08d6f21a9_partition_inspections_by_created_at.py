@@ -0,0 +1,76 @@
+"""Partition inspections by created_at
+
+Revision ID: 5be08d6f21a9
+Revises: a72e4d19c3b5
+Create Date: 2026-10-19 11:26:05.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from datetime import date
+
+
+# revision identifiers, used by Alembic.
+revision = '5be08d6f21a9'
+down_revision = 'a72e4d19c3b5'
+branch_labels = None
+depends_on = None
+
+# Months of empty partitions created ahead of today; afterwards
+# `flask inspections partitions` keeps the window rolling.
+MONTHS_AHEAD = 3
+
+
+def _add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_definitions(first, last):
+    definitions = []
+    month = first
+    while month <= last:
+        upper = _add_months(month, 1)
+        definitions.append(
+            f"PARTITION p{month.year:04d}{month.month:02d} VALUES LESS THAN (TO_DAYS('{upper.isoformat()}'))"
+        )
+        month = upper
+    definitions.append('PARTITION p_future VALUES LESS THAN MAXVALUE')
+    return ', '.join(definitions)
+
+
+def upgrade():
+    op.create_index('ix_inspections_inspected_by_created_at', 'inspections', ['inspected_by', 'created_at'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+
+    # Partitioned InnoDB tables support neither foreign keys nor unique keys
+    # that leave out the partitioning column.
+    for fk in sa.inspect(bind).get_foreign_keys('inspections'):
+        op.drop_constraint(fk['name'], 'inspections', type_='foreignkey')
+
+    op.execute("UPDATE inspections SET created_at = UTC_TIMESTAMP() WHERE created_at IS NULL")
+    op.alter_column('inspections', 'created_at', existing_type=sa.DateTime(), nullable=False)
+    op.execute("ALTER TABLE inspections DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)")
+
+    today = date.today()
+    oldest = bind.execute(sa.text("SELECT MIN(created_at) FROM inspections")).scalar() or today
+    first = date(oldest.year, oldest.month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+    op.execute(
+        "ALTER TABLE inspections PARTITION BY RANGE (TO_DAYS(created_at)) "
+        f"({_partition_definitions(first, last)})"
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute("ALTER TABLE inspections REMOVE PARTITIONING")
+        op.execute("ALTER TABLE inspections DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+        op.alter_column('inspections', 'created_at', existing_type=sa.DateTime(), nullable=True)
+        op.create_foreign_key(None, 'inspections', 'users', ['inspected_by'], ['id'])
+
+    op.drop_index('ix_inspections_inspected_by_created_at', table_name='inspections')
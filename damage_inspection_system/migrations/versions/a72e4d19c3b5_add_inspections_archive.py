@@ -0,0 +1,52 @@
+"""Add inspections archive
+
+Revision ID: a72e4d19c3b5
+Revises: 3f1a9c2b7d40
+Create Date: 2026-10-19 10:03:27.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a72e4d19c3b5'
+down_revision = '3f1a9c2b7d40'
+branch_labels = None
+depends_on = None
+
+
+def _status_event_inspection_fk():
+    """Name of the status events -> inspections foreign key, if any"""
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys('inspection_status_events'):
+        if fk['referred_table'] == 'inspections':
+            return fk['name']
+    return None
+
+
+def upgrade():
+    op.create_table('inspections_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('vehicle_number', sa.String(length=20), nullable=False),
+    sa.Column('damage_report', sa.Text(), nullable=False),
+    sa.Column('image_url', sa.Text(), nullable=False),
+    sa.Column('inspected_by', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'REVIEWED', 'COMPLETED', name='inspectionstatus'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['inspected_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_inspections_archive_inspected_by', 'inspections_archive', ['inspected_by'], unique=False)
+
+    # Status history must survive the rows it describes being archived
+    fk_name = _status_event_inspection_fk()
+    if fk_name:
+        op.drop_constraint(fk_name, 'inspection_status_events', type_='foreignkey')
+
+
+def downgrade():
+    op.create_foreign_key('fk_inspection_status_events_inspection_id', 'inspection_status_events',
+                          'inspections', ['inspection_id'], ['id'])
+    op.drop_index('ix_inspections_archive_inspected_by', table_name='inspections_archive')
+    op.drop_table('inspections_archive')
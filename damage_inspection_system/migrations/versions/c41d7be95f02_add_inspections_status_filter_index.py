@@ -0,0 +1,23 @@
+"""Add inspections status filter index
+
+Revision ID: c41d7be95f02
+Revises: 5be08d6f21a9
+Create Date: 2026-10-19 12:48:50.127733
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7be95f02'
+down_revision = '5be08d6f21a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_inspections_inspected_by_status_created_at', 'inspections', ['inspected_by', 'status', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_inspections_inspected_by_status_created_at', table_name='inspections')
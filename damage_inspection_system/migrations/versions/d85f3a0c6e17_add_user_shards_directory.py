@@ -0,0 +1,30 @@
+"""Add user shards directory
+
+Revision ID: d85f3a0c6e17
+Revises: c41d7be95f02
+Create Date: 2026-10-19 14:37:12.662190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd85f3a0c6e17'
+down_revision = 'c41d7be95f02'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_shards',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('shard_key', sa.String(length=32), nullable=False),
+    sa.Column('assigned_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade():
+    op.drop_table('user_shards')
@@ -1,50 +1,272 @@
 import pytest
+from flask import request, request_started, request_finished
 from flask_jwt_extended import create_access_token
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import Engine
 import os
+import re
+import time
 from app import create_app
 from app.extensions import db
-from app.users.models import User
-from app.inspections.models import Inspections, InspectionStatus
+from app.users.models import User, UserShard
+from app.inspections.models import Inspections, InspectionArchive, InspectionStatus, InspectionStatusEvent
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'query_budget(max_queries=None, max_time=None, endpoint=None): fail if a request to endpoint '
+        '("METHOD /rule", default every request) issues more SQL queries or spends more seconds in SQL'
+    )
+
+SAVEPOINT_STATEMENT = re.compile(r'^\s*(RELEASE |ROLLBACK TO )?SAVEPOINT ', re.IGNORECASE)
+
+class QueryRecorder:
+    """Records SQL statements issued through any engine, grouped by request."""
+    
+    def __init__(self):
+        self.queries = []
+        self.requests = []
+        self._current = None
+    
+    def __enter__(self):
+        event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        request_started.connect(self._request_started)
+        request_finished.connect(self._request_finished)
+        return self
+    
+    def __exit__(self, *exc_info):
+        event.remove(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.remove(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        request_started.disconnect(self._request_started)
+        request_finished.disconnect(self._request_finished)
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_recorder_start', []).append(time.perf_counter())
+    
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['query_recorder_start'].pop()
+        if SAVEPOINT_STATEMENT.match(statement):
+            return  # Issued by the db_session fixture, not the code under test
+        query = {'statement': statement, 'parameters': parameters, 'duration': duration}
+        self.queries.append(query)
+        if self._current is not None:
+            self._current['queries'].append(query)
+    
+    def _request_started(self, sender, **extra):
+        rule = request.url_rule.rule if request.url_rule else request.path
+        self._current = {'endpoint': f'{request.method} {rule}', 'queries': []}
+        self.requests.append(self._current)
+    
+    def _request_finished(self, sender, **extra):
+        self._current = None
+    
+    @property
+    def statements(self):
+        return [query['statement'] for query in self.queries]
+    
+    def violations(self, max_queries=None, max_time=None, endpoint=None):
+        """Messages for requests over budget, listing the SQL they issued"""
+        messages = []
+        for recorded in self.requests:
+            if endpoint is not None and recorded['endpoint'] != endpoint:
+                continue
+            queries = recorded['queries']
+            total = sum(query['duration'] for query in queries)
+            if (max_queries is None or len(queries) <= max_queries) and (max_time is None or total <= max_time):
+                continue
+            lines = [f"{recorded['endpoint']} issued {len(queries)} queries in {total * 1000:.1f} ms "
+                     f"(budget: {max_queries} queries, {max_time} s):"]
+            lines += [f"  {number}. [{query['duration'] * 1000:.2f} ms] {' '.join(query['statement'].split())}"
+                      for number, query in enumerate(queries, 1)]
+            messages.append('\n'.join(lines))
+        return messages
+
+@pytest.fixture
+def query_recorder():
+    """Record SQL issued during the test; see QueryRecorder."""
+    with QueryRecorder() as recorder:
+        yield recorder
+
+@pytest.fixture(autouse=True)
+def query_budget_recorder(request):
+    """Record requests of tests marked with query_budget."""
+    if request.node.get_closest_marker('query_budget') is None:
+        yield None
+        return
+    with QueryRecorder() as recorder:
+        request.node.query_budget_recorder = recorder
+        yield recorder
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Fail a query_budget test whose requests exceeded the budget."""
+    result = yield
+    marker = item.get_closest_marker('query_budget')
+    if marker is not None:
+        violations = item.query_budget_recorder.violations(*marker.args, **marker.kwargs)
+        if violations:
+            pytest.fail('Query budget exceeded:\n' + '\n\n'.join(violations), pytrace=False)
+    return result
+
+def worker_database_url():
+    """Database of this pytest(-xdist) worker.
+    
+    TEST_DATABASE_URL may contain ``{worker}`` (e.g.
+    ``mysql+pymysql://root@localhost/inspections_test_{worker}``) so parallel
+    workers never share a database; the default in-memory SQLite database is
+    private to each worker process anyway.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    return os.environ.get('TEST_DATABASE_URL', 'sqlite:///:memory:').format(worker=worker)
+
+def create_test_database(url):
+    """Create a per-worker MySQL database if it does not exist yet"""
+    url = make_url(url)
+    if url.get_backend_name() != 'mysql':
+        return
+    server = create_engine(url.set(database=None))
+    with server.connect() as connection:
+        connection.exec_driver_sql(f'CREATE DATABASE IF NOT EXISTS `{url.database}`')
+    server.dispose()
+
+def enable_sqlite_savepoints(connection):
+    """Let pysqlite run SAVEPOINTs inside the explicit outer transaction.
+    
+    pysqlite's own transaction handling emits BEGIN lazily and breaks nested
+    SAVEPOINTs; disable it on this connection and emit BEGIN ourselves
+    (SQLAlchemy's recipe). Returns a callable restoring the driver default.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    isolation_level = dbapi_connection.isolation_level
+    dbapi_connection.isolation_level = None
+    
+    @event.listens_for(connection, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+    
+    def restore():
+        dbapi_connection.isolation_level = isolation_level
+    return restore
 
 @pytest.fixture(scope='session')
-def app():
+def app(tmp_path_factory):
     """Create application for the tests."""
+    database_url = worker_database_url()
+    create_test_database(database_url)
+    
     # Create a test configuration
     test_config = {
         'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'SQLALCHEMY_DATABASE_URI': database_url,
         'SQLALCHEMY_TRACK_MODIFICATIONS': False,
         'JWT_SECRET_KEY': 'test-secret-key',
-        'WTF_CSRF_ENABLED': False
+        'API_KEY_SECRET': 'test-api-key-secret',
+        'WTF_CSRF_ENABLED': False,
+        'BCRYPT_LOG_ROUNDS': 4,  # Minimum bcrypt cost; production uses 12
+        'RATE_LIMIT_ENABLED': False,
+        'LOGIN_LOCKOUT_ENABLED': False,
+        'SLOW_QUERY_LOG_ENABLED': True,
+        'SLOW_QUERY_LOG_FILE': str(tmp_path_factory.mktemp('logs') / 'slow_queries.log')
     }
     
     app = create_app(test_config)
     
     with app.app_context():
-        db.create_all()
+        db.create_all(bind_key=None)
         yield app
-        db.drop_all()
+        db.drop_all(bind_key=None)
 
 @pytest.fixture(scope='function')
 def client(app):
     """Create a test client for the app."""
     return app.test_client()
 
+class FakeClock:
+    """Clock for time-based components that only moves when ``now`` is set."""
+    
+    def __init__(self, now=0.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at 0."""
+    return FakeClock()
+
+@pytest.fixture
+def app_factory(tmp_path):
+    """Build apps isolated from the session app, each on its own SQLite file.
+    
+    ``app_factory(overrides)`` applies ``overrides`` to the test configuration
+    and creates the tables of the default bind. Engines are disposed after
+    the test.
+    """
+    apps = []
+    
+    def factory(overrides=None):
+        config = {
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / f'app{len(apps)}.db'}",
+            'JWT_SECRET_KEY': 'test-secret-key',
+            'API_KEY_SECRET': 'test-api-key-secret',
+            'BCRYPT_LOG_ROUNDS': 4
+        }
+        config.update(overrides or {})
+        app = create_app(config)
+        with app.app_context():
+            db.create_all(bind_key=None)
+        apps.append(app)
+        return app
+    
+    yield factory
+    
+    for app in apps:
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+
 @pytest.fixture(scope='function')
 def db_session(app):
-    """Create a database session for the tests."""
+    """Run the test inside a transaction that is rolled back afterwards.
+    
+    The session joins the outer transaction through SAVEPOINTs, so commit()
+    and rollback() in the code under test (including requests made with the
+    test client) only release or roll back a savepoint and nothing is left
+    behind for the next test.
+    """
     with app.app_context():
-        # Clean up any existing data
-        db.session.query(Inspections).delete()
-        db.session.query(User).delete()
+        connection = db.engine.connect()
+        restore = enable_sqlite_savepoints(connection) if connection.dialect.name == 'sqlite' else None
+        transaction = connection.begin()
+        session_options = dict(db.session.session_factory.kw)
+        db.session.configure(bind=connection, join_transaction_mode='create_savepoint')
+        try:
+            yield db.session
+        finally:
+            db.session.remove()
+            db.session.session_factory.kw = session_options
+            transaction.rollback()
+            if restore is not None:
+                restore()
+            connection.close()
+
+@pytest.fixture(scope='function')
+def committed_db(app):
+    """Database for tests whose code commits through the engine itself (bulk
+    loaders); tables are emptied before and after instead of rolled back."""
+    def clean():
+        for model in (InspectionStatusEvent, InspectionArchive, Inspections, UserShard, User):
+            db.session.query(model).delete()
         db.session.commit()
+    
+    with app.app_context():
+        clean()
         yield db.session
-        
-        # Clean up after test
         db.session.rollback()
-        db.session.query(Inspections).delete()
-        db.session.query(User).delete()
-        db.session.commit()
+        clean()
 
 @pytest.fixture
 def sample_user(db_session):
@@ -0,0 +1,163 @@
+import pytest
+import logging
+from app.auth.api_keys import ApiKeyVerifier
+from app.auth.models import ApiKey
+
+
+def create_key(client, headers, scopes=('inspections:read',), name='integration'):
+    return client.post('/api/api-keys', headers=headers, json={'name': name, 'scopes': list(scopes)})
+
+
+class TestApiKeyManagement:
+    """Test class for creating, listing and deleting API keys."""
+    
+    def test_create_key(self, client, db_session, auth_headers):
+        """Test the key is returned once and only its HMAC is stored."""
+        response = create_key(client, auth_headers, scopes=['inspections:write', 'inspections:read'])
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['key'].startswith(f"dis_{data['api_key']['prefix']}_")
+        assert data['api_key']['scopes'] == ['inspections:read', 'inspections:write']
+        stored = db_session.get(ApiKey, data['api_key']['id'])
+        assert len(stored.key_hash) == 64
+        assert data['key'] not in stored.key_hash
+    
+    def test_create_key_invalid_scope(self, client, db_session, auth_headers):
+        """Test unknown scopes are rejected."""
+        response = create_key(client, auth_headers, scopes=['admin'])
+        
+        assert response.status_code == 400
+        assert 'scopes' in response.get_json()['error']
+    
+    def test_key_limit(self, client, db_session, auth_headers, app, monkeypatch):
+        """Test a user cannot create more than API_KEY_MAX_PER_USER keys."""
+        monkeypatch.setitem(app.config, 'API_KEY_MAX_PER_USER', 1)
+        create_key(client, auth_headers)
+        
+        response = create_key(client, auth_headers)
+        
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'API key limit reached'
+    
+    def test_list_and_delete(self, client, db_session, auth_headers, another_auth_headers):
+        """Test users only see and delete their own keys."""
+        key_id = create_key(client, auth_headers).get_json()['api_key']['id']
+        
+        listed = client.get('/api/api-keys', headers=auth_headers).get_json()
+        assert listed['count'] == 1
+        assert 'key_hash' not in listed['api_keys'][0]
+        assert client.get('/api/api-keys', headers=another_auth_headers).get_json()['count'] == 0
+        
+        assert client.delete(f'/api/api-keys/{key_id}', headers=another_auth_headers).status_code == 404
+        assert client.delete(f'/api/api-keys/{key_id}', headers=auth_headers).status_code == 200
+        assert db_session.get(ApiKey, key_id) is None
+    
+    def test_api_key_cannot_manage_keys(self, client, db_session, auth_headers):
+        """Test key management requires a JWT, not an API key."""
+        key = create_key(client, auth_headers).get_json()['key']
+        
+        response = client.get('/api/api-keys', headers={'X-API-Key': key})
+        
+        assert response.status_code == 401
+
+
+class TestApiKeyAuthentication:
+    """Test class for calling the inspection endpoints with API keys."""
+    
+    def test_read_with_key(self, client, db_session, auth_headers, sample_inspection, query_recorder):
+        """Test a key with the read scope acts as its user with one indexed lookup."""
+        key = create_key(client, auth_headers).get_json()['key']
+        
+        response = client.get(f'/api/inspection/{sample_inspection.id}', headers={'X-API-Key': key})
+        
+        assert response.status_code == 200
+        assert response.get_json()['inspection']['id'] == sample_inspection.id
+        lookups = [statement for statement in query_recorder.requests[-1]['queries']
+                   if 'FROM api_keys' in statement['statement']]
+        assert len(lookups) == 1
+        assert 'api_keys.prefix = ' in lookups[0]['statement']
+    
+    def test_verified_key_cached(self, client, db_session, auth_headers, query_recorder):
+        """Test repeated requests with a key skip the lookup."""
+        key = create_key(client, auth_headers).get_json()['key']
+        client.get('/api/inspection', headers={'X-API-Key': key})
+        
+        client.get('/api/inspection', headers={'X-API-Key': key})
+        
+        assert not any('FROM api_keys' in query['statement'] for query in query_recorder.requests[-1]['queries'])
+    
+    def test_scope_enforced(self, client, db_session, auth_headers, sample_inspection_data):
+        """Test a read-only key cannot create inspections."""
+        key = create_key(client, auth_headers).get_json()['key']
+        
+        response = client.post('/api/inspection', headers={'X-API-Key': key}, json=sample_inspection_data)
+        
+        assert response.status_code == 403
+        assert response.get_json() == {'error': 'API key lacks scope inspections:write'}
+    
+    def test_write_with_key(self, client, db_session, auth_headers, sample_user, sample_inspection_data):
+        """Test a key with the write scope creates inspections for its user."""
+        key = create_key(client, auth_headers, scopes=['inspections:write']).get_json()['key']
+        
+        response = client.post('/api/inspection', headers={'X-API-Key': key}, json=sample_inspection_data)
+        
+        assert response.status_code == 201
+        assert response.get_json()['inspection']['inspected_by'] == sample_user.id
+    
+    @pytest.mark.parametrize('key', ['dis_000000000000_wrong', 'not-a-key', ''])
+    def test_invalid_key(self, client, db_session, auth_headers, key):
+        """Test unknown and malformed keys are rejected."""
+        create_key(client, auth_headers)
+        
+        response = client.get('/api/inspection', headers={'X-API-Key': key})
+        
+        assert response.status_code == 401
+        assert response.get_json() == {'error': 'Invalid API key'}
+    
+    def test_wrong_secret_with_valid_prefix(self, client, db_session, auth_headers):
+        """Test a key is rejected when only its prefix matches."""
+        key = create_key(client, auth_headers).get_json()['key']
+        
+        response = client.get('/api/inspection', headers={'X-API-Key': key[:-4] + 'AAAA'})
+        
+        assert response.status_code == 401
+    
+    def test_deleted_key_rejected(self, client, db_session, auth_headers):
+        """Test deleting a key drops it from the cache."""
+        created = create_key(client, auth_headers).get_json()
+        client.get('/api/inspection', headers={'X-API-Key': created['key']})
+        
+        client.delete(f"/api/api-keys/{created['api_key']['id']}", headers=auth_headers)
+        
+        assert client.get('/api/inspection', headers={'X-API-Key': created['key']}).status_code == 401
+
+
+class TestApiKeyVerifier:
+    """Test class for key hashing and the verification cache."""
+    
+    def test_hash_keyed_by_secret(self):
+        """Test the same key hashes differently under another secret."""
+        key, prefix, key_hash = ApiKeyVerifier('secret').generate()
+        
+        assert ApiKeyVerifier('secret').hash(key) == key_hash
+        assert ApiKeyVerifier('other').hash(key) != key_hash
+        assert len(prefix) == 12
+    
+    def test_cache_bounded(self, clock):
+        """Test expired entries, then the oldest, are dropped when the cache is full."""
+        verifier = ApiKeyVerifier('secret', cache_seconds=10, cache_size=3, clock=clock)
+        verifier._cache = {f'hash{index}': (1, frozenset(), 10) for index in range(3)}
+        verifier.clock.now = 5
+        
+        verifier._evict(verifier.clock.now)
+        
+        assert list(verifier._cache) == ['hash1', 'hash2']
+    
+    def test_secret_required(self, app_factory, caplog):
+        """Test keys are disabled, not hashed under SECRET_KEY, without API_KEY_SECRET."""
+        with caplog.at_level(logging.ERROR, logger='app.auth.api_keys'):
+            app = app_factory({'SECRET_KEY': 'flask-secret', 'API_KEY_SECRET': None})
+        
+        assert app.extensions['api_keys'] is None
+        assert 'API_KEY_SECRET is not set' in caplog.text
@@ -1,5 +1,6 @@
 import pytest
 import json
+from app.auth.lockout import LoginLockout
 from app.users.models import User
 
 
@@ -296,4 +297,80 @@ class TestAuthEndpoints:
         """Test User model string representation."""
         repr_string = repr(sample_user)
         assert sample_user.username in repr_string
-        assert '<User' in repr_string
\ No newline at end of file
+        assert '<User' in repr_string
+
+
+class TestLoginLockout:
+    """Test class for the failed login lockout."""
+    
+    @pytest.fixture
+    def lockout(self, app, monkeypatch, clock):
+        lockout = LoginLockout(threshold=3, base_seconds=30, max_seconds=100, window_seconds=60, clock=clock)
+        monkeypatch.setitem(app.extensions, 'login_lockout', lockout)
+        return lockout
+    
+    def login(self, client, password):
+        return client.post('/api/login', json={'username': 'testuser', 'password': password})
+    
+    def test_exponential_lockout(self, clock):
+        """Test the lock starts at the threshold and doubles up to the maximum."""
+        lockout = LoginLockout(threshold=3, base_seconds=30, max_seconds=100, clock=clock)
+        
+        durations = [lockout.record_failure('testuser') for _ in range(6)]
+        
+        assert durations == [0, 0, 30, 60, 100, 100]
+        assert lockout.locked_for('testuser') == 100
+        assert lockout.locked_for('otheruser') == 0
+    
+    def test_failures_expire(self, clock):
+        """Test failures are forgotten after the window."""
+        lockout = LoginLockout(threshold=2, window_seconds=60, clock=clock)
+        lockout.record_failure('testuser')
+        
+        clock.now = 61
+        
+        assert lockout.record_failure('testuser') == 0
+    
+    def test_cache_bounded(self, clock):
+        """Test the least recently failed usernames are dropped when full."""
+        lockout = LoginLockout(max_entries=3, clock=clock)
+        for index in range(5):
+            lockout.record_failure(f'user{index}')
+        
+        assert len(lockout) == 3
+        assert lockout.record_failure('user0') == 0
+    
+    def test_eviction_leaves_headroom(self, clock):
+        """Test a full table is trimmed to 90% rather than by one entry."""
+        lockout = LoginLockout(max_entries=20, clock=clock)
+        for index in range(21):
+            lockout.record_failure(f'user{index}')
+        
+        assert len(lockout) == 19
+        lockout.record_failure('user21')
+        assert len(lockout) == 20
+    
+    def test_locked_login_skips_database_and_bcrypt(self, client, db_session, sample_user, lockout, monkeypatch, query_recorder):
+        """Test a locked username is refused with 429 before the lookup and password check."""
+        for _ in range(3):
+            assert self.login(client, 'wrongpassword').status_code == 401
+        checks = []
+        monkeypatch.setattr(User, 'check_password', lambda user, password: checks.append(password))
+        
+        response = self.login(client, 'testpassword123')
+        
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '30'
+        assert response.get_json() == {'error': 'Too many failed login attempts', 'retry_after': 30}
+        assert checks == []
+        assert query_recorder.requests[-1]['queries'] == []
+    
+    def test_login_allowed_after_lock(self, client, db_session, sample_user, lockout):
+        """Test the correct password works once the lock has expired, and resets the count."""
+        for _ in range(3):
+            self.login(client, 'wrongpassword')
+        
+        lockout.clock.now = 31
+        
+        assert self.login(client, 'testpassword123').status_code == 200
+        assert len(lockout) == 0
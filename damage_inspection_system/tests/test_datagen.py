@@ -0,0 +1,86 @@
+import json
+from collections import Counter
+from datetime import datetime
+from app.core.datagen import DataGenerator, generate
+from app.users.models import User
+from app.inspections.models import Inspections, InspectionStatus, InspectionStatusEvent
+
+
+class TestDataGenerator:
+    """Test class for synthetic row generation."""
+    
+    def test_generation_is_reproducible(self):
+        """Test that the same seed yields the same rows."""
+        now = datetime(2026, 1, 1)
+        first = list(DataGenerator(seed=7, now=now).inspection_rows([1, 2, 3], 50))
+        second = list(DataGenerator(seed=7, now=now).inspection_rows([1, 2, 3], 50))
+        
+        assert first == second
+    
+    def test_rows_pass_validation_limits(self):
+        """Test that generated values fit the column and schema limits."""
+        generator = DataGenerator(seed=1, days=365)
+        
+        for row in generator.inspection_rows(list(range(1, 21)), 500):
+            assert 5 <= len(row['vehicle_number']) <= 20
+            assert 10 <= len(row['damage_report']) <= 1000
+            assert row['image_url'].endswith('.jpg')
+            assert (generator.now - row['created_at']).days <= 365
+    
+    def test_old_inspections_are_mostly_completed(self):
+        """Test that status depends on the inspection age."""
+        generator = DataGenerator(seed=3, days=730)
+        rows = list(generator.inspection_rows([1], 2000))
+        
+        old = Counter(row['status'] for row in rows if (generator.now - row['created_at']).days > 60)
+        assert old[InspectionStatus.COMPLETED] > 0.8 * sum(old.values())
+    
+    def test_status_history_ends_in_current_status(self):
+        """Test generated events walk pending -> current status in time order."""
+        generator = DataGenerator(seed=5)
+        inspection = {'id': 1, 'inspected_by': 2, 'status': InspectionStatus.COMPLETED,
+                      'created_at': datetime(2025, 1, 1)}
+        
+        events = list(generator.status_event_rows(inspection))
+        
+        assert [event['to_status'] for event in events] == list(InspectionStatus)
+        assert events[0]['from_status'] is None
+        assert [event['at'] for event in events] == sorted(event['at'] for event in events)
+
+
+class TestGenerateCommand:
+    """Test class for bulk-loading generated data."""
+    
+    def test_generate_bulk_loads_rows(self, app, committed_db):
+        """Test users and inspections are inserted in batches."""
+        counts = generate(20, 300, batch_size=64, with_events=True)
+        
+        assert counts['users'] == 20
+        assert counts['inspections'] == 300
+        assert User.query.count() == 20
+        assert Inspections.query.count() == 300
+        assert InspectionStatusEvent.query.count() == counts['inspection_status_events'] >= 300
+    
+    def test_generated_users_can_log_in(self, client, committed_db):
+        """Test the shared pre-computed password hash is valid."""
+        generate(3, 10, password='generated123')
+        
+        response = client.post('/api/login',
+                             data=json.dumps({'username': 'gen_2', 'password': 'generated123'}),
+                             content_type='application/json')
+        
+        assert response.status_code == 200
+    
+    def test_generate_cli_command(self, app, committed_db):
+        """Test the flask data generate command."""
+        result = app.test_cli_runner().invoke(args=['data', 'generate', '--users', '5', '--inspections', '40'])
+        
+        assert result.exit_code == 0
+        assert '5 users, 40 inspections' in result.output
+    
+    def test_load_data_requires_mysql(self, app, committed_db):
+        """Test LOAD DATA is refused on SQLite."""
+        result = app.test_cli_runner().invoke(args=['data', 'generate', '--method', 'load-data'])
+        
+        assert result.exit_code != 0
+        assert 'only available on MySQL' in result.output
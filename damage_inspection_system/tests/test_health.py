@@ -0,0 +1,188 @@
+import pytest
+import threading
+from sqlalchemy import create_engine
+from app.core.health import MAX_PROBES, HealthCheck, check_engine, pool_status
+from app.extensions import db
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'health.db'}", pool_size=1, max_overflow=0)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def health_app(app_factory, tmp_path):
+    """Application with a shard, so readiness covers several binds."""
+    return app_factory({'SQLALCHEMY_SHARD_URIS': [f"sqlite:///{tmp_path / 'shard.db'}"]})
+
+
+class TestCheckEngine:
+    """Test class for checking a single database."""
+    
+    def test_pool_status(self, engine):
+        """Test connection counts and saturation of a queue pool."""
+        with engine.connect():
+            status = pool_status(engine.pool)
+        
+        assert status['class'] == 'QueuePool'
+        assert status['checked_out'] == 1
+        assert status['saturation'] == 1.0
+    
+    def test_ok(self, engine):
+        """Test a reachable database reports its latency."""
+        status = check_engine(engine)
+        
+        assert status['ok'] is True
+        assert status['latency_ms'] >= 0
+        assert status['pool']['checked_out'] == 0
+    
+    def test_saturated_pool_is_not_a_failure(self, engine):
+        """Test a busy pool passes once a connection is returned in time."""
+        held = engine.connect()
+        threading.Timer(0.05, held.close).start()
+        
+        status = check_engine(engine, timeout=2)
+        
+        assert status['ok'] is True
+    
+    def test_checkout_timeout_fails(self, engine):
+        """Test the check fails when no connection frees up within the timeout."""
+        with engine.connect():
+            status = check_engine(engine, timeout=0.1)
+            assert status['pool']['saturation'] == 1
+        
+        assert status['ok'] is False
+        assert status['error'] == 'Timeout'
+    
+    def test_stuck_probes_are_bounded(self, engine):
+        """Test checks fail fast once every probe slot is held by a stuck probe."""
+        with engine.connect():
+            timed_out = [check_engine(engine, timeout=0.05) for _ in range(MAX_PROBES)]
+            status = check_engine(engine, timeout=0.05)
+        
+        assert {probe['error'] for probe in timed_out} == {'Timeout'}
+        assert status['ok'] is False
+        assert status['error'] == 'Busy'
+    
+    def test_unreachable_database(self, tmp_path):
+        """Test a database that cannot be opened fails the check."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'health.db'}")
+        
+        status = check_engine(engine)
+        
+        assert status['ok'] is False
+        assert status['error'] == 'OperationalError'
+
+
+class TestHealthCheck:
+    """Test class for the cached readiness check."""
+    
+    def test_result_cached_for_ttl(self, engine, clock):
+        """Test databases are queried again only after the TTL expires."""
+        health = HealthCheck(ttl=2, clock=clock)
+        
+        first, cached = health.status({None: engine})
+        assert cached is False
+        assert first['status'] == 'ready'
+        
+        clock.now = 1.5
+        assert health.status({None: engine}) == (first, True)
+        
+        clock.now = 2.5
+        second, cached = health.status({None: engine})
+        assert cached is False
+        assert second is not first
+    
+    def test_concurrent_probe_gets_previous_result(self, engine, clock):
+        """Test a probe arriving during a refresh does not wait for it."""
+        health = HealthCheck(ttl=2, clock=clock)
+        previous, _ = health.status({None: engine})
+        clock.now = 5
+        
+        with health._lock:
+            assert health.status({None: engine}) == (previous, True)
+    
+    def test_optional_database_does_not_fail_readiness(self, engine, tmp_path):
+        """Test an unreachable replica is reported without failing readiness."""
+        replica = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        
+        result, _ = HealthCheck().status({None: engine, 'replica_0': replica}, optional=('replica_0',))
+        
+        assert result['status'] == 'ready'
+        assert result['databases']['default']['required'] is True
+        assert result['databases']['replica_0']['ok'] is False
+        assert result['databases']['replica_0']['required'] is False
+
+
+class TestHealthRoutes:
+    """Test class for the liveness and readiness endpoints."""
+    
+    def test_live(self, client):
+        """Test liveness does not touch the database."""
+        response = client.get('/api/health/live')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'alive'}
+    
+    def test_ready(self, health_app):
+        """Test readiness reports every bind."""
+        response = health_app.test_client().get('/api/health/ready')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['status'] == 'ready'
+        assert data['cached'] is False
+        assert set(data['databases']) == {'default', 'shard_0'}
+    
+    def test_ready_cached(self, health_app):
+        """Test a second probe within the TTL reuses the result."""
+        client = health_app.test_client()
+        client.get('/api/health/ready')
+        
+        response = client.get('/api/health/ready')
+        
+        assert response.get_json()['cached'] is True
+    
+    def test_saturated_shard_stays_ready(self, health_app):
+        """Test a busy shard pool is reported without failing readiness."""
+        health_app.extensions['health_check'].ttl = 0
+        with health_app.app_context():
+            shard = db.engines['shard_0']
+            held = [shard.connect() for _ in range(shard.pool.size())]
+        
+        response = health_app.test_client().get('/api/health/ready')
+        for connection in held:
+            connection.close()
+        
+        assert response.status_code == 200
+        assert response.get_json()['databases']['shard_0']['pool']['saturation'] > 0
+    
+    def test_unavailable_when_bind_times_out(self, app_factory, tmp_path):
+        """Test readiness fails with 503 when a required bind cannot hand out a connection in time."""
+        health_app = app_factory({
+            'SQLALCHEMY_SHARD_URIS': [f"sqlite:///{tmp_path / 'shard.db'}"],
+            'SQLALCHEMY_ENGINE_OPTIONS': {'pool_size': 1, 'max_overflow': 0}
+        })
+        health_app.extensions['health_check'].ttl = 0
+        health_app.extensions['health_check'].timeout = 0.1
+        with health_app.app_context():
+            held = db.engine.connect()
+        
+        response = health_app.test_client().get('/api/health/ready')
+        held.close()
+        
+        assert response.status_code == 503
+        data = response.get_json()
+        assert data['status'] == 'unavailable'
+        assert data['databases']['default']['ok'] is False
+        assert data['databases']['default']['error'] == 'Timeout'
+        assert data['databases']['shard_0']['ok'] is True
+    
+    def test_db_test_delegates_to_readiness(self, health_app):
+        """Test the deprecated /api/db-test endpoint returns the readiness check."""
+        response = health_app.test_client().get('/api/db-test')
+        
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'ready'
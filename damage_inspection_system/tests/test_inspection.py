@@ -1,6 +1,15 @@
 import pytest
 import json
-from app.inspections.models import Inspections, InspectionStatus
+from datetime import date, datetime, timedelta
+from app.inspections.archive import ArchiveError, archive_completed_inspections
+from app.inspections.partitions import (
+    partition_definition,
+    partition_month,
+    partition_name,
+    plan_expired_partitions,
+    plan_future_partitions
+)
+from app.inspections.models import Inspections, InspectionArchive, InspectionStatus, InspectionStatusEvent
 
 
 class TestInspectionEndpoints:
@@ -595,4 +604,341 @@ class TestInspectionValidationSchemas:
         
         assert response.status_code == 404
         response_data = json.loads(response.data)
-        assert response_data['error'] == 'Inspection not found or access denied'
\ No newline at end of file
+        assert response_data['error'] == 'Inspection not found or access denied'
+
+class TestInspectionStatusHistory:
+    """Test class for inspection status history and timeline endpoints."""
+    
+    def _create_inspection(self, client, auth_headers, sample_inspection_data):
+        response = client.post('/api/inspection',
+                             data=json.dumps(sample_inspection_data),
+                             content_type='application/json',
+                             headers=auth_headers)
+        assert response.status_code == 201
+        return json.loads(response.data)['inspection']['id']
+    
+    def test_status_update_records_event(self, client, db_session, sample_user, auth_headers, sample_inspection_data):
+        """Test that creation and status updates append status events."""
+        inspection_id = self._create_inspection(client, auth_headers, sample_inspection_data)
+        
+        for status in ['reviewed', 'completed']:
+            response = client.patch(f'/api/inspection/{inspection_id}',
+                                  data=json.dumps({'status': status}),
+                                  content_type='application/json',
+                                  headers=auth_headers)
+            assert response.status_code == 200
+        
+        events = InspectionStatusEvent.query.filter_by(inspection_id=inspection_id).order_by(InspectionStatusEvent.id).all()
+        assert [(e.from_status, e.to_status) for e in events] == [
+            (None, InspectionStatus.PENDING),
+            (InspectionStatus.PENDING, InspectionStatus.REVIEWED),
+            (InspectionStatus.REVIEWED, InspectionStatus.COMPLETED)
+        ]
+        assert all(e.changed_by == sample_user.id for e in events)
+    
+    def test_failed_update_records_no_event(self, client, db_session, auth_headers, sample_inspection_data):
+        """Test that rejected status updates leave the history untouched."""
+        inspection_id = self._create_inspection(client, auth_headers, sample_inspection_data)
+        
+        response = client.patch(f'/api/inspection/{inspection_id}',
+                              data=json.dumps({'status': 'invalid_status'}),
+                              content_type='application/json',
+                              headers=auth_headers)
+        assert response.status_code == 400
+        assert InspectionStatusEvent.query.filter_by(inspection_id=inspection_id).count() == 1
+    
+    def test_get_timeline_with_time_in_status(self, client, db_session, sample_user, auth_headers, sample_inspection):
+        """Test timeline endpoint returns events and SQL-computed durations."""
+        start = datetime(2025, 1, 1, 10, 0, 0)
+        db_session.add_all([
+            InspectionStatusEvent(inspection_id=sample_inspection.id, from_status=None,
+                                  to_status=InspectionStatus.PENDING, changed_by=sample_user.id, at=start),
+            InspectionStatusEvent(inspection_id=sample_inspection.id, from_status=InspectionStatus.PENDING,
+                                  to_status=InspectionStatus.REVIEWED, changed_by=sample_user.id,
+                                  at=start + timedelta(hours=2)),
+            InspectionStatusEvent(inspection_id=sample_inspection.id, from_status=InspectionStatus.REVIEWED,
+                                  to_status=InspectionStatus.COMPLETED, changed_by=sample_user.id,
+                                  at=start + timedelta(hours=2, minutes=30))
+        ])
+        db_session.commit()
+        
+        response = client.get(f'/api/inspection/{sample_inspection.id}/timeline', headers=auth_headers)
+        
+        assert response.status_code == 200
+        response_data = json.loads(response.data)
+        assert [e['to_status'] for e in response_data['events']] == ['pending', 'reviewed', 'completed']
+        assert response_data['time_in_status']['pending'] == {'seconds': 7200.0, 'entries': 1}
+        assert response_data['time_in_status']['reviewed'] == {'seconds': 1800.0, 'entries': 1}
+        assert response_data['time_in_status']['completed']['seconds'] > 0
+    
+    def test_get_timeline_access_denied(self, client, db_session, sample_inspection, another_auth_headers):
+        """Test timeline retrieval by different user (access denied)."""
+        response = client.get(f'/api/inspection/{sample_inspection.id}/timeline', headers=another_auth_headers)
+        
+        assert response.status_code == 404
+        response_data = json.loads(response.data)
+        assert response_data['error'] == 'Inspection not found or access denied'
+    
+    def test_get_status_durations(self, client, db_session, sample_user, auth_headers, multiple_inspections):
+        """Test average time in status across the user's inspections."""
+        start = datetime(2025, 1, 1, 10, 0, 0)
+        for inspection, hours in zip(multiple_inspections[:2], [1, 3]):
+            db_session.add_all([
+                InspectionStatusEvent(inspection_id=inspection.id, from_status=None,
+                                      to_status=InspectionStatus.PENDING, changed_by=sample_user.id, at=start),
+                InspectionStatusEvent(inspection_id=inspection.id, from_status=InspectionStatus.PENDING,
+                                      to_status=InspectionStatus.COMPLETED, changed_by=sample_user.id,
+                                      at=start + timedelta(hours=hours))
+            ])
+        db_session.commit()
+        
+        response = client.get('/api/inspection/status-durations', headers=auth_headers)
+        
+        assert response.status_code == 200
+        pending = json.loads(response.data)['status_durations']['pending']
+        assert pending['inspections'] == 2
+        assert pending['total_seconds'] == 4 * 3600.0
+        assert pending['average_seconds'] == 2 * 3600.0
+
+
+class TestInspectionArchiving:
+    """Test class for archiving completed inspections."""
+    
+    @pytest.fixture
+    def aged_inspections(self, db_session, sample_user):
+        """Old completed, old pending and recent completed inspections."""
+        old = datetime.utcnow() - timedelta(days=400)
+        inspections = [
+            Inspections(vehicle_number=f'OLDDONE{i}', damage_report='Old completed inspection report',
+                        image_url='https://example.com/old.jpg', inspected_by=sample_user.id,
+                        status=InspectionStatus.COMPLETED, created_at=old)
+            for i in range(3)
+        ]
+        inspections.append(Inspections(vehicle_number='OLDPENDING', damage_report='Old pending inspection report',
+                                       image_url='https://example.com/old.jpg', inspected_by=sample_user.id,
+                                       status=InspectionStatus.PENDING, created_at=old))
+        inspections.append(Inspections(vehicle_number='NEWDONE', damage_report='Recent completed inspection report',
+                                       image_url='https://example.com/new.jpg', inspected_by=sample_user.id,
+                                       status=InspectionStatus.COMPLETED))
+        db_session.add_all(inspections)
+        db_session.commit()
+        return inspections
+    
+    def test_archive_moves_old_completed_in_batches(self, app, db_session, aged_inspections):
+        """Test that only old completed inspections are moved, batch by batch."""
+        archived = archive_completed_inspections(older_than_days=365, batch_size=2, sleep_seconds=0)
+        
+        assert archived == 3
+        assert InspectionArchive.query.count() == 3
+        assert sorted(i.vehicle_number for i in Inspections.query.all()) == ['NEWDONE', 'OLDPENDING']
+    
+    def test_archive_respects_max_batches(self, app, db_session, aged_inspections):
+        """Test that max_batches bounds the work done per run."""
+        archived = archive_completed_inspections(older_than_days=365, batch_size=2, sleep_seconds=0, max_batches=1)
+        
+        assert archived == 2
+        assert InspectionArchive.query.count() == 2
+    
+    def test_archived_ids_not_reused(self, app, db_session, sample_user):
+        """Test a new inspection does not get the id of the archived highest-id row."""
+        old = Inspections(vehicle_number='OLDDONE9', damage_report='Old completed inspection report',
+                          image_url='https://example.com/old.jpg', inspected_by=sample_user.id,
+                          status=InspectionStatus.COMPLETED, created_at=datetime.utcnow() - timedelta(days=400))
+        db_session.add(old)
+        db_session.commit()
+        archived_id = old.id
+        archive_completed_inspections(older_than_days=365, batch_size=10, sleep_seconds=0)
+        
+        new = Inspections(vehicle_number='NEWONE1', damage_report='Brand new inspection report',
+                          image_url='https://example.com/new.jpg', inspected_by=sample_user.id)
+        db_session.add(new)
+        db_session.commit()
+        
+        assert new.id > archived_id
+    
+    def test_archive_refuses_reused_ids(self, app, db_session, aged_inspections):
+        """Test archiving stops instead of colliding with an already archived id."""
+        db_session.add(InspectionArchive(
+            id=aged_inspections[0].id, vehicle_number='REUSED1', damage_report='Archived before the id was reused',
+            image_url='https://example.com/old.jpg', inspected_by=aged_inspections[0].inspected_by,
+            status=InspectionStatus.COMPLETED, created_at=aged_inspections[0].created_at
+        ))
+        db_session.commit()
+        
+        with pytest.raises(ArchiveError):
+            archive_completed_inspections(older_than_days=365, batch_size=10, sleep_seconds=0)
+        
+        assert Inspections.query.count() == 5
+    
+    def test_get_archived_inspection(self, client, db_session, auth_headers, another_auth_headers, aged_inspections):
+        """Test that archived inspections are still readable by their owner only."""
+        inspection_id = aged_inspections[0].id
+        archive_completed_inspections(older_than_days=365, batch_size=10, sleep_seconds=0)
+        
+        response = client.get(f'/api/inspection/{inspection_id}', headers=auth_headers)
+        assert response.status_code == 200
+        response_data = json.loads(response.data)
+        assert response_data['inspection']['id'] == inspection_id
+        assert response_data['inspection']['status'] == 'completed'
+        assert response_data['inspection']['inspector_username'] == 'testuser'
+        
+        response = client.get(f'/api/inspection/{inspection_id}', headers=another_auth_headers)
+        assert response.status_code == 404
+    
+    def test_archive_cli_command(self, app, db_session, aged_inspections):
+        """Test the flask inspections archive command."""
+        result = app.test_cli_runner().invoke(args=['inspections', 'archive', '--older-than-days', '365', '--sleep', '0'])
+        
+        assert result.exit_code == 0
+        assert 'Archived 3 inspections' in result.output
+
+
+class TestInspectionPartitions:
+    """Test class for monthly partition maintenance planning."""
+    
+    def test_partition_names_round_trip(self):
+        """Test partition naming for a month and back."""
+        assert partition_name(date(2026, 3, 1)) == 'p202603'
+        assert partition_month('p202603') == date(2026, 3, 1)
+        assert partition_month('p_future') is None
+    
+    def test_partition_definition_upper_bound(self):
+        """Test that a partition is bounded by the first day of the next month."""
+        assert partition_definition(date(2026, 12, 1)) == \
+            "PARTITION p202612 VALUES LESS THAN (TO_DAYS('2027-01-01'))"
+    
+    def test_plan_future_partitions(self):
+        """Test that only missing months up to the look-ahead are planned."""
+        existing = ['p202608', 'p202609', 'p202610', 'p_future']
+        
+        planned = plan_future_partitions(existing, date(2026, 10, 19), months_ahead=3)
+        
+        assert planned == [date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1)]
+        assert plan_future_partitions(existing + ['p202611', 'p202612', 'p202701'],
+                                      date(2026, 10, 19), months_ahead=3) == []
+    
+    def test_plan_expired_partitions(self):
+        """Test that partitions older than the retention window are selected."""
+        existing = ['p202512', 'p202601', 'p202602', 'p_future']
+        
+        assert plan_expired_partitions(existing, date(2026, 10, 19), retention_months=8) == ['p202512', 'p202601']
+    
+    def test_partitions_command_requires_mysql(self, app):
+        """Test that partition maintenance refuses to run on SQLite."""
+        result = app.test_cli_runner().invoke(args=['inspections', 'partitions'])
+        
+        assert result.exit_code != 0
+        assert 'requires MySQL' in result.output
+
+
+class TestInspectionFilters:
+    """Test class for date range, multi-status and pagination filters."""
+    
+    @pytest.fixture
+    def dated_inspections(self, db_session, sample_user):
+        """Inspections created on consecutive January days with rotating statuses."""
+        statuses = [InspectionStatus.PENDING, InspectionStatus.REVIEWED, InspectionStatus.COMPLETED]
+        inspections = [
+            Inspections(vehicle_number=f'DATED{day:02d}', damage_report='Dated inspection report',
+                        image_url='https://example.com/dated.jpg', inspected_by=sample_user.id,
+                        status=statuses[day % 3], created_at=datetime(2025, 1, day, 12, 0, 0))
+            for day in range(1, 11)
+        ]
+        db_session.add_all(inspections)
+        db_session.commit()
+        return inspections
+    
+    def test_filter_by_date_range(self, client, db_session, auth_headers, dated_inspections):
+        """Test created_after is inclusive and created_before exclusive."""
+        response = client.get('/api/inspection?created_after=2025-01-03T12:00:00&created_before=2025-01-06T12:00:00',
+                            headers=auth_headers)
+        
+        assert response.status_code == 200
+        response_data = json.loads(response.data)
+        assert [i['vehicle_number'] for i in response_data['inspections']] == ['DATED05', 'DATED04', 'DATED03']
+    
+    def test_filter_by_date_with_timezone(self, client, db_session, auth_headers, dated_inspections):
+        """Test that aware datetimes are compared in UTC."""
+        response = client.get('/api/inspection?created_after=2025-01-10T14:00:00%2B02:00', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert [i['vehicle_number'] for i in json.loads(response.data)['inspections']] == ['DATED10']
+    
+    def test_filter_by_multiple_statuses(self, client, db_session, auth_headers, dated_inspections):
+        """Test repeated and comma-separated status values."""
+        for query in ['status=pending&status=completed', 'status=pending,completed']:
+            response = client.get(f'/api/inspection?{query}', headers=auth_headers)
+            
+            assert response.status_code == 200
+            response_data = json.loads(response.data)
+            assert response_data['count'] == 6
+            assert {i['status'] for i in response_data['inspections']} == {'pending', 'completed'}
+    
+    def test_invalid_date_range(self, client, db_session, auth_headers, dated_inspections):
+        """Test inverted or malformed date ranges are rejected."""
+        for query in ['created_after=2025-01-05T00:00:00&created_before=2025-01-01T00:00:00',
+                      'created_after=yesterday']:
+            response = client.get(f'/api/inspection?{query}', headers=auth_headers)
+            
+            assert response.status_code == 400
+            assert json.loads(response.data)['error'] == 'Failed to retrieve inspections'
+    
+    def test_pagination_composes_with_filters(self, client, db_session, auth_headers, dated_inspections):
+        """Test that pages are sliced from the filtered, ordered result."""
+        response = client.get('/api/inspection?status=pending,reviewed&per_page=3&page=1', headers=auth_headers)
+        first_page = json.loads(response.data)
+        response = client.get('/api/inspection?status=pending,reviewed&per_page=3&page=3', headers=auth_headers)
+        last_page = json.loads(response.data)
+        
+        assert [i['vehicle_number'] for i in first_page['inspections']] == ['DATED10', 'DATED09', 'DATED07']
+        assert first_page['has_more'] is True
+        assert first_page['page'] == 1 and first_page['per_page'] == 3
+        assert [i['vehicle_number'] for i in last_page['inspections']] == ['DATED01']
+        assert last_page['has_more'] is False
+    
+    def test_invalid_pagination(self, client, db_session, auth_headers):
+        """Test out of range page parameters are rejected."""
+        for query in ['page=0', 'per_page=101', 'per_page=abc']:
+            response = client.get(f'/api/inspection?{query}', headers=auth_headers)
+            assert response.status_code == 400
+
+
+class TestInspectionQueryBudget:
+    """Test class for the number of SQL queries issued per request."""
+    
+    @pytest.fixture(params=[1, 60])
+    def many_inspections(self, request, db_session, sample_user, another_user):
+        """Inspections of both users; the identity map is cleared so nothing is pre-loaded."""
+        db_session.add_all([
+            Inspections(vehicle_number=f'BUDGET{index:03d}', damage_report='Query budget inspection',
+                        image_url='https://example.com/budget.jpg',
+                        inspected_by=(sample_user if index % 4 else another_user).id)
+            for index in range(request.param)
+        ])
+        db_session.commit()
+        db_session.expunge_all()
+    
+    @pytest.mark.query_budget(2, endpoint='GET /api/inspection')
+    def test_list_inspections_query_budget(self, client, db_session, auth_headers, many_inspections):
+        """Test listing issues at most 2 queries regardless of row count."""
+        response = client.get('/api/inspection', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert all(i['inspector_username'] == 'testuser' for i in json.loads(response.data)['inspections'])
+    
+    @pytest.mark.query_budget(2, endpoint='GET /api/inspection')
+    def test_paginated_list_query_budget(self, client, db_session, auth_headers, many_inspections):
+        """Test filtered, paginated listing stays within budget."""
+        response = client.get('/api/inspection?status=pending,reviewed&per_page=50', headers=auth_headers)
+        
+        assert response.status_code == 200
+    
+    def test_violations_list_offending_sql(self, client, db_session, auth_headers, many_inspections, query_recorder):
+        """Test the recorder reports requests over budget with their SQL."""
+        client.get('/api/inspection', headers=auth_headers)
+        
+        violations = query_recorder.violations(max_queries=0, endpoint='GET /api/inspection')
+        assert len(violations) == 1
+        assert 'GET /api/inspection issued' in violations[0]
+        assert 'FROM inspections' in violations[0]
+        assert query_recorder.violations(max_queries=0, endpoint='POST /api/inspection') == []
@@ -0,0 +1,130 @@
+import pytest
+import json
+import logging
+from app.core.logger import JsonFormatter, SamplingFilter, parse_sample_rates, setup_logger
+
+
+def make_record(name='app.inspections.services', level=logging.INFO, message='Retrieved %s inspections', args=(3,), **extra):
+    record = logging.LogRecord(name, level, __file__, 10, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    """Test class for structured log lines."""
+    
+    def test_json_line_fields(self):
+        """Test records are rendered as one JSON object with extras."""
+        line = JsonFormatter().format(make_record(request_id='req-1', user_id=7))
+        entry = json.loads(line)
+        
+        assert entry['level'] == 'INFO'
+        assert entry['logger'] == 'app.inspections.services'
+        assert entry['message'] == 'Retrieved 3 inspections'
+        assert entry['request_id'] == 'req-1'
+        assert entry['user_id'] == 7
+        assert entry['ts'].endswith('+00:00')
+        assert '\n' not in line
+    
+    def test_json_includes_exception(self):
+        """Test tracebacks are kept in a single field."""
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            record = logging.LogRecord('app', logging.ERROR, __file__, 1, 'failed', None, __import__('sys').exc_info())
+        
+        entry = json.loads(JsonFormatter().format(record))
+        assert 'ValueError: boom' in entry['exception']
+
+
+class TestSamplingFilter:
+    """Test class for per-logger sampling."""
+    
+    def test_parse_sample_rates(self):
+        """Test rates parse from env-style strings and dicts."""
+        assert parse_sample_rates('app.core.logger=0.05, app.inspections=0.1') == {
+            'app.core.logger': 0.05, 'app.inspections': 0.1
+        }
+        assert parse_sample_rates('') == {}
+        assert parse_sample_rates({'app': 1}) == {'app': 1.0}
+    
+    def test_longest_prefix_wins(self):
+        """Test the most specific logger prefix decides the rate."""
+        sampling = SamplingFilter({'app': 0.5, 'app.inspections': 0.0})
+        
+        assert sampling.rate_for('app.inspections.services') == 0.0
+        assert sampling.rate_for('app.auth.services') == 0.5
+        assert sampling.rate_for('application') == 1.0
+    
+    def test_warnings_always_kept(self):
+        """Test records at WARNING and above bypass sampling."""
+        sampling = SamplingFilter({'app': 0.0})
+        
+        assert not sampling.filter(make_record('app.core.logger', logging.INFO))
+        assert sampling.filter(make_record('app.core.logger', logging.WARNING))
+        assert sampling.filter(make_record('app.core.logger', logging.ERROR))
+    
+    def test_sampling_reduces_volume_per_request(self, app):
+        """Test roughly the configured share of requests keep their INFO lines, all or nothing."""
+        sampling = SamplingFilter({'app': 0.1})
+        kept = 0
+        for index in range(2000):
+            with app.test_request_context('/api/inspection', headers={'X-Request-ID': f'req-{index}'}):
+                app.preprocess_request()
+                decisions = {sampling.filter(make_record(name)) for name in ('app.core.logger', 'app.inspections.services')}
+            assert len(decisions) == 1
+            kept += decisions.pop()
+        
+        assert 100 < kept < 300
+
+
+class TestSetupLogger:
+    """Test class for logger configuration."""
+    
+    @pytest.fixture
+    def root_handlers(self):
+        root = logging.getLogger()
+        saved = list(root.handlers), root.level
+        yield root
+        for handler in list(root.handlers):
+            if handler not in saved[0]:
+                root.removeHandler(handler)
+                handler.close()
+        for handler in saved[0]:
+            if handler not in root.handlers:
+                root.addHandler(handler)
+        root.setLevel(saved[1])
+    
+    def test_setup_replaces_its_handlers(self, root_handlers, tmp_path):
+        """Test repeated setup does not stack handlers and applies the format."""
+        config = {'LOG_FILE': str(tmp_path / 'app.log'), 'LOG_FORMAT': 'json',
+                  'LOG_SAMPLE_RATES': 'app.sampled=0'}
+        setup_logger(config)
+        setup_logger(config)
+        
+        app_handlers = [handler for handler in root_handlers.handlers if getattr(handler, 'app_handler', False)]
+        assert len(app_handlers) == 2
+        
+        logging.getLogger('app.sampled').info('dropped')
+        logging.getLogger('app.sampled').warning('kept %s', 'warning')
+        logging.getLogger('app.other').info('kept info')
+        app_handlers[0].flush()
+        
+        lines = [json.loads(line) for line in (tmp_path / 'app.log').read_text().splitlines()]
+        assert [line['message'] for line in lines] == ['kept warning', 'kept info']
+        assert lines[0]['request_id'] == '-'
+    
+    def test_setup_keeps_unchanged_handlers(self, root_handlers, tmp_path):
+        """Test setup with the same settings reuses the open handlers."""
+        config = {'LOG_FILE': str(tmp_path / 'app.log')}
+        setup_logger(config)
+        first = [handler for handler in root_handlers.handlers if getattr(handler, 'app_handler', None)]
+        setup_logger(dict(config, LOG_LEVEL='WARNING'))
+        
+        assert [handler for handler in root_handlers.handlers if getattr(handler, 'app_handler', None)] == first
+        assert root_handlers.level == logging.WARNING
+        
+        setup_logger(dict(config, LOG_FORMAT='json'))
+        replaced = [handler for handler in root_handlers.handlers if getattr(handler, 'app_handler', None)]
+        assert len(replaced) == 2
+        assert not set(replaced) & set(first)
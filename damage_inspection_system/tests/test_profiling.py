@@ -0,0 +1,128 @@
+import pytest
+import threading
+import time
+from flask_jwt_extended import create_access_token
+from app.core.profiling import ProfileStore, StackSampler
+from app.extensions import db
+from app.users.models import User
+
+
+def busy_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+@pytest.fixture
+def profiled_app(app_factory):
+    """App with the profiler on, sampling only requests that send the header."""
+    app = app_factory({
+        'PROFILER_ENABLED': True,
+        'PROFILER_SAMPLE_RATE': 0.0,
+        'PROFILER_HEADER_SECRET': 'profile-secret',
+        'ADMIN_USERNAMES': ['admin']
+    })
+    with app.app_context():
+        admin = User(username='admin')
+        admin.set_password('adminpassword')
+        db.session.add(admin)
+        db.session.commit()
+        app.config['ADMIN_HEADERS'] = {'Authorization': f'Bearer {create_access_token(identity=admin.id)}'}
+    return app
+
+
+class TestStackSampler:
+    """Test class for the stack sampler and profile store."""
+    
+    def test_sampler_collects_collapsed_stacks(self):
+        """Test samples of the target thread are root-first module:function stacks."""
+        sampler = StackSampler(threading.get_ident(), interval=0.001).start()
+        busy_work(0.1)
+        stacks = sampler.stop()
+        
+        assert sum(stacks.values()) > 0
+        assert any(stack.endswith(f'{__name__}:busy_work') for stack in stacks)
+        assert all(';' in stack for stack in stacks)
+    
+    def test_store_aggregates_and_caps_stacks(self):
+        """Test stacks are summed per endpoint and new stacks are dropped when full."""
+        store = ProfileStore(max_stacks=2)
+        store.add('inspections.create_inspection', {'a;b': 2, 'a;c': 1})
+        store.add('inspections.create_inspection', {'a;b': 1, 'a;d': 5})
+        
+        assert store.summary() == {'inspections.create_inspection': {'requests': 2, 'samples': 9}}
+        assert store.collapsed('inspections.create_inspection') == 'a;b 3\na;c 1\n'
+        assert store.collapsed('unknown') is None
+
+
+class TestProfilerMiddleware:
+    """Test class for request profiling and the admin download endpoints."""
+    
+    def test_disabled_profiler_installs_no_hooks(self, app):
+        """Test the default app has no profiler hooks."""
+        assert app.extensions['profiler'] is None
+        assert not any('profiling' in hook.__name__ for hooks in app.before_request_funcs.values() for hook in hooks)
+    
+    def test_header_triggers_profiling(self, profiled_app):
+        """Test only requests with the debug header and its secret are profiled."""
+        client = profiled_app.test_client()
+        client.get('/api/test')
+        client.get('/api/test', headers={'X-Profile': 'profile-secret'})
+        
+        assert profiled_app.extensions['profiler'].summary()['auth.test']['requests'] == 1
+    
+    def test_header_ignored_without_secret_or_admin(self, profiled_app):
+        """Test anonymous and non-admin clients cannot trigger profiling."""
+        client = profiled_app.test_client()
+        client.get('/api/test', headers={'X-Profile': '1'})
+        client.get('/api/test', headers={'X-Profile': '1', 'Authorization': 'Bearer invalid'})
+        
+        assert profiled_app.extensions['profiler'].summary() == {}
+    
+    def test_header_allowed_for_admins(self, profiled_app):
+        """Test an admin's access token lets the header profile the request."""
+        client = profiled_app.test_client()
+        client.get('/api/test', headers={'X-Profile': '1', **profiled_app.config['ADMIN_HEADERS']})
+        
+        assert profiled_app.extensions['profiler'].summary()['auth.test']['requests'] == 1
+    
+    def test_sample_rate_profiles_requests(self, profiled_app, monkeypatch):
+        """Test requests without the header are profiled at the sample rate."""
+        monkeypatch.setitem(profiled_app.config, 'PROFILER_SAMPLE_RATE', 0.5)
+        draws = iter([0.9, 0.1, 0.7, 0.3])
+        monkeypatch.setattr('app.core.profiling.random.random', lambda: next(draws))
+        client = profiled_app.test_client()
+        for _ in range(4):
+            client.get('/api/test')
+        
+        assert profiled_app.extensions['profiler'].summary()['auth.test']['requests'] == 2
+    
+    def test_download_collapsed_stacks(self, profiled_app):
+        """Test admins can list and download collapsed stacks per endpoint."""
+        client = profiled_app.test_client()
+        headers = profiled_app.config['ADMIN_HEADERS']
+        client.post('/api/login', json={'username': 'admin', 'password': 'adminpassword'},
+                    headers={'X-Profile': 'profile-secret'})
+        
+        summary = client.get('/api/admin/profiles', headers=headers).get_json()['profiles']
+        assert summary['auth.login']['requests'] == 1
+        
+        response = client.get('/api/admin/profiles/auth.login', headers=headers)
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert 'auth.login.collapsed' in response.headers['Content-Disposition']
+        for line in response.get_data(as_text=True).splitlines():
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0
+        
+        assert client.get('/api/admin/profiles/unknown', headers=headers).status_code == 404
+        assert client.delete('/api/admin/profiles', headers=headers).status_code == 200
+        assert client.get('/api/admin/profiles', headers=headers).get_json()['profiles'] == {}
+    
+    def test_profiles_disabled(self, client, db_session, auth_headers, app, monkeypatch):
+        """Test the admin endpoints report a disabled profiler."""
+        monkeypatch.setitem(app.config, 'ADMIN_USERNAMES', ['testuser'])
+        
+        response = client.get('/api/admin/profiles', headers=auth_headers)
+        
+        assert response.status_code == 404
@@ -0,0 +1,156 @@
+import pytest
+from flask_jwt_extended import create_access_token
+from app.core.rate_limit import MemoryBackend, RateLimitBackend, parse_rate
+from app.extensions import db
+from app.users.models import User
+
+
+class FailingBackend(RateLimitBackend):
+    def consume(self, key, rate):
+        raise ConnectionError('store unreachable')
+
+
+@pytest.fixture
+def limited_app(app_factory):
+    """App allowing two auth requests per IP and two inspection requests per user."""
+    app = app_factory({
+        'RATE_LIMIT_AUTH': '2/minute',
+        'RATE_LIMIT_INSPECTIONS': '2/minute'
+    })
+    with app.app_context():
+        users = [User(username=f'limited_{index}') for index in range(2)]
+        for user in users:
+            user.set_password('password123')
+        db.session.add_all(users)
+        db.session.commit()
+        app.config['USER_HEADERS'] = [
+            {'Authorization': f'Bearer {create_access_token(identity=user.id)}'} for user in users
+        ]
+    return app
+
+
+def login(client, ip='10.0.0.1'):
+    return client.post('/api/login', json={'username': 'limited_0', 'password': 'password123'},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+class TestMemoryBackend:
+    """Test class for the in-process token buckets."""
+    
+    def test_parse_rate(self):
+        """Test rates are parsed into requests per period seconds."""
+        assert parse_rate('10/minute') == (10, 60)
+        assert parse_rate('5/seconds').interval == 0.2
+        with pytest.raises(ValueError):
+            parse_rate('10/fortnight')
+    
+    def test_burst_then_refused(self, clock):
+        """Test a full bucket allows ``limit`` requests, then reports the wait."""
+        backend = MemoryBackend(clock=clock)
+        rate = parse_rate('3/minute')
+        
+        results = [backend.consume('ip:1', rate) for _ in range(4)]
+        
+        assert [result[:2] for result in results[:3]] == [(True, 2), (True, 1), (True, 0)]
+        allowed, remaining, retry_after = results[3]
+        assert allowed is False
+        assert remaining == 0
+        assert retry_after == pytest.approx(20)
+    
+    def test_tokens_refill(self, clock):
+        """Test one token comes back every ``period / limit`` seconds."""
+        backend = MemoryBackend(clock=clock)
+        rate = parse_rate('3/minute')
+        for _ in range(3):
+            backend.consume('ip:1', rate)
+        
+        clock.now += 20
+        assert backend.consume('ip:1', rate)[0] is True
+        assert backend.consume('ip:1', rate)[0] is False
+        
+        clock.now += 600
+        assert backend.consume('ip:1', rate)[:2] == (True, 2)
+    
+    def test_keys_independent(self, clock):
+        """Test every key has its own bucket."""
+        backend = MemoryBackend(clock=clock)
+        rate = parse_rate('1/minute')
+        
+        assert backend.consume('ip:1', rate)[0] is True
+        assert backend.consume('ip:2', rate)[0] is True
+        assert backend.consume('ip:1', rate)[0] is False
+    
+    def test_store_bounded(self, clock):
+        """Test full buckets, then the oldest, are dropped when the store is full."""
+        backend = MemoryBackend(max_keys=10, clock=clock)
+        rate = parse_rate('1/second')
+        for index in range(10):
+            backend.consume(f'old:{index}', rate)
+        clock.now += 0.5
+        for index in range(20):
+            backend.consume(f'new:{index}', rate)
+        
+        assert len(backend) <= 10
+        assert backend.consume('new:19', rate)[0] is False
+
+
+class TestRateLimitedRoutes:
+    """Test class for limits on the API endpoints."""
+    
+    def test_login_limited_per_ip(self, limited_app):
+        """Test auth requests over the limit get 429 with Retry-After."""
+        client = limited_app.test_client()
+        first = login(client)
+        assert first.status_code == 200
+        assert first.headers['X-RateLimit-Limit'] == '2'
+        assert first.headers['X-RateLimit-Remaining'] == '1'
+        assert login(client).status_code == 200
+        
+        response = login(client)
+        
+        assert response.status_code == 429
+        assert response.get_json() == {'error': 'Too many requests'}
+        assert response.headers['Retry-After'] == '30'
+        assert login(client, ip='10.0.0.2').status_code == 200
+    
+    def test_signup_shares_auth_limit(self, limited_app):
+        """Test signup and login draw from the same per-IP bucket."""
+        client = limited_app.test_client()
+        login(client)
+        login(client)
+        
+        response = client.post('/api/signup', json={'username': 'newcomer', 'password': 'password123'},
+                               environ_base={'REMOTE_ADDR': '10.0.0.1'})
+        
+        assert response.status_code == 429
+    
+    def test_inspections_limited_per_user(self, limited_app):
+        """Test inspection requests are limited by JWT identity, not by IP."""
+        client = limited_app.test_client()
+        first, second = limited_app.config['USER_HEADERS']
+        for _ in range(2):
+            assert client.get('/api/inspection', headers=first).status_code == 200
+        
+        assert client.get('/api/inspection', headers=first).status_code == 429
+        assert client.get('/api/inspection', headers=second).status_code == 200
+    
+    def test_backend_failure_allows_requests(self, limited_app):
+        """Test requests are let through when the bucket store fails."""
+        limited_app.extensions['rate_limiter'].backend = FailingBackend()
+        client = limited_app.test_client()
+        
+        responses = [login(client) for _ in range(3)]
+        
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert 'X-RateLimit-Remaining' not in responses[0].headers
+    
+    def test_backend_must_implement_consume(self):
+        """Test the backend interface cannot be used without consume."""
+        with pytest.raises(TypeError):
+            RateLimitBackend()
+    
+    def test_disabled(self, client):
+        """Test no limits apply when RATE_LIMIT_ENABLED is off."""
+        responses = [client.post('/api/login', json={}) for _ in range(20)]
+        
+        assert all(response.status_code == 400 for response in responses)
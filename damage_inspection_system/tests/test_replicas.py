@@ -0,0 +1,128 @@
+import pytest
+import json
+from datetime import datetime
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+from app.extensions import db
+from app.users.models import User
+from app.inspections.models import Inspections, InspectionStatus
+
+
+@pytest.fixture
+def replica_app(app_factory, tmp_path):
+    """Application with a primary and a replica backed by two SQLite files."""
+    app = app_factory({
+        'SQLALCHEMY_REPLICA_URIS': [f"sqlite:///{tmp_path / 'replica.db'}"],
+        'REPLICA_STICKY_SECONDS': 0
+    })
+    
+    with app.app_context():
+        db.metadata.create_all(db.engines['replica_0'])
+    
+    # Requests push their own app context, as they do outside tests
+    return app
+
+
+@pytest.fixture
+def replica_client(replica_app):
+    return replica_app.test_client()
+
+
+def _seed(app, bind_key, inspection_id, vehicle_number):
+    """Insert a user and one of their inspections directly into a database."""
+    with app.app_context(), db.engines[bind_key].begin() as connection:
+        connection.execute(insert(User.__table__), [{
+            'id': 1, 'username': 'replicauser', 'password_hash': 'x', 'created_at': datetime.utcnow()
+        }])
+        connection.execute(insert(Inspections.__table__), [{
+            'id': inspection_id, 'vehicle_number': vehicle_number, 'damage_report': 'Replica routing report',
+            'image_url': 'https://example.com/replica.jpg', 'inspected_by': 1,
+            'status': InspectionStatus.PENDING, 'created_at': datetime.utcnow()
+        }])
+
+
+@pytest.fixture
+def replica_headers(replica_app):
+    with replica_app.app_context():
+        return {'Authorization': f'Bearer {create_access_token(identity=1)}'}
+
+
+class TestReadReplicaRouting:
+    """Test class for routing read-only service methods to replicas."""
+    
+    def test_reads_use_replica(self, replica_app, replica_client, replica_headers):
+        """Test that GET endpoints read from the replica."""
+        _seed(replica_app, None, 1, 'PRIMARY1')
+        _seed(replica_app, 'replica_0', 1, 'REPLICA1')
+        
+        response = replica_client.get('/api/inspection/1', headers=replica_headers)
+        assert json.loads(response.data)['inspection']['vehicle_number'] == 'REPLICA1'
+        
+        response = replica_client.get('/api/inspection', headers=replica_headers)
+        assert json.loads(response.data)['inspections'][0]['vehicle_number'] == 'REPLICA1'
+        
+        response = replica_client.get('/api/profile', headers=replica_headers)
+        assert response.status_code == 200
+    
+    def test_writes_use_primary(self, replica_app, replica_client, replica_headers):
+        """Test that writes land on the primary only."""
+        _seed(replica_app, None, 1, 'PRIMARY1')
+        _seed(replica_app, 'replica_0', 1, 'REPLICA1')
+        
+        response = replica_client.patch('/api/inspection/1',
+                                      data=json.dumps({'status': 'reviewed'}),
+                                      content_type='application/json',
+                                      headers=replica_headers)
+        
+        assert response.status_code == 200
+        assert json.loads(response.data)['inspection']['vehicle_number'] == 'PRIMARY1'
+        with replica_app.app_context(), db.engines['replica_0'].connect() as connection:
+            status = connection.execute(Inspections.__table__.select()).first().status
+        assert status == InspectionStatus.PENDING
+    
+    def test_read_your_writes_is_sticky(self, replica_app, replica_client, replica_headers):
+        """Test that a client reads from the primary right after writing."""
+        _seed(replica_app, None, 1, 'PRIMARY1')
+        _seed(replica_app, 'replica_0', 1, 'REPLICA1')
+        replica_app.extensions['replica_router'].sticky_seconds = 60
+        
+        response = replica_client.post('/api/inspection',
+                                     data=json.dumps({
+                                         'vehicle_number': 'STICKY123',
+                                         'damage_report': 'Written to the primary only',
+                                         'image_url': 'https://example.com/sticky.jpg'
+                                     }),
+                                     content_type='application/json',
+                                     headers=replica_headers)
+        inspection_id = json.loads(response.data)['inspection']['id']
+        
+        response = replica_client.get(f'/api/inspection/{inspection_id}', headers=replica_headers)
+        assert response.status_code == 200
+        
+        replica_app.extensions['replica_router'].sticky_seconds = 0
+        response = replica_client.get(f'/api/inspection/{inspection_id}', headers=replica_headers)
+        assert response.status_code == 404
+    
+    def test_lagging_replica_falls_back_to_primary(self, replica_app, replica_client, replica_headers):
+        """Test that replicas behind the lag threshold are skipped."""
+        _seed(replica_app, None, 1, 'PRIMARY1')
+        _seed(replica_app, 'replica_0', 1, 'REPLICA1')
+        router = replica_app.extensions['replica_router']
+        router.lag_probe = lambda engine: router.max_lag_seconds + 1
+        
+        response = replica_client.get('/api/inspection/1', headers=replica_headers)
+        
+        assert json.loads(response.data)['inspection']['vehicle_number'] == 'PRIMARY1'
+    
+    def test_broken_replica_falls_back_to_primary(self, replica_app, replica_client, replica_headers):
+        """Test that a failing lag probe marks the replica unhealthy."""
+        _seed(replica_app, None, 1, 'PRIMARY1')
+        router = replica_app.extensions['replica_router']
+        
+        def failing_probe(engine):
+            raise RuntimeError('replica unreachable')
+        router.lag_probe = failing_probe
+        
+        response = replica_client.get('/api/inspection/1', headers=replica_headers)
+        
+        assert json.loads(response.data)['inspection']['vehicle_number'] == 'PRIMARY1'
@@ -0,0 +1,94 @@
+import pytest
+from hypothesis import given, settings, strategies as st
+from marshmallow import ValidationError
+from app.inspections.schemas import (
+    InspectionCreateSchema,
+    InspectionUpdateSchema,
+    inspection_create_validator,
+    inspection_update_validator
+)
+
+create_schema = InspectionCreateSchema()
+update_schema = InspectionUpdateSchema()
+
+
+def outcome(schema, data):
+    """Loaded data or the validation messages, for comparing implementations"""
+    try:
+        return 'ok', schema.load(data)
+    except ValidationError as e:
+        return 'error', e.messages
+
+
+# Values around the validation boundaries plus arbitrary junk
+lengths = st.integers(min_value=0, max_value=1005)
+near_valid_text = st.builds(lambda char, size: char * size, st.sampled_from(['A', 'é', ' ', '1']), lengths)
+urls = st.builds(
+    lambda scheme, host, path, ext: f'{scheme}{host}{path}{ext}',
+    st.sampled_from(['https://', 'http://', 'HTTP://', 'ftp://', 'file://', 'javascript:', '//', '']),
+    st.sampled_from(['images.example.com', 'localhost', '127.0.0.1', '[::1]', 'example', 'bad_host.com',
+                     'user:pw@host.io:8080', '-bad.com', '']),
+    st.sampled_from(['', '/', '/img/photo', '/a b/photo', '?q=1', '#frag']),
+    st.sampled_from(['.jpg', '.JPEG', '.png', '.PnG', '.gif', '.jpg?size=large', ''])
+)
+values = st.one_of(
+    near_valid_text,
+    urls,
+    st.text(max_size=30),
+    st.binary(max_size=12),
+    st.none(),
+    st.integers(),
+    st.booleans(),
+    st.floats(allow_nan=False),
+    st.lists(st.text(max_size=5), max_size=2),
+    st.sampled_from(['pending', 'reviewed', 'completed', 'Reviewed', ' completed'])
+)
+
+
+def payloads(names):
+    keys = st.one_of(st.sampled_from(names), st.sampled_from(['extra', 'id', 'status', 'image']))
+    return st.one_of(
+        st.dictionaries(keys, values, max_size=5),
+        st.fixed_dictionaries({name: values for name in names}),
+        st.lists(values, max_size=2),
+        values
+    )
+
+
+class TestCompiledInspectionSchemas:
+    """Test class for the compiled validators against the marshmallow schemas"""
+
+    @settings(max_examples=1000, deadline=None)
+    @given(payloads(['vehicle_number', 'damage_report', 'image_url']))
+    def test_create_matches_marshmallow(self, data):
+        """Test the compiled create validator is equivalent on arbitrary payloads"""
+        assert outcome(inspection_create_validator, data) == outcome(create_schema, data)
+
+    @settings(max_examples=500, deadline=None)
+    @given(payloads(['status']))
+    def test_update_matches_marshmallow(self, data):
+        """Test the compiled update validator is equivalent on arbitrary payloads"""
+        assert outcome(inspection_update_validator, data) == outcome(update_schema, data)
+
+    @pytest.mark.parametrize('data', [
+        {'vehicle_number': 'KA01AB1234', 'damage_report': 'Front bumper damaged', 'image_url': 'https://x.io/a.JPG'},
+        {'vehicle_number': 'KA01AB1234', 'damage_report': 'Front bumper damaged', 'image_url': 'https://x.io/a.gif'},
+        {'vehicle_number': 'KA', 'damage_report': 'short', 'image_url': 'not-a-url', 'extra': 1},
+        {'vehicle_number': b'KA01\xff', 'damage_report': None},
+        {}
+    ])
+    def test_create_known_cases(self, data):
+        """Test representative valid and invalid create payloads"""
+        assert outcome(inspection_create_validator, data) == outcome(create_schema, data)
+
+    def test_create_error_messages(self):
+        """Test the compiled validator reports marshmallow's messages"""
+        with pytest.raises(ValidationError) as excinfo:
+            inspection_create_validator.load({'vehicle_number': 'KA', 'damage_report': 5, 'extra': 1})
+
+        assert excinfo.value.messages == {
+            'vehicle_number': ['Length must be between 5 and 20.'],
+            'damage_report': ['Not a valid string.'],
+            'image_url': ['Missing data for required field.'],
+            'extra': ['Unknown field.']
+        }
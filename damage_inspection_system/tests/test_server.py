@@ -0,0 +1,67 @@
+import os
+import runpy
+from app import create_app
+from app.core.server import after_fork
+from app.core.tracing import CollectorExporter
+from app.extensions import db
+
+GUNICORN_CONF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'gunicorn.conf.py')
+
+
+class TestAfterFork:
+    """Test class for resetting inherited state in forked workers."""
+    
+    def test_engine_pools_replaced(self, tmp_path):
+        """Test a worker gets fresh pools instead of the parent's connections."""
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'fork.db'}"})
+        with app.app_context():
+            with db.engine.connect() as connection:
+                connection.exec_driver_sql('SELECT 1')
+            inherited = db.engine.pool
+            assert inherited.checkedin() == 1
+        
+        after_fork(app)
+        
+        with app.app_context():
+            assert db.engine.pool is not inherited
+            assert db.engine.pool.checkedin() == 0
+            db.engine.dispose()
+    
+    def test_collector_thread_restarted(self):
+        """Test the trace sender thread is restarted with an empty queue."""
+        exporter = CollectorExporter('http://127.0.0.1:9/traces', max_queue=5)
+        inherited = exporter._thread
+        
+        exporter.after_fork()
+        
+        assert exporter._thread is not inherited
+        assert exporter._thread.is_alive()
+        assert exporter._queue.maxsize == 5
+
+
+class TestGunicornConfig:
+    """Test class for the gunicorn settings file."""
+    
+    def test_defaults(self, monkeypatch):
+        """Test the app is preloaded with sync workers by default."""
+        for name in ('GUNICORN_WORKER_CLASS', 'GUNICORN_PRELOAD', 'WEB_CONCURRENCY', 'GUNICORN_THREADS'):
+            monkeypatch.delenv(name, raising=False)
+        
+        settings = runpy.run_path(GUNICORN_CONF)
+        
+        assert settings['preload_app'] is True
+        assert settings['worker_class'] == 'sync'
+        assert settings['workers'] == os.cpu_count() * 2 + 1
+        assert callable(settings['post_fork'])
+    
+    def test_environment_overrides(self, monkeypatch):
+        """Test worker model and sizing come from the environment."""
+        monkeypatch.setenv('GUNICORN_WORKER_CLASS', 'gthread')
+        monkeypatch.setenv('WEB_CONCURRENCY', '3')
+        monkeypatch.setenv('GUNICORN_THREADS', '8')
+        monkeypatch.setenv('GUNICORN_PRELOAD', 'false')
+        
+        settings = runpy.run_path(GUNICORN_CONF)
+        
+        assert (settings['worker_class'], settings['workers'], settings['threads']) == ('gthread', 3, 8)
+        assert settings['preload_app'] is False
@@ -0,0 +1,227 @@
+import pytest
+import json
+from collections import Counter
+from flask_jwt_extended import create_access_token
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+from app.core.sharding import HashRing, ShardRouter, shard_tables
+from app.extensions import db
+from app.users.models import UserShard
+from app.inspections.models import Inspections, InspectionArchive, InspectionStatusEvent
+
+
+@pytest.fixture
+def shard_app(app_factory, tmp_path):
+    """Application with a directory database and three SQLite shard files."""
+    app = app_factory({
+        'SQLALCHEMY_SHARD_URIS': [f"sqlite:///{tmp_path / f'shard{index}.db'}" for index in range(3)],
+        'RATE_LIMIT_ENABLED': False
+    })
+    
+    with app.app_context():
+        app.extensions['shard_router'].create_all()
+    
+    return app
+
+
+@pytest.fixture
+def shard_client(shard_app):
+    return shard_app.test_client()
+
+
+def _signup(client, username):
+    response = client.post('/api/signup',
+                         data=json.dumps({'username': username, 'password': 'password123'}),
+                         content_type='application/json')
+    assert response.status_code == 201
+    return json.loads(response.data)['user']['id']
+
+
+def _headers(app, user_id):
+    with app.app_context():
+        return {'Authorization': f'Bearer {create_access_token(identity=user_id)}'}
+
+
+def _create_inspection(client, headers, vehicle_number):
+    response = client.post('/api/inspection',
+                         data=json.dumps({
+                             'vehicle_number': vehicle_number,
+                             'damage_report': 'Sharded inspection report',
+                             'image_url': 'https://example.com/shard.jpg'
+                         }),
+                         content_type='application/json',
+                         headers=headers)
+    assert response.status_code == 201
+    return json.loads(response.data)['inspection']['id']
+
+
+def _count(app, shard_key, user_id, model=Inspections):
+    with app.app_context(), db.engines[shard_key].connect() as connection:
+        column = model.inspected_by if model is Inspections else model.changed_by
+        return connection.execute(select(func.count()).where(column == user_id)).scalar()
+
+
+class TestHashRing:
+    """Test class for the consistent-hash ring."""
+    
+    def test_placement_is_deterministic(self):
+        """Test that two rings with the same nodes agree."""
+        first = HashRing(['shard_0', 'shard_1', 'shard_2'])
+        second = HashRing(['shard_2', 'shard_1', 'shard_0'])
+        
+        assert all(first.get_node(key) == second.get_node(key) for key in range(1000))
+    
+    def test_keys_spread_over_nodes(self):
+        """Test that every node receives a reasonable share of keys."""
+        ring = HashRing(['shard_0', 'shard_1', 'shard_2'])
+        
+        counts = Counter(ring.get_node(key) for key in range(3000))
+        
+        assert set(counts) == {'shard_0', 'shard_1', 'shard_2'}
+        assert min(counts.values()) > 600
+    
+    def test_adding_node_moves_few_keys(self):
+        """Test that adding a node only moves keys onto the new node."""
+        before = HashRing(['shard_0', 'shard_1', 'shard_2'])
+        after = HashRing(['shard_0', 'shard_1', 'shard_2', 'shard_3'])
+        
+        moved = [key for key in range(3000) if before.get_node(key) != after.get_node(key)]
+        
+        assert all(after.get_node(key) == 'shard_3' for key in moved)
+        assert len(moved) < 3000 * 0.4
+
+
+class TestShardRouting:
+    """Test class for routing inspections to user shards."""
+    
+    def test_signup_pins_user_to_ring_shard(self, shard_app, shard_client):
+        """Test that registration records the ring placement in the directory."""
+        user_id = _signup(shard_client, 'sharduser')
+        
+        with shard_app.app_context():
+            router = shard_app.extensions['shard_router']
+            assert db.session.get(UserShard, user_id).shard_key == router.placement(user_id)
+    
+    def test_inspections_stored_on_user_shard(self, shard_app, shard_client):
+        """Test that each user's inspections live only on their shard."""
+        router = shard_app.extensions['shard_router']
+        users = [_signup(shard_client, f'sharduser{index}') for index in range(6)]
+        for user_id in users:
+            headers = _headers(shard_app, user_id)
+            _create_inspection(shard_client, headers, f'SHARD{user_id:03d}')
+            
+            response = shard_client.get('/api/inspection', headers=headers)
+            response_data = json.loads(response.data)
+            assert response_data['count'] == 1
+            assert response_data['inspections'][0]['inspector_username'] == f'sharduser{users.index(user_id)}'
+        
+        for user_id in users:
+            home = router.placement(user_id)
+            for shard_key in router.bind_keys:
+                assert _count(shard_app, shard_key, user_id) == (1 if shard_key == home else 0)
+                assert _count(shard_app, shard_key, user_id, InspectionStatusEvent) == (1 if shard_key == home else 0)
+    
+    def test_move_user_between_shards(self, shard_app, shard_client):
+        """Test that moving a user copies rows, repoints reads and cleans up."""
+        router = shard_app.extensions['shard_router']
+        user_id = _signup(shard_client, 'movinguser')
+        headers = _headers(shard_app, user_id)
+        inspection_id = _create_inspection(shard_client, headers, 'MOVE12345')
+        source = router.placement(user_id)
+        target = next(key for key in router.bind_keys if key != source)
+        
+        with shard_app.app_context():
+            assert router.move_user(user_id, target) == 1
+            assert db.session.get(UserShard, user_id).shard_key == target
+        
+        assert _count(shard_app, source, user_id) == 0
+        assert _count(shard_app, target, user_id) == 1
+        assert _count(shard_app, target, user_id, InspectionStatusEvent) == 1
+        response = shard_client.get(f'/api/inspection/{inspection_id}', headers=headers)
+        assert response.status_code == 200
+        response = shard_client.get(f'/api/inspection/{inspection_id}/timeline', headers=headers)
+        assert len(json.loads(response.data)['events']) == 1
+    
+    def test_move_onto_shard_with_rows(self, shard_app, shard_client):
+        """Test that moved inspections get fresh ids next to the target's own rows."""
+        router = shard_app.extensions['shard_router']
+        users = {}
+        index = 0
+        while len(users) < 2:
+            user_id = _signup(shard_client, f'collide{index}')
+            users.setdefault(router.placement(user_id), user_id)
+            index += 1
+        (first_shard, first_user), (second_shard, second_user) = list(users.items())
+        first_headers = _headers(shard_app, first_user)
+        second_headers = _headers(shard_app, second_user)
+        _create_inspection(shard_client, first_headers, 'COLLIDE01')
+        archived_id = _create_inspection(shard_client, first_headers, 'COLLIDE02')
+        resident_id = _create_inspection(shard_client, second_headers, 'COLLIDE03')
+        with shard_app.app_context(), db.engines[first_shard].begin() as connection:
+            row = connection.execute(select(Inspections.__table__).where(Inspections.id == archived_id)).mappings().one()
+            connection.execute(insert(InspectionArchive.__table__), [dict(row)])
+            connection.execute(delete(Inspections.__table__).where(Inspections.id == archived_id))
+        
+        with shard_app.app_context():
+            assert router.move_user(first_user, second_shard) == 2
+        
+        with shard_app.app_context(), db.engines[second_shard].connect() as connection:
+            live_ids = connection.execute(select(Inspections.id)).scalars().all()
+            archive_ids = connection.execute(select(InspectionArchive.id)).scalars().all()
+            moved_ids = connection.execute(union_all(
+                select(Inspections.id).where(Inspections.inspected_by == first_user),
+                select(InspectionArchive.id).where(InspectionArchive.inspected_by == first_user)
+            )).scalars().all()
+        assert len(set(live_ids) | set(archive_ids)) == len(live_ids) + len(archive_ids) == 3
+        assert resident_id in live_ids
+        assert _count(shard_app, first_shard, first_user) == 0
+        assert _count(shard_app, second_shard, first_user, InspectionStatusEvent) == 2
+        for inspection_id in moved_ids:
+            response = shard_client.get(f'/api/inspection/{inspection_id}', headers=first_headers)
+            assert response.status_code == 200
+            response = shard_client.get(f'/api/inspection/{inspection_id}/timeline', headers=first_headers)
+            assert len(json.loads(response.data)['events']) == 1
+        response = shard_client.get(f'/api/inspection/{resident_id}', headers=second_headers)
+        assert json.loads(response.data)['inspection']['vehicle_number'] == 'COLLIDE03'
+        
+        # Ids drawn for the archived copy are never handed out again
+        new_id = _create_inspection(shard_client, second_headers, 'COLLIDE04')
+        assert new_id > max(moved_ids)
+    
+    def test_rebalance_after_adding_shard(self, shard_app, shard_client):
+        """Test that rebalancing moves exactly the users the new ring relocates."""
+        users = [_signup(shard_client, f'rebalance{index}') for index in range(12)]
+        
+        with shard_app.app_context():
+            smaller = ShardRouter(['shard_0', 'shard_1'])
+            for assignment in db.session.execute(select(UserShard)).scalars():
+                assignment.shard_key = smaller.placement(assignment.user_id)
+            db.session.commit()
+            
+            router = shard_app.extensions['shard_router']
+            router._assignments.clear()
+            planned = router.rebalance(dry_run=True)
+            
+            assert planned == [
+                (user_id, smaller.placement(user_id), 'shard_2')
+                for user_id in users if router.placement(user_id) != smaller.placement(user_id)
+            ]
+            assert planned
+            
+            router.rebalance()
+            assert router.plan_rebalance() == []
+
+
+class TestShardSchema:
+    def test_shard_ddl_has_no_users_foreign_keys(self):
+        ddl = '\n'.join(str(CreateTable(table).compile(dialect=mysql.dialect())) for table in shard_tables())
+        
+        assert 'REFERENCES users' not in ddl
+        assert 'inspected_by' in ddl
+        assert 'changed_by' in ddl
+    
+    def test_default_tables_keep_users_foreign_keys(self):
+        ddl = str(CreateTable(Inspections.__table__).compile(dialect=mysql.dialect()))
+        
+        assert 'REFERENCES users (id)' in ddl
@@ -0,0 +1,110 @@
+import pytest
+import json
+import logging
+from sqlalchemy import create_engine, text
+from app.core.slow_queries import SlowQueryLog
+
+
+class TestSlowQueryLog:
+    """Test class for the slow query ring buffer."""
+    
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine('sqlite://')
+        with engine.begin() as connection:
+            connection.execute(text('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)'))
+            connection.execute(text('CREATE INDEX ix_items_name ON items (name)'))
+        yield engine
+        engine.dispose()
+    
+    def test_records_statement_parameters_and_plan(self, engine):
+        """Test slow statements are recorded with parameters and EXPLAIN output."""
+        slow_query_log = SlowQueryLog(threshold=0, explain=True, parameters=True,
+                                      log=logging.getLogger('test_slow_queries'))
+        slow_query_log.attach(engine)
+        
+        with engine.connect() as connection:
+            connection.execute(text('SELECT id FROM items WHERE name = :name'), {'name': 'bumper'})
+        
+        entry = slow_query_log.entries()[0]
+        assert entry['sql'] == 'SELECT id FROM items WHERE name = ?'
+        assert entry['parameters'] == ['bumper']
+        assert entry['bind'] == 'default'
+        assert entry['endpoint'] is None
+        assert 'ix_items_name' in json.dumps(entry['explain'])
+    
+    def test_parameters_dropped_by_default(self, engine):
+        """Test bound parameters are not recorded unless enabled."""
+        slow_query_log = SlowQueryLog(threshold=0, log=logging.getLogger('test_slow_queries'))
+        slow_query_log.attach(engine)
+        
+        with engine.connect() as connection:
+            connection.execute(text('SELECT id FROM items WHERE name = :name'), {'name': 'secret'})
+        
+        entry = slow_query_log.entries()[0]
+        assert entry['parameters'] is None
+        assert 'secret' not in json.dumps(entry)
+    
+    def test_threshold_and_ring_buffer(self, engine):
+        """Test fast statements are skipped and only the newest entries are kept."""
+        slow_query_log = SlowQueryLog(threshold=60, capacity=3, log=logging.getLogger('test_slow_queries'))
+        slow_query_log.attach(engine)
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+        assert slow_query_log.entries() == []
+        
+        slow_query_log.threshold = 0
+        with engine.connect() as connection:
+            for value in range(5):
+                connection.execute(text(f'SELECT {value}'))
+        
+        assert [entry['sql'] for entry in slow_query_log.entries()] == ['SELECT 4', 'SELECT 3', 'SELECT 2']
+        assert len(slow_query_log.entries(limit=1)) == 1
+
+
+class TestSlowQueryEndpoint:
+    """Test class for the admin slow query endpoint."""
+    
+    @pytest.fixture
+    def slow_query_log(self, app, monkeypatch):
+        slow_query_log = app.extensions['slow_query_log']
+        monkeypatch.setattr(slow_query_log, 'threshold', 0)
+        monkeypatch.setattr(slow_query_log, 'log', logging.getLogger('test_slow_queries'))
+        monkeypatch.setitem(app.config, 'ADMIN_USERNAMES', ['testuser'])
+        slow_query_log.clear()
+        yield slow_query_log
+        slow_query_log.clear()
+    
+    def test_admin_sees_calling_endpoint(self, client, db_session, auth_headers, slow_query_log):
+        """Test recorded queries carry the endpoint that issued them."""
+        client.get('/api/inspection', headers=auth_headers)
+        
+        response = client.get('/api/admin/slow-queries', headers=auth_headers)
+        
+        assert response.status_code == 200
+        response_data = json.loads(response.data)
+        assert response_data['threshold_ms'] == 0
+        listing = [entry for entry in response_data['slow_queries'] if 'FROM inspections' in entry['sql']]
+        assert listing[0]['endpoint'] == 'inspections.get_inspections'
+        assert listing[0]['request'] == 'GET /api/inspection'
+    
+    def test_clear_slow_queries(self, client, db_session, auth_headers, slow_query_log):
+        """Test DELETE empties the buffer."""
+        client.get('/api/inspection', headers=auth_headers)
+        
+        response = client.delete('/api/admin/slow-queries', headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert slow_query_log.entries() == []
+    
+    def test_non_admin_forbidden(self, client, db_session, another_auth_headers, slow_query_log):
+        """Test users not in ADMIN_USERNAMES get 403."""
+        response = client.get('/api/admin/slow-queries', headers=another_auth_headers)
+        
+        assert response.status_code == 403
+    
+    def test_requires_auth(self, client, db_session, slow_query_log):
+        """Test the endpoint requires a token."""
+        response = client.get('/api/admin/slow-queries')
+        
+        assert response.status_code == 401
@@ -0,0 +1,75 @@
+import click
+import subprocess
+import sys
+from flask import Blueprint, Flask
+from app.core.cli import LazyAppGroup, init_cli
+
+LAZY_MODULES = ('flask_migrate', 'alembic', 'app.core.commands', 'app.inspections.commands', 'app.core.datagen')
+
+
+class TestStartup:
+    """Test class for application start-up work."""
+    
+    def test_create_app_skips_cli_only_imports(self, tmp_path):
+        """Test creating the app does not import the CLI command modules or alembic."""
+        code = (
+            'import sys\n'
+            'from app import create_app\n'
+            f"create_app({{'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'LOG_FILE': {str(tmp_path / 'app.log')!r}}})\n"
+            f'print(sorted(name for name in {LAZY_MODULES!r} if name in sys.modules))\n'
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == '[]'
+    
+    def test_cli_lists_lazy_commands(self, app):
+        """Test the lazy command groups are listed and load on use."""
+        result = app.test_cli_runner().invoke(args=['--help'])
+        
+        assert result.exit_code == 0
+        for name in ('data', 'db', 'inspections', 'shards'):
+            assert name in result.output
+        
+        result = app.test_cli_runner().invoke(args=['db', '--help'])
+        
+        assert result.exit_code == 0
+        assert 'upgrade' in result.output
+        assert app.extensions['migrate'].db is not None
+    
+    def test_loader_runs_once(self):
+        """Test a lazy command's loader is called on first lookup only."""
+        calls = []
+        
+        @click.command('hello')
+        def hello():
+            click.echo('hi')
+        
+        group = LazyAppGroup()
+        group.add_lazy_command('hello', lambda: calls.append(1) or hello)
+        
+        assert group.list_commands(None) == ['hello']
+        assert group.get_command(None, 'hello') is hello
+        assert group.get_command(None, 'hello') is hello
+        assert calls == [1]
+        assert group.get_command(None, 'missing') is None
+    
+    def test_existing_commands_kept(self):
+        """Test commands registered before init_cli, like blueprint commands, stay available."""
+        app = Flask('cli_app')
+        bp = Blueprint('reports', __name__)
+        
+        @bp.cli.command('export')
+        def export():
+            click.echo('exported')
+        
+        @app.cli.command('hello')
+        def hello():
+            click.echo('hi')
+        
+        app.register_blueprint(bp)
+        init_cli(app)
+        
+        assert isinstance(app.cli, LazyAppGroup)
+        assert app.test_cli_runner().invoke(args=['reports', 'export']).output == 'exported\n'
+        assert app.test_cli_runner().invoke(args=['hello']).output == 'hi\n'
+        assert 'shards' in app.test_cli_runner().invoke(args=['--help']).output
@@ -0,0 +1,154 @@
+import pytest
+from datetime import datetime, timedelta
+from app.auth.models import RevokedToken
+from app.auth.revocation import BloomFilter, TokenRevocationList
+
+
+@pytest.fixture
+def revocation(app, monkeypatch, clock):
+    revocation = TokenRevocationList(capacity=1000, clock=clock)
+    monkeypatch.setitem(app.extensions, 'token_revocation', revocation)
+    return revocation
+
+
+def login(client):
+    response = client.post('/api/login', json={'username': 'testuser', 'password': 'testpassword123'})
+    return response.get_json()
+
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+class TestBloomFilter:
+    """Test class for the bloom filter."""
+    
+    def test_no_false_negatives(self):
+        """Test every added item is reported present."""
+        bloom = BloomFilter(1000)
+        items = [f'jti-{index}' for index in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+    
+    def test_false_positive_rate(self):
+        """Test the false positive rate stays near the configured rate at capacity."""
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f'jti-{index}')
+        
+        false_positives = sum(f'other-{index}' in bloom for index in range(10000))
+        
+        assert false_positives < 300
+        assert bloom.size == 9585
+        assert bloom.hashes == 7
+
+
+class TestTokenRevocation:
+    """Test class for refresh tokens, logout and the revocation list."""
+    
+    def test_login_returns_refresh_token(self, client, db_session, sample_user):
+        """Test login issues an access and a refresh token."""
+        tokens = login(client)
+        
+        assert tokens['access_token'] != tokens['refresh_token']
+        
+        response = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        assert response.status_code == 200
+        assert client.get('/api/profile', headers=bearer(response.get_json()['access_token'])).status_code == 200
+    
+    def test_refresh_rotates_refresh_token(self, client, db_session, sample_user, revocation):
+        """Test refreshing returns a new refresh token and revokes the presented one."""
+        tokens = login(client)
+        
+        response = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        
+        assert response.status_code == 200
+        rotated = response.get_json()['refresh_token']
+        assert rotated != tokens['refresh_token']
+        assert client.post('/api/refresh', headers=bearer(tokens['refresh_token'])).status_code == 401
+        assert client.post('/api/refresh', headers=bearer(rotated)).status_code == 200
+    
+    def test_refresh_of_deleted_user(self, client, db_session, sample_user, revocation):
+        """Test a refresh token of a user that no longer exists gets 401."""
+        tokens = login(client)
+        db_session.delete(sample_user)
+        db_session.commit()
+        
+        response = client.post('/api/refresh', headers=bearer(tokens['refresh_token']))
+        
+        assert response.status_code == 401
+        assert db_session.query(RevokedToken).count() == 0
+    
+    def test_refresh_requires_refresh_token(self, client, db_session, sample_user):
+        """Test an access token cannot be used to refresh."""
+        tokens = login(client)
+        
+        response = client.post('/api/refresh', headers=bearer(tokens['access_token']))
+        
+        assert response.status_code == 422
+    
+    def test_logout_revokes_tokens(self, client, db_session, sample_user, revocation):
+        """Test logout revokes the access token and the refresh token from the body."""
+        tokens = login(client)
+        
+        response = client.post('/api/logout', headers=bearer(tokens['access_token']),
+                               json={'refresh_token': tokens['refresh_token']})
+        
+        assert response.status_code == 200
+        assert db_session.query(RevokedToken).count() == 2
+        assert client.get('/api/profile', headers=bearer(tokens['access_token'])).status_code == 401
+        assert client.post('/api/refresh', headers=bearer(tokens['refresh_token'])).status_code == 401
+    
+    def test_logout_rejects_foreign_refresh_token(self, client, db_session, sample_user, another_user, revocation):
+        """Test a refresh token of another user is not accepted."""
+        tokens = login(client)
+        other = client.post('/api/login', json={'username': 'anotheruser', 'password': 'anotherpassword123'})
+        
+        response = client.post('/api/logout', headers=bearer(tokens['access_token']),
+                               json={'refresh_token': other.get_json()['refresh_token']})
+        
+        assert response.status_code == 400
+        assert db_session.query(RevokedToken).count() == 0
+    
+    def test_valid_token_checked_without_query(self, app, db_session, revocation, query_recorder):
+        """Test tokens missing from the filter are accepted without a database query."""
+        revocation.is_revoked('warm-up')
+        queries = len(query_recorder.queries)
+        
+        assert revocation.is_revoked('not-revoked') is False
+        assert len(query_recorder.queries) == queries
+    
+    def test_false_positive_confirmed_in_table(self, app, db_session, revocation):
+        """Test a filter hit without a table row is not treated as revoked."""
+        revocation.is_revoked('warm-up')
+        revocation._bloom.add('rolled-back')
+        
+        assert revocation.is_revoked('rolled-back') is False
+    
+    def test_sync_picks_up_other_workers(self, app, db_session, sample_user, revocation):
+        """Test tokens revoked by another worker are seen after the sync interval."""
+        revocation.is_revoked('warm-up')
+        db_session.add(RevokedToken(jti='elsewhere', token_type='access', user_id=sample_user.id,
+                                    expires_at=datetime.utcnow() + timedelta(minutes=5)))
+        db_session.commit()
+        
+        assert revocation.is_revoked('elsewhere') is False
+        revocation.clock.now = 5
+        assert revocation.is_revoked('elsewhere') is True
+    
+    def test_expired_rows_pruned(self, app, db_session, sample_user, revocation):
+        """Test the rebuild deletes rows of tokens that have expired."""
+        db_session.add_all([
+            RevokedToken(jti='expired', token_type='access', user_id=sample_user.id,
+                         expires_at=datetime.utcnow() - timedelta(minutes=1)),
+            RevokedToken(jti='live', token_type='refresh', user_id=sample_user.id,
+                         expires_at=datetime.utcnow() + timedelta(days=1))
+        ])
+        db_session.commit()
+        
+        assert revocation.is_revoked('live') is True
+        assert 'expired' not in revocation._bloom
+        assert [row.jti for row in db_session.query(RevokedToken)] == ['live']
@@ -0,0 +1,123 @@
+import pytest
+import json
+import logging
+from flask import g
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app.extensions import db
+from app.core.tracing import RequestIdFilter, Tracer, span
+
+
+def span_names(node):
+    """Names of a trace tree in depth-first order"""
+    names = [node['name']]
+    for child in node.get('children', []):
+        names.extend(span_names(child))
+    return names
+
+
+@pytest.fixture
+def traced_app(app_factory, tmp_path):
+    """App exporting traces to a JSON lines file."""
+    return app_factory({
+        'TRACING_ENABLED': True,
+        'TRACING_FILE': str(tmp_path / 'traces.jsonl')
+    })
+
+
+def read_traces(app):
+    with open(app.config['TRACING_FILE']) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestRequestId:
+    """Test class for request ID propagation."""
+    
+    def test_request_id_generated(self, client):
+        """Test every response carries a generated request ID."""
+        first = client.get('/api/test').headers['X-Request-ID']
+        second = client.get('/api/test').headers['X-Request-ID']
+        
+        assert len(first) == 32
+        assert first != second
+    
+    def test_incoming_request_id_propagated(self, client):
+        """Test a well-formed incoming ID is reused and a malformed one replaced."""
+        assert client.get('/api/test', headers={'X-Request-ID': 'lb-1234.abc'}).headers['X-Request-ID'] == 'lb-1234.abc'
+        assert client.get('/api/test', headers={'X-Request-ID': 'bad id; drop'}).headers['X-Request-ID'] != 'bad id; drop'
+    
+    def test_log_records_carry_request_id(self, app):
+        """Test the logging filter stamps records with the current request ID."""
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'message', None, None)
+        with app.test_request_context('/api/test', headers={'X-Request-ID': 'req-42'}):
+            app.preprocess_request()
+            RequestIdFilter().filter(record)
+        assert record.request_id == 'req-42'
+        
+        RequestIdFilter().filter(record)
+        assert record.request_id == '-'
+
+
+class TestSpans:
+    """Test class for the span API and trace export."""
+    
+    def test_span_is_noop_without_trace(self, app):
+        """Test spans outside a traced request do nothing."""
+        with app.app_context():
+            with span('validation') as validation:
+                validation.set(rows=1)
+        with span('outside'):
+            pass
+    
+    def test_nested_spans_form_tree(self):
+        """Test spans nest under the innermost open span."""
+        tracer = Tracer('request')
+        with tracer.start('db', {}):
+            with tracer.start('sql', {'statement': 'SELECT 1'}):
+                pass
+        with tracer.start('serialization', {}):
+            pass
+        tracer.finish(tracer.root)
+        
+        trace = tracer.to_dict()
+        assert span_names(trace) == ['request', 'db', 'sql', 'serialization']
+        assert trace['children'][0]['children'][0]['attrs'] == {'statement': 'SELECT 1'}
+        assert trace['duration_ms'] >= trace['children'][0]['duration_ms']
+    
+    def test_failed_statement_closes_span(self, traced_app):
+        """Test a failing statement ends its span as errored and pops it."""
+        with traced_app.app_context():
+            tracer = g._tracer = Tracer('request')
+            with db.engine.connect() as conn:
+                with pytest.raises(OperationalError):
+                    conn.execute(text('SELECT * FROM missing_table'))
+                assert conn.info['trace_spans'] == []
+            
+            assert tracer._stack == [tracer.root]
+            failed = tracer.to_dict()['children'][0]
+            assert failed['name'] == 'sql'
+            assert failed['attrs']['error'] == 'OperationalError'
+    
+    def test_request_trace_exported(self, traced_app):
+        """Test a signup and an inspection create are exported with their phases."""
+        client = traced_app.test_client()
+        client.post('/api/signup', json={'username': 'tracer', 'password': 'password123'},
+                    headers={'X-Request-ID': 'trace-signup'})
+        token = client.post('/api/login', json={'username': 'tracer', 'password': 'password123'}).get_json()['access_token']
+        client.post('/api/inspection', headers={'Authorization': f'Bearer {token}'}, json={
+            'vehicle_number': 'TRACE123',
+            'damage_report': 'Traced damage report text',
+            'image_url': 'https://example.com/trace.jpg'
+        })
+        
+        signup, login, create = read_traces(traced_app)
+        assert signup['request_id'] == 'trace-signup'
+        assert signup['endpoint'] == 'auth.signup'
+        assert signup['attrs'] == {'method': 'POST', 'path': '/api/signup', 'status': 201}
+        assert {'validation', 'password_hash', 'db', 'sql', 'serialization'} <= set(span_names(signup))
+        assert 'password_check' in span_names(login)
+        
+        names = span_names(create)
+        assert names.index('validation') < names.index('db') < names.index('to_dict') < names.index('serialization')
+        db_span = next(child for child in create['children'] if child['name'] == 'db')
+        assert any(sql['attrs']['statement'].startswith('INSERT INTO inspections') for sql in db_span['children'])
@@ -0,0 +1,202 @@
+import pytest
+import hashlib
+import io
+import json
+import os
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+from app.core.storage import LocalFileStorage, Storage, UploadError
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00\x00\x00\rIHDR' + bytes(range(256)) * 4
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00\x10JFIF' + bytes(range(256)) * 4
+
+
+class TrickleStream(io.BytesIO):
+    """Stream returning at most ``limit`` bytes per read, like a slow socket."""
+    
+    def __init__(self, data, limit):
+        super().__init__(data)
+        self.limit = limit
+        self.reads = []
+    
+    def read(self, size=-1):
+        chunk = super().read(min(size, self.limit))
+        self.reads.append(len(chunk))
+        return chunk
+
+
+@pytest.fixture
+def storage(app, tmp_path, monkeypatch):
+    storage = LocalFileStorage(tmp_path / 'uploads', chunk_size=256)
+    monkeypatch.setitem(app.extensions, 'upload_storage', storage)
+    return storage
+
+
+def upload(client, headers, data):
+    return client.post('/api/uploads', headers=headers, data=data, content_type='application/octet-stream')
+
+
+def upload_without_length(app, headers, data, **environ):
+    """Upload with no Content-Length header, as a chunked request arrives.
+    
+    The test client always sets Content-Length, so the app is called directly.
+    Returns the status code and the JSON body.
+    """
+    request_environ = EnvironBuilder('/api/uploads', method='POST', headers=headers, input_stream=io.BytesIO(data),
+                                     content_type='application/octet-stream').get_environ()
+    del request_environ['CONTENT_LENGTH']
+    request_environ.update(environ)
+    app_iter, status, _ = run_wsgi_app(app, request_environ)
+    return int(status.split()[0]), json.loads(b''.join(app_iter))
+
+
+class TestLocalFileStorage:
+    """Test class for the content-addressed file store."""
+    
+    def test_save_streams_in_chunks(self, storage):
+        """Test the file is hashed and written chunk by chunk under its digest."""
+        stream = TrickleStream(PNG, 5)
+        
+        stored = storage.save(stream, max_bytes=10000)
+        
+        digest = hashlib.sha256(PNG).hexdigest()
+        assert stored == (f'{digest}.png', digest, len(PNG), True)
+        assert max(stream.reads) <= 256
+        with open(storage.path(stored.name), 'rb') as f:
+            assert f.read() == PNG
+        assert os.listdir(os.path.join(storage.root, '.tmp')) == []
+    
+    def test_identical_images_deduplicated(self, storage):
+        """Test storing the same bytes again keeps the one existing file."""
+        first = storage.save(io.BytesIO(JPEG), max_bytes=10000)
+        second = storage.save(io.BytesIO(JPEG), max_bytes=10000)
+        
+        assert first.name == second.name
+        assert first.name.endswith('.jpg')
+        assert second.created is False
+        assert os.listdir(os.path.join(storage.root, first.name[:2])) == [first.name]
+    
+    def test_rejects_other_types(self, storage):
+        """Test files without a JPEG or PNG signature are rejected."""
+        with pytest.raises(UploadError) as error:
+            storage.save(io.BytesIO(b'GIF89a' + bytes(100)), max_bytes=10000)
+        
+        assert error.value.status == 415
+    
+    def test_rejects_oversized_stream(self, storage):
+        """Test a stream over the limit is cut off and leaves no file behind."""
+        with pytest.raises(UploadError) as error:
+            storage.save(io.BytesIO(PNG), max_bytes=512)
+        
+        assert error.value.status == 413
+        assert os.listdir(os.path.join(storage.root, '.tmp')) == []
+    
+    def test_storage_interface_is_abstract(self):
+        """Test a backend must implement both save and path."""
+        class PartialStorage(Storage):
+            def save(self, stream, max_bytes):
+                return None
+        
+        with pytest.raises(TypeError):
+            PartialStorage()
+    
+    @pytest.mark.parametrize('name', ['../secret.png', 'abc.png', f"{'a' * 64}.gif"])
+    def test_path_rejects_foreign_names(self, storage, name):
+        """Test only digest names resolve to files."""
+        assert storage.path(name) is None
+
+
+class TestUploadRoutes:
+    """Test class for the upload endpoints."""
+    
+    def test_upload_and_create_inspection(self, client, db_session, auth_headers, storage):
+        """Test the returned URL is served and accepted as an inspection image_url."""
+        response = upload(client, auth_headers, PNG)
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['deduplicated'] is False
+        assert data['image_url'] == f"http://localhost/api/uploads/{data['sha256']}.png"
+        
+        served = client.get(data['image_url'])
+        assert served.status_code == 200
+        assert served.data == PNG
+        assert served.mimetype == 'image/png'
+        assert 'immutable' in served.headers['Cache-Control']
+        assert client.get(data['image_url'], headers={'If-None-Match': f'"{data["sha256"]}"'}).status_code == 304
+        
+        created = client.post('/api/inspection', headers=auth_headers, json={
+            'vehicle_number': 'KA01AB1234',
+            'damage_report': 'Dent on the rear left door',
+            'image_url': data['image_url']
+        })
+        assert created.status_code == 201
+    
+    def test_duplicate_upload(self, client, db_session, auth_headers, storage):
+        """Test uploading the same image again returns the same URL with 200."""
+        first = upload(client, auth_headers, JPEG).get_json()
+        
+        response = upload(client, auth_headers, JPEG)
+        
+        assert response.status_code == 200
+        assert response.get_json()['image_url'] == first['image_url']
+        assert response.get_json()['deduplicated'] is True
+    
+    def test_upload_base_url(self, client, db_session, auth_headers, storage, app, monkeypatch):
+        """Test UPLOAD_BASE_URL replaces the API URL of new images."""
+        monkeypatch.setitem(app.config, 'UPLOAD_BASE_URL', 'https://cdn.example.com/inspections/')
+        
+        data = upload(client, auth_headers, JPEG).get_json()
+        
+        assert data['image_url'] == f"https://cdn.example.com/inspections/{data['sha256']}.jpg"
+    
+    def test_upload_too_large(self, client, db_session, auth_headers, storage, app, monkeypatch):
+        """Test a declared Content-Length over the limit is refused before reading."""
+        monkeypatch.setitem(app.config, 'UPLOAD_MAX_BYTES', 100)
+        
+        response = upload(client, auth_headers, PNG)
+        
+        assert response.status_code == 413
+        assert not os.path.exists(storage.root)
+    
+    def test_upload_requires_content_length(self, app, db_session, auth_headers, storage):
+        """Test a body without Content-Length is refused with 411 instead of read as empty."""
+        status_code, data = upload_without_length(app, auth_headers, PNG)
+        
+        assert status_code == 411
+        assert data == {'error': 'Content-Length required'}
+        assert not os.path.exists(storage.root)
+    
+    def test_upload_terminated_input_without_length(self, app, db_session, auth_headers, storage):
+        """Test chunked bodies are read when the server terminates the input."""
+        status_code, data = upload_without_length(app, auth_headers, PNG, **{'wsgi.input_terminated': True})
+        
+        assert status_code == 201
+        assert data['size'] == len(PNG)
+    
+    def test_upload_not_an_image(self, client, db_session, auth_headers, storage):
+        """Test non-image bodies are rejected with 415."""
+        response = upload(client, auth_headers, b'<html></html>')
+        
+        assert response.status_code == 415
+        assert response.get_json() == {'error': 'Only JPEG and PNG images are accepted'}
+    
+    def test_upload_requires_auth(self, client, db_session, storage):
+        """Test uploads need a JWT or an API key."""
+        response = upload(client, {}, PNG)
+        
+        assert response.status_code == 401
+    
+    def test_unknown_image(self, client, storage):
+        """Test unknown names are 404."""
+        response = client.get(f"/api/uploads/{'0' * 64}.png")
+        
+        assert response.status_code == 404
+    
+    def test_relative_upload_dir_under_instance_folder(self, app_factory, tmp_path):
+        """Test a relative UPLOAD_DIR is resolved against the instance folder, not the working directory."""
+        relative = app_factory({'UPLOAD_DIR': 'uploads'})
+        absolute = app_factory({'UPLOAD_DIR': str(tmp_path / 'images')})
+        
+        assert relative.config['UPLOAD_DIR'] == os.path.join(relative.instance_path, 'uploads')
+        assert relative.extensions['upload_storage'].root == os.path.join(relative.instance_path, 'uploads')
+        assert absolute.config['UPLOAD_DIR'] == str(tmp_path / 'images')